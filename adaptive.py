@@ -0,0 +1,116 @@
+"""
+adaptive.py
+Control adaptativo de operadores y detección de estancamiento del algoritmo genético.
+
+AdaptiveOperators ajusta cada generación la escala de la mutación (sigma como
+fracción del rango de cada gen) con la regla de 1/5 de éxito, y la probabilidad
+de cruce según si los hijos cruzados superan a sus padres más seguido que los
+que sólo se copiaron. StagnationMonitor avisa cuando ni el mejor fitness ni el
+medio mejoran durante 'paciencia' generaciones.
+"""
+
+
+class AdaptiveOperators:
+    """Probabilidad de cruce y escala de mutación que se ajustan con el éxito de cada operador."""
+
+    def __init__(self, escala_sigma=0.1, prob_cruce=0.8, factor=0.82, objetivo=0.2, paso_cruce=0.05,
+                 minimo_intentos=20, limites_sigma=(0.01, 0.5), limites_cruce=(0.3, 0.95)):
+        self.escala_inicial = self.escala_sigma = escala_sigma
+        self.prob_cruce_inicial = self.prob_cruce = prob_cruce
+        self.factor = factor          # la escala se multiplica o divide por este factor
+        self.objetivo = objetivo      # tasa de éxito de la mutación buscada (1/5)
+        self.paso_cruce = paso_cruce
+        self.limites_sigma = limites_sigma
+        self.limites_cruce = limites_cruce
+        self.minimo_intentos = minimo_intentos
+        self._limpiar_conteos()
+
+    def actualizar(self, origenes, fitness):
+        """
+        'origenes' tiene por hijo (cruzado, mutado, fitness de referencia) y 'fitness'
+        el fitness de cada hijo. Un hijo tiene éxito si supera la referencia. Los conteos se
+        acumulan entre generaciones hasta tener 'minimo_intentos' mutaciones, así una
+        población chica no decide con media docena de hijos.
+        """
+        for (cruzado, mutado, referencia), valor in zip(origenes, fitness):
+            exito = valor > referencia
+            if mutado:
+                self._mutados += 1
+                self._exitos_mutacion += exito
+            if cruzado:
+                self._cruzados += 1
+                self._exitos_cruce += exito
+            else:
+                self._copias += 1
+                self._exitos_copia += exito
+        if self._mutados < self.minimo_intentos:
+            return
+
+        # Regla de 1/5: muchos éxitos -> pasos más largos; pocos -> más cortos
+        tasa = self._exitos_mutacion / self._mutados
+        if tasa > self.objetivo:
+            self.escala_sigma /= self.factor
+        elif tasa < self.objetivo:
+            self.escala_sigma *= self.factor
+        minimo, maximo = self.limites_sigma
+        self.escala_sigma = min(maximo, max(minimo, self.escala_sigma))
+
+        if self._cruzados and self._copias:
+            diferencia = self._exitos_cruce / self._cruzados - self._exitos_copia / self._copias
+            if diferencia:
+                self.prob_cruce += self.paso_cruce if diferencia > 0 else -self.paso_cruce
+                minimo, maximo = self.limites_cruce
+                self.prob_cruce = min(maximo, max(minimo, self.prob_cruce))
+        self._limpiar_conteos()
+
+    def _limpiar_conteos(self):
+        self._mutados = self._exitos_mutacion = 0
+        self._cruzados = self._exitos_cruce = self._copias = self._exitos_copia = 0
+
+    def estado(self):
+        """Escala, probabilidad y conteos acumulados (para guardar en un checkpoint)."""
+        return {"escala_sigma": self.escala_sigma, "prob_cruce": self.prob_cruce,
+                "conteos": [self._mutados, self._exitos_mutacion, self._cruzados,
+                            self._exitos_cruce, self._copias, self._exitos_copia]}
+
+    def restaurar(self, estado):
+        self.escala_sigma = estado["escala_sigma"]
+        self.prob_cruce = estado["prob_cruce"]
+        (self._mutados, self._exitos_mutacion, self._cruzados,
+         self._exitos_cruce, self._copias, self._exitos_copia) = estado["conteos"]
+
+    def reiniciar(self):
+        self.escala_sigma = self.escala_inicial
+        self.prob_cruce = self.prob_cruce_inicial
+        self._limpiar_conteos()
+
+
+class StagnationMonitor:
+    """Cuenta las generaciones sin mejora del mejor ni del fitness medio."""
+
+    def __init__(self, paciencia=20, tolerancia=1e-3):
+        self.paciencia = paciencia
+        self.tolerancia = tolerancia
+        self.reiniciar()
+
+    def actualizar(self, fitness):
+        """Registra los fitness de una generación; retorna True si la corrida está estancada."""
+        mejor = max(fitness)
+        media = sum(fitness) / len(fitness)
+        if mejor > self.mejor + self.tolerancia or media > self.media + self.tolerancia:
+            self.mejor = max(self.mejor, mejor)
+            self.media = max(self.media, media)
+            self.sin_mejora = 0
+        else:
+            self.sin_mejora += 1
+        return self.sin_mejora >= self.paciencia
+
+    def estado(self):
+        return {"mejor": self.mejor, "media": self.media, "sin_mejora": self.sin_mejora}
+
+    def restaurar(self, estado):
+        self.mejor, self.media, self.sin_mejora = estado["mejor"], estado["media"], estado["sin_mejora"]
+
+    def reiniciar(self):
+        self.mejor = self.media = float("-inf")
+        self.sin_mejora = 0
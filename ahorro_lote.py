@@ -0,0 +1,195 @@
+"""
+ahorro_lote.py
+Planificador de ahorro para muchos escenarios a la vez.
+
+algoritmo_genetico_lote() aplica el mismo algoritmo que ahorro_genetico.algoritmo_genetico
+(elitismo de 2, padres del top 5, cruce por promedio, mutación por reinicio) pero
+con una población por escenario y todas evolucionando juntas en arrays de NumPy
+de forma (escenarios, tamano_poblacion).
+
+resolver_archivo() lee escenarios de un CSV o JSONL por bloques y escribe los
+resultados también por bloques, así un millón de escenarios usa memoria acotada.
+
+Ejecutar:
+    python ahorro_lote.py clientes.csv planes.jsonl --bloque 100000 --semilla 0
+Columnas de entrada: ingreso_mensual, meta_ahorro, plazo_meses.
+"""
+import os
+import csv
+import sys
+import json
+import time
+import random
+import argparse
+import itertools
+import numpy as np
+
+TAMANO_POBLACION = 12
+ITERACIONES = 50
+PROB_MUTACION = 0.3
+LIMITES = (0.1, 0.8)   # porcentaje de ahorro mínimo y máximo
+ELITE = 2
+TOP_PADRES = 5
+TAMANO_BLOQUE = 100000   # escenarios por bloque de lectura/escritura
+BLOQUE_CALCULO = 16384   # escenarios evolucionados juntos
+COLUMNAS_ENTRADA = ("ingreso_mensual", "meta_ahorro", "plazo_meses")
+COLUMNAS_SALIDA = COLUMNAS_ENTRADA + ("porcentaje", "ahorro_mensual", "ahorro_total")
+
+
+def algoritmo_genetico_lote(ingresos, metas, plazos, rng=None, tamano_poblacion=TAMANO_POBLACION,
+                            iteraciones=ITERACIONES, prob_mutacion=PROB_MUTACION):
+    """
+    Resuelve M escenarios a la vez.
+    Recibe arrays (M,) de ingreso mensual, meta y plazo en meses; retorna
+    (porcentaje, ahorro_mensual, ahorro_total), cada uno un array (M,).
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    ingresos = np.asarray(ingresos, dtype=np.float64)
+    metas = np.asarray(metas, dtype=np.float64)
+    plazos = np.asarray(plazos, dtype=np.float64)
+    mejor = np.empty_like(ingresos)
+    # De a BLOQUE_CALCULO escenarios los temporales caben en caché
+    for inicio in range(0, ingresos.shape[0], BLOQUE_CALCULO):
+        fin = inicio + BLOQUE_CALCULO
+        mejor[inicio:fin] = _evolucionar(ingresos[inicio:fin] * plazos[inicio:fin], metas[inicio:fin], rng,
+                                         tamano_poblacion, iteraciones, prob_mutacion)
+    return mejor, mejor * ingresos, mejor * ingresos * plazos
+
+
+def _evolucionar(factor, metas, rng, tamano_poblacion, iteraciones, prob_mutacion):
+    """Mejor porcentaje por escenario; fitness = -|meta - factor * p| con factor = ingreso * plazo."""
+    m = factor.shape[0]
+    hijos = tamano_poblacion - ELITE
+    top = min(TOP_PADRES, tamano_poblacion)
+    minimo, maximo = LIMITES
+    factor = factor[:, None]
+    metas = metas[:, None]
+    # Un hijo es el promedio de dos padres distintos del top, como rd.sample(poblacion[:5], 2);
+    # el promedio no depende del orden, así que basta elegir uno de los pares no ordenados
+    par_i, par_j = np.triu_indices(top, 1)
+    pares = len(par_i)
+    desplazamiento_pob = (np.arange(m) * tamano_poblacion)[:, None]
+    desplazamiento_par = (np.arange(m) * pares)[:, None]
+
+    poblacion = rng.uniform(minimo, maximo, size=(m, tamano_poblacion))
+    distancia = np.empty_like(poblacion)  # |meta - ahorro_total|, menor es mejor
+    for _ in range(iteraciones):
+        np.multiply(factor, poblacion, out=distancia)
+        np.subtract(distancia, metas, out=distancia)
+        np.abs(distancia, out=distancia)
+        mejores = np.argsort(distancia, axis=1)[:, :top]
+        padres = poblacion.ravel().take(mejores + desplazamiento_pob)
+
+        promedios = (padres[:, par_i] + padres[:, par_j]) * 0.5
+        nuevos = promedios.ravel().take(rng.integers(0, pares, size=(m, hijos)) + desplazamiento_par)
+        if prob_mutacion > 0:
+            # u < prob_mutacion decide la mutación y u / prob_mutacion es uniforme en [0, 1)
+            u = rng.random((m, hijos))
+            mutar = u < prob_mutacion
+            nuevos[mutar] = minimo + (maximo - minimo) / prob_mutacion * u[mutar]
+
+        poblacion[:, :ELITE] = padres[:, :ELITE]
+        poblacion[:, ELITE:] = nuevos
+
+    np.multiply(factor, poblacion, out=distancia)
+    np.subtract(distancia, metas, out=distancia)
+    np.abs(distancia, out=distancia)
+    return poblacion[np.arange(m), np.argmin(distancia, axis=1)]
+
+
+# --- Lectura y escritura por bloques ---
+
+def _formato(ruta):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Formato no soportado: {ruta} (use .csv o .jsonl)")
+
+
+def leer_bloques(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """Genera bloques de escenarios como tuplas de arrays (ingresos, metas, plazos)."""
+    formato = _formato(ruta)
+    with open(ruta, newline="", encoding="utf-8") as f:
+        if formato == "csv":
+            lector = csv.reader(f)
+            encabezado = next(lector)
+            indices = [encabezado.index(c) for c in COLUMNAS_ENTRADA]
+            filas = ([r[i] for i in indices] for r in lector if r)
+        else:
+            # Las líneas en blanco (p. ej. un salto final de más) se saltan antes de parsear
+            filas = ([d[c] for c in COLUMNAS_ENTRADA] for d in map(json.loads, filter(str.strip, f)))
+        while True:
+            bloque = list(itertools.islice(filas, tamano_bloque))
+            if not bloque:
+                return
+            # float() acepta tanto números de JSON como texto de CSV
+            datos = np.array(bloque, dtype=np.float64)
+            yield datos[:, 0], datos[:, 1], datos[:, 2]
+
+
+class EscritorResultados:
+    """Escribe filas de COLUMNAS_SALIDA en CSV o JSONL; se usa como context manager."""
+
+    # str() de un float de Python es su repr más corto, válido en JSON para valores finitos
+    _PLANTILLA_JSONL = "{{" + ", ".join(f'"{c}": {{}}' for c in COLUMNAS_SALIDA) + "}}\n"
+
+    def __init__(self, ruta):
+        self.formato = _formato(ruta)
+        self._archivo = open(ruta, "w", newline="", encoding="utf-8")
+        if self.formato == "csv":
+            self._csv = csv.writer(self._archivo)
+            self._csv.writerow(COLUMNAS_SALIDA)
+
+    def escribir(self, *columnas):
+        """Recibe un array por columna de COLUMNAS_SALIDA, todos del mismo largo."""
+        filas = zip(*(c.tolist() for c in columnas))
+        if self.formato == "csv":
+            self._csv.writerows(filas)
+        else:
+            plantilla = self._PLANTILLA_JSONL
+            self._archivo.writelines(plantilla.format(*fila) for fila in filas)
+
+    def close(self):
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def resolver_archivo(entrada, salida, tamano_bloque=TAMANO_BLOQUE, rng=None, **parametros):
+    """Resuelve todos los escenarios de 'entrada' y escribe 'salida'; retorna la cantidad."""
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    total = 0
+    with EscritorResultados(salida) as escritor:
+        for ingresos, metas, plazos in leer_bloques(entrada, tamano_bloque):
+            resultado = algoritmo_genetico_lote(ingresos, metas, plazos, rng=rng, **parametros)
+            escritor.escribir(ingresos, metas, plazos.astype(np.int64), *resultado)
+            total += ingresos.shape[0]
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Planificador de ahorro por lotes")
+    parser.add_argument("entrada", help="CSV o JSONL con ingreso_mensual, meta_ahorro, plazo_meses")
+    parser.add_argument("salida", help="CSV o JSONL de resultados")
+    parser.add_argument("--bloque", type=int, default=TAMANO_BLOQUE, help="escenarios por bloque")
+    parser.add_argument("--semilla", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.semilla)
+    inicio = time.perf_counter()
+    total = resolver_archivo(args.entrada, args.salida, args.bloque, rng=rng)
+    segundos = time.perf_counter() - inicio
+    print(f"{total} escenarios en {segundos:.2f} s ({total / max(segundos, 1e-9):,.0f} escenarios/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
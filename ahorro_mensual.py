@@ -0,0 +1,137 @@
+"""
+ahorro_mensual.py
+Planificador de ahorro con un porcentaje distinto para cada mes.
+
+El cromosoma es un vector de largo plazo_meses con la tasa de ahorro de cada mes
+(entre LIMITES). La población completa es un arreglo (N, plazo_meses) y el fitness
+se calcula para todos de una vez:
+    - brecha con la meta, relativa a la meta;
+    - suavidad: variación media de la tasa entre meses consecutivos;
+    - costo de vida mínimo: lo que le falta a cada mes para cubrirlo, relativo al ingreso total.
+Con NumPy escala a horizontes de 360 meses y poblaciones de miles de individuos.
+
+Ejecutar:
+    python ahorro_mensual.py 2500 300000 360 --costo-vida 1500
+"""
+import sys
+import time
+import random
+import argparse
+import numpy as np
+
+LIMITES = (0.1, 0.8)   # tasa de ahorro mínima y máxima de cada mes
+ELITE = 2
+
+
+def fitness_mensual(tasas, ingreso_mensual, meta_ahorro, costo_vida_minimo=0.0,
+                    peso_suavidad=1.0, peso_vida=10.0):
+    """
+    Fitness (mayor es mejor, 0 es perfecto) de una población (N, T) de tasas mensuales.
+    'ingreso_mensual' puede ser un número o un vector (T,) si el ingreso varía por mes.
+    """
+    if meta_ahorro <= 0:
+        # La brecha es relativa a la meta: con meta 0 sería NaN o infinita para todos
+        raise ValueError(f"La meta de ahorro debe ser positiva: {meta_ahorro}")
+    tasas = np.atleast_2d(tasas)
+    plazo = tasas.shape[1]
+    ingreso = np.broadcast_to(np.asarray(ingreso_mensual, dtype=np.float64), (plazo,))
+    ahorro = tasas * ingreso
+    brecha = np.abs(meta_ahorro - ahorro.sum(axis=1)) / meta_ahorro
+    penalizacion = brecha
+    if plazo > 1 and peso_suavidad:
+        penalizacion = penalizacion + peso_suavidad * np.abs(np.diff(tasas, axis=1)).mean(axis=1)
+    if costo_vida_minimo and peso_vida:
+        # Disponible para vivir = ingreso - ahorro
+        deficit = np.maximum(costo_vida_minimo - (ingreso - ahorro), 0.0).sum(axis=1)
+        penalizacion = penalizacion + peso_vida * deficit / ingreso.sum()
+    return -penalizacion
+
+
+def algoritmo_genetico_mensual(ingreso_mensual, meta_ahorro, plazo_meses, costo_vida_minimo=0.0,
+                               tamano_poblacion=100, iteraciones=200, prob_seleccion=0.5, prob_cruce=0.8,
+                               prob_mutacion=0.3, sigma=0.05, peso_suavidad=1.0, peso_vida=10.0,
+                               rng=None, progreso=None, cancelar=None):
+    """
+    Busca un plan de tasas de ahorro mes a mes.
+    Selección por truncamiento, cruce aritmético entre dos sobrevivientes y mutación
+    que desplaza un tramo de meses consecutivos (así no rompe la suavidad del plan).
+    'progreso(generacion, iteraciones, tasa_media_del_mejor)' y 'cancelar' funcionan
+    como en ahorro_genetico.algoritmo_genetico; si se cancela retorna None.
+    Retorna (tasas, ahorro_acumulado, ahorro_total): las tasas y el saldo de cada mes.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    minimo, maximo = LIMITES
+    n, plazo = tamano_poblacion, plazo_meses
+    ingreso = np.broadcast_to(np.asarray(ingreso_mensual, dtype=np.float64), (plazo,))
+
+    def evaluar(tasas):
+        return fitness_mensual(tasas, ingreso, meta_ahorro, costo_vida_minimo, peso_suavidad, peso_vida)
+
+    # Planes iniciales casi constantes: uno aleatorio ya sería muy poco suave
+    tasas = rng.uniform(minimo, maximo, size=(n, 1)) + rng.normal(0.0, 0.01, size=(n, plazo))
+    np.clip(tasas, minimo, maximo, out=tasas)
+    fitness = evaluar(tasas)
+
+    meses = np.arange(plazo)
+    sobrevivientes = max(2, int(n * prob_seleccion))
+    hijos = n - ELITE
+    for generacion in range(iteraciones):
+        if cancelar is not None and cancelar.is_set():
+            return None
+        orden = np.argsort(-fitness)
+        tasas, fitness = tasas[orden], fitness[orden]
+        if progreso is not None:
+            progreso(generacion + 1, iteraciones, float(tasas[0].mean()))
+
+        # Cruce aritmético: hijo = a * padre1 + (1 - a) * padre2 (a = 1 si no hay cruce)
+        padre1 = rng.integers(0, sobrevivientes, size=hijos)
+        padre2 = rng.integers(0, sobrevivientes, size=hijos)
+        peso = rng.random((hijos, 1))
+        peso[rng.random(hijos) >= prob_cruce] = 1.0
+        nuevos = tasas[padre2]
+        nuevos += peso * (tasas[padre1] - nuevos)
+
+        # Mutación: desplazar un tramo [inicio, fin) de meses en N(0, sigma)
+        mutar = np.flatnonzero(rng.random(hijos) < prob_mutacion)
+        if mutar.size:
+            extremos = np.sort(rng.integers(0, plazo + 1, size=(mutar.size, 2)), axis=1)
+            tramo = (meses >= extremos[:, :1]) & (meses < extremos[:, 1:])
+            nuevos[mutar] += tramo * rng.normal(0.0, sigma, size=(mutar.size, 1))
+        np.clip(nuevos, minimo, maximo, out=nuevos)
+
+        tasas = np.concatenate([tasas[:ELITE], nuevos])
+        fitness = np.concatenate([fitness[:ELITE], evaluar(nuevos)])
+
+    mejor = tasas[np.argmax(fitness)]
+    acumulado = np.cumsum(mejor * ingreso)
+    return mejor, acumulado, float(acumulado[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan de ahorro mes a mes con algoritmo genético")
+    parser.add_argument("ingreso", type=float, help="ingreso mensual")
+    parser.add_argument("meta", type=float, help="meta de ahorro total")
+    parser.add_argument("plazo", type=int, help="plazo en meses")
+    parser.add_argument("--costo-vida", type=float, default=0.0, help="costo de vida mínimo por mes")
+    parser.add_argument("--poblacion", type=int, default=100)
+    parser.add_argument("--iteraciones", type=int, default=200)
+    parser.add_argument("--semilla", type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.meta <= 0:
+        parser.error("la meta de ahorro debe ser positiva")
+
+    inicio = time.perf_counter()
+    tasas, acumulado, total = algoritmo_genetico_mensual(
+        args.ingreso, args.meta, args.plazo, args.costo_vida, tamano_poblacion=args.poblacion,
+        iteraciones=args.iteraciones, rng=np.random.default_rng(args.semilla))
+    segundos = time.perf_counter() - inicio
+    print(f"Ahorro total: ${total:,.2f} (meta ${args.meta:,.2f}) en {segundos:.2f} s")
+    print(f"Tasa mensual: media {tasas.mean()*100:.2f}%, mín {tasas.min()*100:.2f}%, máx {tasas.max()*100:.2f}%")
+    for mes in range(0, args.plazo, max(1, args.plazo // 12)):
+        print(f"  mes {mes + 1:>4}: {tasas[mes]*100:6.2f}%  acumulado ${acumulado[mes]:,.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+"""
+benchmark.py
+Suite de benchmarks de los caminos calientes: fitness, GA, física y render.
+
+Ejecutar:
+    python benchmark.py                          # medir e imprimir
+    python benchmark.py --save base.json         # guardar resultados como JSON
+    python benchmark.py --compare base.json      # marcar regresiones contra una línea base
+Los benchmarks de render usan el driver de video 'dummy' de SDL (no abren ventana).
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import contextlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+SCREEN_SIZE = (900, 600)
+TOLERANCIA = 0.15  # caída relativa aceptada antes de marcar regresión
+
+_benchmarks = []
+
+
+def benchmark(nombre, unidad, mayor_es_mejor=True):
+    """Registra una función que retorna el valor medido."""
+    def registrar(fn):
+        _benchmarks.append((nombre, unidad, mayor_es_mejor, fn))
+        return fn
+    return registrar
+
+
+def _medir(fn, minimo_s):
+    """Llama fn() hasta acumular 'minimo_s' segundos; retorna segundos por llamada."""
+    llamadas = 0
+    inicio = time.perf_counter()
+    while True:
+        fn()
+        llamadas += 1
+        total = time.perf_counter() - inicio
+        if total >= minimo_s:
+            return total / llamadas
+
+
+def _pantalla():
+    import pygame
+    if not pygame.get_init():
+        pygame.init()
+    screen = pygame.display.get_surface()
+    return screen or pygame.display.set_mode(SCREEN_SIZE)
+
+
+# --- Fitness y física ---
+
+@benchmark("calcularAdaptacion", "eval/s")
+def bench_calcular_adaptacion(minimo_s):
+    import genetic_algorithm as ga
+    individuos = ga.getPoblacion(2000)
+
+    def evaluar():
+        ga.cache_adaptacion.clear()  # cada llamada simula de verdad
+        for individuo in individuos:
+            ga.calcularAdaptacion(individuo)
+    return len(individuos) / _medir(evaluar, minimo_s)
+
+
+@benchmark("Parachutist.simulate(render=False)", "eval/s")
+def bench_simulate(minimo_s):
+    from parachutist import Parachutist
+    genes = {"V": 3.0, "B": 0.2, "S": 0.6, "F": 0.5}
+    return 1.0 / _medir(lambda: Parachutist(genes, 400).simulate(render=False), minimo_s)
+
+
+@benchmark("calcularAdaptacionPoblacion N=10000", "eval/s")
+def bench_poblacion(minimo_s):
+    import genetic_algorithm as ga
+    poblacion = ga.getPoblacion(10000)
+
+    def evaluar():
+        ga.cache_adaptacion.clear()
+        ga.calcularAdaptacionPoblacion(poblacion)
+    return 10000 / _medir(evaluar, minimo_s)
+
+
+def _bench_pool(n, minimo_s):
+    """Aceleración del pool de procesos sobre muestrear_poblacion serial (x > 1 conviene el pool)."""
+    import numpy as np
+    from parachute_physics import muestrear_poblacion
+    from parallel_eval import ParallelEvaluator
+    rng = np.random.default_rng(n)
+    genes = rng.uniform([1.5, -1.5, 0.0, 0.0], [6.0, 1.5, 1.0, 1.0], size=(n, 4))
+    with ParallelEvaluator(seed=0) as evaluador:
+        evaluador.evaluate(genes[:1])  # calentar el pool
+        serial = _medir(lambda: muestrear_poblacion(genes, rng=rng), minimo_s)
+        paralelo = _medir(lambda: evaluador.evaluate(genes), minimo_s)
+    return serial / paralelo
+
+
+for _tamano in (3000, 30000, 100000):
+    benchmark(f"ParallelEvaluator vs serie N={_tamano}", "x")(
+        lambda minimo_s, tamano=_tamano: _bench_pool(tamano, minimo_s))
+
+
+# --- Algoritmo genético ---
+
+def _bench_generaciones(tamano, minimo_s):
+    import genetic_algorithm as ga
+    generaciones = 20
+
+    def correr():
+        ga.cache_adaptacion.clear()
+        # Umbral inalcanzable para medir generaciones completas
+        ga.ejecutar_algoritmo_genetico(tamano, generaciones, umbral=float("inf"), verbose=False)
+    return generaciones / _medir(correr, minimo_s)
+
+
+for _tamano in (30, 300, 3000):
+    benchmark(f"ejecutar_algoritmo_genetico N={_tamano}", "gen/s")(
+        lambda minimo_s, tamano=_tamano: _bench_generaciones(tamano, minimo_s))
+
+
+@benchmark("seleccion modo carrera N=3000", "gen/s")
+def bench_seleccion_carrera(minimo_s):
+    import genetic_algorithm as ga
+    poblacion = ga.getPoblacion(3000)
+    modo, ga.modoSeleccion = ga.modoSeleccion, "carrera"
+    try:
+        return 1.0 / _medir(lambda: ga.seleccion(poblacion), minimo_s)
+    finally:
+        ga.modoSeleccion = modo
+
+
+@benchmark("Population.next_generation N=100000", "gen/s")
+def bench_population(minimo_s):
+    import numpy as np
+    from population import Population
+    rng = np.random.default_rng(0)
+    poblacion = Population.random(100000, rng)
+    poblacion.evaluate(rng)
+
+    def paso():
+        siguiente = poblacion.next_generation(rng)
+        siguiente.evaluate(rng)
+    return 1.0 / _medir(paso, minimo_s)
+
+
+def _bench_seleccion(estrategia, minimo_s):
+    import numpy as np
+    from selection import seleccionar_padres
+    rng = np.random.default_rng(0)
+    fitness = rng.random(1000000)
+    return 1000 * _medir(lambda: seleccionar_padres(fitness, 500000, rng, estrategia), minimo_s)
+
+
+for _estrategia in ("truncamiento", "torneo", "sus"):
+    benchmark(f"seleccionar_padres {_estrategia} N=1000000", "ms", mayor_es_mejor=False)(
+        lambda minimo_s, estrategia=_estrategia: _bench_seleccion(estrategia, minimo_s))
+
+
+# --- Render ---
+
+@benchmark("UI.render_background+render_panel", "ms/frame", mayor_es_mejor=False)
+def bench_ui(minimo_s):
+    from ui import UI
+    from genetic_algorithm import ParIndividual, getPoblacion
+    ui = UI(_pantalla())
+    ui.set_population([ParIndividual(c) for c in getPoblacion(30)])
+
+    def frame():
+        ui.render_background()
+        ui.render_panel()
+    return _medir(frame, minimo_s) * 1000
+
+
+def _bench_render_sprite(minimo_s, cache):
+    from parachutist import Parachutist
+    screen = _pantalla()
+    paracaidista = Parachutist({"V": 3.0, "B": 0.2, "S": 0.6, "F": 0.5}, 450, 200)
+    Parachutist.use_rotation_cache = cache
+
+    def dibujar():
+        # Recorre ángulos como en una caída real (la caché se llena en la primera vuelta)
+        paracaidista.angle = (paracaidista.angle + 0.013) % 1.2 - 0.6
+        paracaidista.render(screen)
+    try:
+        return _medir(dibujar, minimo_s) * 1000
+    finally:
+        Parachutist.use_rotation_cache = True
+
+
+@benchmark("UI.compose (frame sin cambios)", "ms/frame", mayor_es_mejor=False)
+def bench_ui_compose(minimo_s):
+    import pygame
+    from ui import UI
+    from genetic_algorithm import ParIndividual, getPoblacion
+    ui = UI(_pantalla())
+    ui.set_population([ParIndividual(c) for c in getPoblacion(30)])
+    sprites = pygame.sprite.RenderUpdates()
+    ui.compose(sprites)
+    return _medir(lambda: ui.compose(sprites), minimo_s) * 1000
+
+
+@benchmark("Parachutist.render", "ms/sprite", mayor_es_mejor=False)
+def bench_render_sprite(minimo_s):
+    return _bench_render_sprite(minimo_s, cache=True)
+
+
+@benchmark("Parachutist.render sin caché de rotación", "ms/sprite", mayor_es_mejor=False)
+def bench_render_sprite_sin_cache(minimo_s):
+    return _bench_render_sprite(minimo_s, cache=False)
+
+
+@benchmark("MainMenu._draw_background", "ms/frame", mayor_es_mejor=False)
+def bench_menu(minimo_s):
+    from menu import MainMenu
+    screen = _pantalla()
+    menu = MainMenu(screen.get_size())
+    menu.init_pygame(screen)
+
+    def frame():
+        menu.animation_timer += 1 / 60
+        menu._draw_background()
+    return _medir(frame, minimo_s) * 1000
+
+
+@benchmark("ahorro_mensual plazo=360 N=1000", "gen/s")
+def bench_ahorro_mensual(minimo_s):
+    import numpy as np
+    from ahorro_mensual import algoritmo_genetico_mensual
+    rng = np.random.default_rng(0)
+    generaciones = 20
+    return generaciones / _medir(lambda: algoritmo_genetico_mensual(
+        2500.0, 300000.0, 360, costo_vida_minimo=1500.0, tamano_poblacion=1000,
+        iteraciones=generaciones, rng=rng), minimo_s)
+
+
+# --- Arranque ---
+
+@benchmark("main.py hasta el primer frame", "ms", mayor_es_mejor=False)
+def bench_arranque(minimo_s):
+    from startup_time import tiempo_primer_frame
+    return tiempo_primer_frame()
+
+
+# --- Planificador de ahorro ---
+
+@benchmark("ahorro_genetico.algoritmo_genetico", "ms/solve", mayor_es_mejor=False)
+def bench_ahorro(minimo_s):
+    from ahorro_genetico import algoritmo_genetico
+    return _medir(lambda: algoritmo_genetico(2500.0, 30000.0, 24), minimo_s) * 1000
+
+
+@benchmark("ahorro_lote.algoritmo_genetico_lote N=16384", "esc/s")
+def bench_ahorro_lote(minimo_s):
+    import numpy as np
+    from ahorro_lote import algoritmo_genetico_lote
+    rng = np.random.default_rng(0)
+    n = 16384
+    ingresos = rng.uniform(1000, 5000, n)
+    metas = rng.uniform(5000, 100000, n)
+    plazos = rng.integers(6, 60, n).astype(float)
+    return n / _medir(lambda: algoritmo_genetico_lote(ingresos, metas, plazos, rng=rng), minimo_s)
+
+
+def ejecutar(filtro=None, minimo_s=0.5):
+    """Corre los benchmarks (opcionalmente filtrados por substring) y retorna el reporte."""
+    random.seed(0)
+    resultados = {}
+    for nombre, unidad, mayor_es_mejor, fn in _benchmarks:
+        if filtro and filtro not in nombre:
+            continue
+        with contextlib.redirect_stdout(sys.stderr):
+            valor = fn(minimo_s)
+        resultados[nombre] = {"value": valor, "unit": unidad, "higher_is_better": mayor_es_mejor}
+        print(f"{nombre:<45} {valor:>14.3f} {unidad}")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": resultados,
+    }
+
+
+def comparar(actual, base, tolerancia=TOLERANCIA):
+    """Imprime la variación contra la línea base; retorna la lista de regresiones."""
+    regresiones = []
+    for nombre, r in actual["results"].items():
+        anterior = base.get("results", {}).get(nombre)
+        if not anterior or not anterior["value"]:
+            continue
+        cambio = r["value"] / anterior["value"] - 1
+        # Normalizado para que positivo siempre signifique "mejoró"
+        mejora = cambio if r["higher_is_better"] else -cambio
+        marca = "REGRESIÓN" if mejora < -tolerancia else ""
+        print(f"{nombre:<45} {anterior['value']:>12.3f} -> {r['value']:>12.3f} {r['unit']} "
+              f"({mejora:+.1%}) {marca}")
+        if marca:
+            regresiones.append(nombre)
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de paraidista-ai")
+    parser.add_argument("--save", metavar="JSON", help="guardar resultados en este archivo")
+    parser.add_argument("--compare", metavar="JSON", help="comparar contra una línea base guardada")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCIA,
+                        help="caída relativa tolerada antes de marcar regresión (0.15 = 15%%)")
+    parser.add_argument("--filter", help="correr sólo benchmarks cuyo nombre contenga este texto")
+    parser.add_argument("--min-time", type=float, default=0.5, help="segundos mínimos por benchmark")
+    args = parser.parse_args(argv)
+
+    reporte = ejecutar(args.filter, args.min_time)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            base = json.load(f)
+        regresiones = comparar(reporte, base, args.tolerance)
+        if regresiones:
+            print(f"{len(regresiones)} regresión(es) por encima de {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+checkpoint.py
+Checkpoints y archivo de élites para corridas largas del algoritmo genético.
+
+Un checkpoint es un .npz con la población (N, G), sus fitness, el contador de
+generación, el estado del generador aleatorio (el módulo 'random', un
+random.Random o un np.random.Generator) y, opcionalmente, las entradas de la
+caché de fitness y un dict JSON con el resto del estado de la corrida. Se escribe en un archivo temporal del
+mismo directorio y se renombra con os.replace: si el proceso muere a mitad de la
+escritura queda el checkpoint anterior intacto.
+
+ArchivoElite guarda los mejores individuos vistos entre corridas (también en
+.npz) para sembrar con ellos la población inicial de una corrida nueva.
+"""
+import os
+import json
+import random
+import tempfile
+import numpy as np
+
+
+def guardar_npz(ruta, **arreglos):
+    """np.savez_compressed atómico: escribe a un temporal y lo renombra sobre 'ruta'."""
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        # mkstemp crea el archivo con 0600: se conservan los permisos del checkpoint anterior
+        # o, si no existe, los que daría open() según la umask
+        os.chmod(temporal, _permisos(ruta))
+        with os.fdopen(descriptor, "wb") as archivo:
+            np.savez_compressed(archivo, **arreglos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+def _leer_umask():
+    # os.umask sólo se puede leer cambiándola: se hace una vez al importar, antes de que
+    # otros hilos o procesos del programa creen archivos
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _leer_umask()
+
+
+def _permisos(ruta):
+    try:
+        return os.stat(ruta).st_mode & 0o777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _estado_rng(rng):
+    """Estado del generador como arreglos guardables en un .npz."""
+    if isinstance(rng, np.random.Generator):
+        return {"rng_tipo": np.array("numpy"), "rng_estado": np.array(json.dumps(rng.bit_generator.state))}
+    version, estado, gauss = rng.getstate()
+    return {"rng_tipo": np.array("random"), "rng_version": np.array(version),
+            "rng_estado": np.array(estado, dtype=np.uint32),
+            "rng_gauss": np.array(np.nan if gauss is None else gauss)}
+
+
+def _restaurar_rng(rng, datos):
+    tipo = str(datos["rng_tipo"])
+    if isinstance(rng, np.random.Generator):
+        if tipo != "numpy":
+            raise ValueError("El checkpoint guarda el estado de 'random', no de un np.random.Generator")
+        rng.bit_generator.state = json.loads(str(datos["rng_estado"]))
+        return
+    if tipo != "random":
+        raise ValueError("El checkpoint guarda el estado de un np.random.Generator, no de 'random'")
+    gauss = float(datos["rng_gauss"])
+    rng.setstate((int(datos["rng_version"]), tuple(int(x) for x in datos["rng_estado"]),
+                  None if np.isnan(gauss) else gauss))
+
+
+def guardar_checkpoint(ruta, poblacion, fitness, generacion, rng=random, estado=None, cache=None):
+    """
+    Guarda población, fitness, generación y el estado de 'rng' en 'ruta' (.npz) de forma atómica.
+    'estado' es un dict serializable en JSON con el resto del estado de la corrida y 'cache'
+    una FitnessCache cuyas entradas se guardan junto a la población.
+    """
+    arreglos = _estado_rng(rng)
+    if estado is not None:
+        arreglos["estado"] = np.array(json.dumps(estado))
+    if cache is not None:
+        arreglos.update({"cache_" + clave: valor for clave, valor in cache.getstate().items()})
+    guardar_npz(ruta, poblacion=np.asarray(poblacion, dtype=np.float64),
+                fitness=np.asarray(fitness, dtype=np.float64),
+                generacion=np.array(generacion), **arreglos)
+
+
+def cargar_checkpoint(ruta, rng=random, cache=None):
+    """
+    Lee un checkpoint y deja 'rng' (y 'cache', si el checkpoint la guardó) en el estado guardado.
+    Retorna un dict con 'poblacion' (N, G), 'fitness' (N,), 'generacion', 'estado' (el dict
+    guardado, o {} en checkpoints que no lo tienen) y 'cache' (si se restauró la caché).
+    """
+    with np.load(ruta) as datos:
+        _restaurar_rng(rng, datos)
+        restaurada = cache is not None and "cache_genes" in datos
+        if restaurada:
+            cache.setstate({clave[len("cache_"):]: datos[clave] for clave in datos.files
+                            if clave.startswith("cache_")})
+        return {"poblacion": datos["poblacion"], "fitness": datos["fitness"],
+                "generacion": int(datos["generacion"]),
+                "estado": json.loads(str(datos["estado"])) if "estado" in datos else {},
+                "cache": restaurada}
+
+
+class ArchivoElite:
+    """Los 'capacidad' mejores individuos distintos vistos entre corridas, persistidos en un .npz."""
+
+    def __init__(self, ruta, capacidad=50):
+        self.ruta = ruta
+        self.capacidad = capacidad
+        self.genes = None
+        self.fitness = np.empty(0)
+        if os.path.exists(ruta):
+            with np.load(ruta) as datos:
+                self.genes, self.fitness = datos["genes"], datos["fitness"]
+
+    def __len__(self):
+        return self.fitness.size
+
+    def actualizar(self, poblacion, fitness):
+        """Mezcla una población evaluada con el archivo y conserva los mejores sin repetidos."""
+        genes = np.asarray(poblacion, dtype=np.float64)
+        fitness = np.asarray(fitness, dtype=np.float64)
+        if self.genes is not None:
+            genes = np.concatenate([self.genes, genes])
+            fitness = np.concatenate([self.fitness, fitness])
+        orden = np.argsort(-fitness, kind="stable")
+        genes, fitness = genes[orden], fitness[orden]
+        # np.unique devuelve la primera aparición, que tras ordenar es la de mejor fitness
+        _, primeros = np.unique(genes, axis=0, return_index=True)
+        primeros = np.sort(primeros)[:self.capacidad]
+        self.genes, self.fitness = genes[primeros], fitness[primeros]
+
+    def guardar(self):
+        guardar_npz(self.ruta, genes=self.genes, fitness=self.fitness)
+
+    def sembrar(self, n):
+        """Hasta n élites (los mejores primero) como lista de cromosomas para una población inicial."""
+        if self.genes is None:
+            return []
+        return self.genes[:n].tolist()
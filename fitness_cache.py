@@ -0,0 +1,140 @@
+"""
+fitness_cache.py
+Memoización acotada (LRU) del fitness por cromosoma.
+
+Política para el fitness estocástico: la primera vez que se ve un cromosoma se
+promedian 'samples' simulaciones independientes y ese promedio se reutiliza mientras
+el cromosoma siga en caché. Así un hijo idéntico a su padre (cruce sin cruce y
+sin mutación) nunca se vuelve a simular y conserva el mismo fitness. Las muestras
+que llegan por otro camino (p. ej. la corrida visual) se suman al promedio con
+add_sample, en vez de reemplazarlo o de quedar fija la primera que llegó.
+"""
+from collections import OrderedDict
+import numpy as np
+
+
+class FitnessCache:
+    """Caché LRU de fitness con contadores de aciertos y fallos."""
+
+    def __init__(self, max_size=10000, samples=1):
+        if max_size < 1:
+            raise ValueError("max_size debe ser >= 1")
+        if samples < 1:
+            raise ValueError("samples debe ser >= 1")
+        self.max_size = max_size
+        self.samples = samples
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # clave -> [fitness medio, muestras]
+
+    @staticmethod
+    def key(cromosoma):
+        return tuple(float(g) for g in cromosoma)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, cromosoma):
+        return self.key(cromosoma) in self._data
+
+    def lookup(self, cromosoma):
+        """Retorna el fitness guardado o None, actualizando los contadores."""
+        k = self.key(cromosoma)
+        if k in self._data:
+            self._data.move_to_end(k)
+            self.hits += 1
+            return self._data[k][0]
+        self.misses += 1
+        return None
+
+    def store(self, cromosoma, fitness, muestras=None):
+        """Guarda un fitness medio de 'muestras' simulaciones (por defecto 'samples')."""
+        k = self.key(cromosoma)
+        self._data[k] = [fitness, muestras or self.samples]
+        self._data.move_to_end(k)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def add_sample(self, cromosoma, fitness):
+        """Suma una muestra al promedio del cromosoma (o lo agrega con ella); retorna el promedio."""
+        k = self.key(cromosoma)
+        entrada = self._data.get(k)
+        if entrada is None:
+            self.store(k, fitness, muestras=1)
+            return fitness
+        media, muestras = entrada
+        entrada[0] = (media * muestras + fitness) / (muestras + 1)
+        entrada[1] = muestras + 1
+        self._data.move_to_end(k)
+        return entrada[0]
+
+    def evaluate(self, cromosoma, evaluar):
+        """Fitness de un cromosoma; 'evaluar(cromosoma)' sólo se llama en un fallo."""
+        fitness = self.lookup(cromosoma)
+        if fitness is None:
+            fitness = sum(evaluar(cromosoma) for _ in range(self.samples)) / self.samples
+            self.store(cromosoma, fitness)
+        return fitness
+
+    def evaluate_many(self, poblacion, evaluar_lote):
+        """
+        Fitness de toda una población. Los fallos (sin duplicados) se evalúan juntos
+        con 'evaluar_lote(lista_de_cromosomas)', que retorna una secuencia de fitness.
+        """
+        resultado = [None] * len(poblacion)
+        pendientes = OrderedDict()
+        for i, cromosoma in enumerate(poblacion):
+            k = self.key(cromosoma)
+            if k in self._data:
+                self._data.move_to_end(k)
+                self.hits += 1
+                resultado[i] = self._data[k][0]
+            elif k in pendientes:
+                # Duplicado dentro del mismo lote: se simula una sola vez
+                self.hits += 1
+                pendientes[k].append(i)
+            else:
+                self.misses += 1
+                pendientes[k] = [i]
+
+        if pendientes:
+            claves = list(pendientes)
+            valores = evaluar_lote([list(k) for k in claves for _ in range(self.samples)])
+            for j, k in enumerate(claves):
+                muestras = valores[j * self.samples:(j + 1) * self.samples]
+                fitness = float(sum(muestras)) / self.samples
+                self.store(k, fitness)
+                for i in pendientes[k]:
+                    resultado[i] = fitness
+        return resultado
+
+    def getstate(self):
+        """Entradas (de la menos a la más usada) y contadores, como arreglos para un .npz."""
+        return {
+            "genes": np.array(list(self._data), dtype=np.float64),
+            "fitness": np.array([media for media, _ in self._data.values()], dtype=np.float64),
+            "muestras": np.array([muestras for _, muestras in self._data.values()], dtype=np.int64),
+            "contadores": np.array([self.hits, self.misses], dtype=np.int64),
+        }
+
+    def setstate(self, estado):
+        """Reemplaza el contenido por el de getstate(), respetando max_size."""
+        self._data.clear()
+        for genes, fitness, muestras in zip(estado["genes"], estado["fitness"], estado["muestras"]):
+            self.store(genes, float(fitness), int(muestras))
+        self.hits, self.misses = (int(x) for x in estado["contadores"])
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -2,10 +2,17 @@
 genetic_algorithm.py
 Implementación del algoritmo genético para el paracaidista, basada en el ejemplo proporcionado.
 """
+import os
+import time
 import random
-import math
-from copy import deepcopy
-from parachutist import Parachutist
+import numpy as np
+from parachute_physics import ParachutistModel, muestrear_poblacion, muestrear_poblacion_crn
+from fitness_cache import FitnessCache
+from profiling import instrumentar
+from checkpoint import guardar_checkpoint, cargar_checkpoint, ArchivoElite
+from racing import seleccion_por_carrera
+from selection import seleccionar_padres, parejas_distintas
+from adaptive import AdaptiveOperators, StagnationMonitor
 
 # --- Parámetros del problema ---
 tamano_cromosoma = 4  # V, B, S, F
@@ -14,10 +21,54 @@ bounds = [(1.5, 6.0), (-1.5, 1.5), (0.0, 1.0), (0.0, 1.0)]  # límites para V, B
 # --- Parámetros GA ---
 tamanoPoblacion = 30  # Aumentado para más diversidad
 probSeleccion = 0.5
+estrategiaSeleccion = "truncamiento"  # "truncamiento", "torneo" o "sus" (selection.py)
+tamanoTorneo = 2
 probMutacion = 0.05  # Reducido para evolución más gradual
 probCruce = 0.8
+escalaSigma = 0.1  # sigma de la mutación como fracción del rango de cada gen
 iteraciones = 100  # Máximo de generaciones
 
+# --- Caché de fitness ---
+tamanoCache = 10000  # cromosomas distintos recordados (LRU)
+muestrasAdaptacion = 4  # simulaciones promediadas por cromosoma nuevo (una sola muestra con suerte quedaría fija)
+cache_adaptacion = FitnessCache(max_size=tamanoCache, samples=muestrasAdaptacion)
+
+# --- Selección con fitness ruidoso ---
+# "cache": cada cromosoma se evalúa una vez y su fitness se recuerda entre generaciones.
+# "carrera": cada generación se re-evalúa con números aleatorios comunes y sólo se
+# agregan muestras a quienes siguen inciertos respecto del corte (racing.py).
+modoSeleccion = "cache"
+muestrasCarrera = 2          # muestras por individuo en cada ronda de la carrera
+muestrasMaximasCarrera = 16  # tope de muestras por individuo y generación
+confianzaCarrera = 1.96      # z del intervalo que decide si un individuo sigue incierto
+simulaciones_carrera = 0     # muestras simuladas por las carreras (para la telemetría)
+
+# --- Backend de evaluación ---
+evaluador_paralelo = None  # ParallelEvaluator activo, o None para evaluar en serie
+minimoParalelo = None  # poblaciones más chicas se evalúan en serie (se mide al activar el pool)
+
+def configurarEvaluadorParalelo(workers=None, chunk_size=None, minimo=None):
+    """
+    Activa la evaluación en un pool de procesos (workers=0 vuelve al modo serial).
+    Sin 'minimo', el tamaño desde el cual conviene el pool se mide en esta máquina
+    (parallel_eval.punto_de_equilibrio); si el pool nunca supera al camino serial
+    se cierra y la evaluación sigue en serie. Retorna el evaluador activo o None.
+    """
+    global evaluador_paralelo, minimoParalelo
+    if evaluador_paralelo is not None:
+        evaluador_paralelo.close()
+        evaluador_paralelo = None
+    if workers != 0:
+        from parallel_eval import ParallelEvaluator, punto_de_equilibrio
+        evaluador = ParallelEvaluator(workers=workers, chunk_size=chunk_size, seed=random.getrandbits(64))
+        minimo = minimo if minimo is not None else punto_de_equilibrio(evaluador)
+        if minimo is None:
+            evaluador.close()
+            print(f"El pool de {evaluador.workers} procesos no supera a la evaluación en serie: se mantiene en serie.")
+        else:
+            evaluador_paralelo, minimoParalelo = evaluador, minimo
+    return evaluador_paralelo
+
 # --- Representación de cromosomas ---
 def getIndividuo():
     """Genera un cromosoma aleatorio [V, B, S]."""
@@ -27,81 +78,317 @@ def getPoblacion(n):
     return [getIndividuo() for _ in range(n)]
 
 # --- Función de aptitud ---
+@instrumentar
 def calcularAdaptacion(individuo):
-    """Evalúa el fitness del individuo simulando el aterrizaje."""
+    """Evalúa el fitness del individuo; sólo simula si no está en caché."""
+    return cache_adaptacion.evaluate(individuo, _simularAdaptacion)
+
+def _simularAdaptacion(individuo):
+    """Simula el aterrizaje del individuo y retorna su fitness."""
     genes_dict = {'V': individuo[0], 'B': individuo[1], 'S': individuo[2], 'F': individuo[3]}
-    parachute = Parachutist(genes_dict, x=400, y=-40)
-    result = parachute.simulate(ground_y=520, render=False)
+    parachute = ParachutistModel(genes_dict, x=400, y=-40)
+    result = parachute.simulate(ground_y=520)
     return result["fitness"]
 
+@instrumentar
+def calcularAdaptacionPoblacion(poblacion):
+    """Evalúa el fitness de toda la población; los cromosomas ya vistos salen de la caché."""
+    return cache_adaptacion.evaluate_many(poblacion, _simularAdaptacionPoblacion)
+
+def _simularAdaptacionPoblacion(poblacion):
+    """Simula toda la población de una vez con el motor vectorizado."""
+    if not poblacion:
+        return []
+    if evaluador_paralelo is not None and len(poblacion) >= minimoParalelo:
+        return evaluador_paralelo.evaluate(poblacion).tolist()
+    # Semilla tomada de 'random' para que random.seed() siga haciendo reproducible la corrida
+    rng = np.random.default_rng(random.getrandbits(64))
+    return muestrear_poblacion(np.asarray(poblacion, dtype=np.float64), rng=rng).tolist()
+
 # --- Selección ---
-def seleccion(poblacion):
-    """Selecciona un subconjunto de la población basado en fitness."""
-    listaValorados = [(calcularAdaptacion(i), i) for i in poblacion]
-    listaOrdenados = sorted(listaValorados, reverse=True, key=lambda x: x[0])
-    numSeleccionados = int(len(listaOrdenados) * probSeleccion)
-    return [ind for _, ind in listaOrdenados[:numSeleccionados]]
+@instrumentar
+def seleccion(poblacion, parejas=None, rng=None):
+    """
+    Sortea de una vez los padres de 'parejas' cruces (por defecto len(poblacion) // 2)
+    según modoSeleccion y estrategiaSeleccion. Retorna una lista de pares de cromosomas.
+    """
+    parejas = parejas or max(1, len(poblacion) // 2)
+    rng = rng or np.random.default_rng(random.getrandbits(64))
+    padres_a, padres_b = seleccionIndices(poblacion, parejas, rng)
+    return [(poblacion[i], poblacion[j]) for i, j in zip(padres_a.tolist(), padres_b.tolist())]
+
+def seleccionIndices(poblacion, parejas, rng, fitness=None):
+    """
+    Índices (padres_a, padres_b) de los padres de 'parejas' cruces según modoSeleccion y
+    estrategiaSeleccion. 'poblacion' es una lista de cromosomas o un arreglo (N, G); 'fitness'
+    (si ya se conoce) sólo se usa en modo 'cache', en modo 'carrera' se vuelve a muestrear.
+    """
+    if modoSeleccion == "carrera":
+        # La carrera decide quién queda arriba del corte de truncamiento: otra estrategia no aplica
+        if estrategiaSeleccion != "truncamiento":
+            raise ValueError(f"El modo 'carrera' sólo admite la estrategia 'truncamiento', no '{estrategiaSeleccion}'")
+        sobrevivientes = _sobrevivientesCarrera(poblacion, rng)
+        i, j = parejas_distintas(sobrevivientes.size, parejas, rng)
+        return sobrevivientes[i], sobrevivientes[j]
+    if modoSeleccion != "cache":
+        raise ValueError(f"Modo de selección desconocido: {modoSeleccion} (use 'cache' o 'carrera')")
+    if fitness is None:
+        fitness = calcularAdaptacionPoblacion(poblacion)
+    return seleccionar_padres(fitness, parejas, rng, estrategiaSeleccion, probSeleccion, tamanoTorneo)
+
+def _sobrevivientesCarrera(poblacion, rng):
+    """Índices elegidos por truncamiento con carrera estadística sobre muestras con ruido común."""
+    global simulaciones_carrera
+    numSeleccionados = max(2, int(len(poblacion) * probSeleccion))
+    indices, _, simulaciones = seleccion_por_carrera(
+        np.asarray(poblacion, dtype=np.float64), numSeleccionados,
+        lambda genes, muestras, rng: muestrear_poblacion_crn(genes, muestras, rng=rng), rng,
+        muestrasCarrera, muestrasMaximasCarrera, confianzaCarrera)
+    simulaciones_carrera += simulaciones
+    return indices
 
 # --- Cruce ---
-def cruce(padre1, padre2):
-    if random.random() < probCruce:
+@instrumentar
+def cruce(padre1, padre2, prob_cruce=None):
+    """
+    Cruce de un punto. Retorna (hijos, cruzado): los dos hijos y si hubo cruce (como
+    population.cruce_lote), aunque los genes intercambiados coincidan entre los padres.
+    """
+    if random.random() < (probCruce if prob_cruce is None else prob_cruce):
         punto = random.randint(1, tamano_cromosoma - 1)
         hijo1 = padre1[:punto] + padre2[punto:]
         hijo2 = padre2[:punto] + padre1[punto:]
-        return [hijo1, hijo2]
-    return [padre1[:], padre2[:]]
+        return [hijo1, hijo2], True
+    return [padre1[:], padre2[:]], False
 
 # --- Mutación ---
-def mutacion(individuo):
+@instrumentar
+def mutacion(individuo, escala_sigma=None):
+    escala_sigma = escalaSigma if escala_sigma is None else escala_sigma
     for i in range(tamano_cromosoma):
         if random.random() < probMutacion:
             # Mutación gaussiana limitada por bounds
-            sigma = (bounds[i][1] - bounds[i][0]) * 0.1
+            sigma = (bounds[i][1] - bounds[i][0]) * escala_sigma
             individuo[i] += random.gauss(0, sigma)
             individuo[i] = max(bounds[i][0], min(bounds[i][1], individuo[i]))
     return individuo
 
+# --- Generación ---
+@instrumentar
+def siguienteGeneracion(poblacion, n=None, control=None, origenes=None):
+    """
+    Aplica selección, cruce y mutación y retorna una población nueva de n individuos.
+    Con 'control' (adaptive.AdaptiveOperators) se usan su probabilidad de cruce y su escala
+    de mutación; 'origenes' (lista) recibe por hijo (cruzado, mutado, fitness de referencia).
+    """
+    n = n or len(poblacion)
+    prob_cruce, escala_sigma = (control.prob_cruce, control.escala_sigma) if control is not None else (None, None)
+    # Los padres de todas las parejas se sortean juntos
+    parejasPadres = seleccion(poblacion, -(-n // 2))
+    nuevaPoblacion = []
+    if origenes is not None:
+        # Referencia de éxito: el fitness medio de la generación que se reemplaza. Comparar
+        # contra los padres sesga a la baja, porque sobrevivieron por muestras con suerte
+        fitness_anterior = calcularAdaptacionPoblacion(poblacion)
+        referencia = sum(fitness_anterior) / len(fitness_anterior)
+
+    for padres in parejasPadres:
+        hijos, cruzado = cruce(padres[0], padres[1], prob_cruce)
+        if origenes is not None:
+            antes = [h[:] for h in hijos]
+        hijos = [mutacion(h, escala_sigma) for h in hijos]
+        if origenes is not None:
+            origenes.extend((cruzado, h != a, referencia) for h, a in zip(hijos, antes))
+        nuevaPoblacion.extend(hijos)
+
+    if origenes is not None:
+        del origenes[n:]
+    return nuevaPoblacion[:n]
+
+def _reiniciarPoblacion(poblacion, fitness, tamano):
+    """Conserva el mejor 10% y completa con individuos nuevos al azar."""
+    conservar = max(1, tamano // 10)
+    mejores = sorted(zip(fitness, poblacion), reverse=True, key=lambda x: x[0])[:conservar]
+    poblacion = [ind for _, ind in mejores] + getPoblacion(tamano - conservar)
+    return poblacion, calcularAdaptacionPoblacion(poblacion)
+
 # --- Algoritmo principal ---
-def ejecutar_algoritmo_genetico():
-    poblacion = getPoblacion(tamanoPoblacion)
-    generacion = 0
+def ejecutar_algoritmo_genetico(tamano=None, generaciones=None, umbral=0.95, verbose=True, telemetria=None,
+                                checkpoint=None, intervalo_checkpoint=10, archivo_elite=None, fraccion_elite=0.2,
+                                adaptativo=False, paciencia=None, reinicios=0, continuar=False):
+    """
+    Evoluciona hasta superar 'umbral' o agotar las generaciones (por defecto los globales).
+    Con 'telemetria' (telemetry.Telemetry) se registra cada generación.
+    'checkpoint' (ruta .npz) se guarda cada 'intervalo_checkpoint' generaciones y al terminar;
+    si ya existe, la corrida se reanuda desde él con la caché de fitness, el control adaptativo,
+    el monitor de estancamiento y los reinicios hechos. Si esa corrida ya había terminado, sólo
+    se avisa y se retorna su mejor cromosoma, salvo con 'continuar'.
+    'archivo_elite' (ruta .npz) siembra una corrida nueva con hasta tamano * fraccion_elite
+    élites de corridas anteriores y al final se actualiza con la población final.
+    'adaptativo' ajusta la escala de mutación (regla de 1/5) y la probabilidad de cruce en
+    cada generación. Con 'paciencia', si ni el mejor ni el fitness medio mejoran durante
+    esa cantidad de generaciones la población se reinicia (hasta 'reinicios' veces,
+    conservando el mejor 10%) y después la corrida se detiene.
+    """
+    tamano = tamano or tamanoPoblacion
+    generaciones = generaciones or iteraciones
+    archivo = ArchivoElite(archivo_elite) if archivo_elite is not None else None
+    fitness = None
+    control = AdaptiveOperators(escalaSigma, probCruce) if adaptativo else None
+    monitor = StagnationMonitor(paciencia) if paciencia else None
+    reiniciados = 0
 
-    while generacion < iteraciones:
-        generacion += 1
-        seleccionados = seleccion(poblacion)
-        nuevaPoblacion = []
+    if checkpoint is not None and os.path.exists(checkpoint):
+        guardado = cargar_checkpoint(checkpoint, cache=cache_adaptacion)
+        poblacion, fitness = guardado["poblacion"].tolist(), guardado["fitness"].tolist()
+        generacion = guardado["generacion"]
+        estado = guardado["estado"]
+        if not guardado["cache"]:
+            # Checkpoint sin caché: al menos los fitness de la población ya se pagaron
+            for individuo, valor in zip(poblacion, fitness):
+                cache_adaptacion.store(individuo, valor)
+        reiniciados = estado.get("reinicios", 0)
+        if control is not None and estado.get("control"):
+            control.restaurar(estado["control"])
+        if monitor is not None and estado.get("monitor"):
+            monitor.restaurar(estado["monitor"])
+        if evaluador_paralelo is not None and estado.get("paralelo"):
+            evaluador_paralelo.setstate(estado["paralelo"])
+        if estado.get("terminada") and not continuar:
+            mejor = poblacion[max(range(len(fitness)), key=fitness.__getitem__)]
+            if verbose:
+                print(f"El checkpoint {checkpoint} es de una corrida terminada ({estado['terminada']}) en la "
+                      f"generación {generacion}: no se continúa (use continuar=True para seguirla).")
+            return mejor, generacion
+        if verbose:
+            print(f"Reanudando desde la generación {generacion} ({checkpoint})")
+    else:
+        elites = archivo.sembrar(int(tamano * fraccion_elite)) if archivo is not None else []
+        poblacion = elites + getPoblacion(tamano - len(elites))
+        generacion = 0
+
+    def estadoCorrida():
+        return {"reinicios": reiniciados, "terminada": terminada,
+                "control": control.estado() if control is not None else None,
+                "monitor": monitor.estado() if monitor is not None else None,
+                "paralelo": evaluador_paralelo.getstate() if evaluador_paralelo is not None else None}
 
-        while len(nuevaPoblacion) < tamanoPoblacion:
-            padres = random.sample(seleccionados, 2)
-            hijos = cruce(padres[0], padres[1])
-            hijos = [mutacion(h) for h in hijos]
-            nuevaPoblacion.extend(hijos)
+    def simulacionesHechas():
+        return cache_adaptacion.misses * cache_adaptacion.samples + simulaciones_carrera
 
-        poblacion = nuevaPoblacion[:tamanoPoblacion]
+    resuelto = fitness is not None and max(fitness) > umbral
+    terminada = "solución" if resuelto else None
+    # Simulaciones ya registradas: lo que se simule después (incluido un reinicio por
+    # estancamiento, que evalúa una población nueva) entra en el próximo registro
+    simulaciones = simulacionesHechas()
+    while generacion < generaciones and not resuelto:
+        generacion += 1
+        if telemetria is not None:
+            inicio = time.perf_counter()
+        origenes = [] if control is not None else None
+        poblacion = siguienteGeneracion(poblacion, control=control, origenes=origenes)
 
         # Verificar si hay solución óptima
-        mejor_fitness = max(calcularAdaptacion(ind) for ind in poblacion)
-        if mejor_fitness > 0.95:  # Umbral más alto para evolución gradual
-            print(f"¡Solución encontrada en generación {generacion}!")
+        if telemetria is not None:
+            fin_operadores = time.perf_counter()
+        fitness = calcularAdaptacionPoblacion(poblacion)
+        mejor_fitness = max(fitness)
+        if control is not None:
+            control.actualizar(origenes, fitness)
+        if telemetria is not None:
+            # Con caché, siguienteGeneracion no simula (la generación anterior ya está evaluada);
+            # en modo carrera se cuentan además las muestras de la selección
+            telemetria.record(generacion, fitness, poblacion,
+                              evaluaciones=simulacionesHechas() - simulaciones,
+                              t_evaluacion=time.perf_counter() - fin_operadores,
+                              t_operadores=fin_operadores - inicio)
+            simulaciones = simulacionesHechas()
+        resuelto = mejor_fitness > umbral  # Umbral más alto para evolución gradual
+        if resuelto:
+            terminada = "solución"
+            if verbose:
+                print(f"¡Solución encontrada en generación {generacion}!")
             break
+        if monitor is not None and monitor.actualizar(fitness):
+            if reiniciados >= reinicios:
+                terminada = "estancamiento"
+                if verbose:
+                    print(f"Sin mejora en {paciencia} generaciones: se detiene en la generación {generacion}.")
+                break
+            reiniciados += 1
+            poblacion, fitness = _reiniciarPoblacion(poblacion, fitness, tamano)
+            monitor.reiniciar()
+            if control is not None:
+                control.reiniciar()
+            if verbose:
+                print(f"Sin mejora en {paciencia} generaciones: reinicio {reiniciados} en la generación {generacion}.")
+        if checkpoint is not None and generacion % intervalo_checkpoint == 0:
+            guardar_checkpoint(checkpoint, poblacion, fitness, generacion,
+                               estado=estadoCorrida(), cache=cache_adaptacion)
+
+    if fitness is None:
+        fitness = calcularAdaptacionPoblacion(poblacion)
+    if checkpoint is not None:
+        terminada = terminada or "generaciones"
+        guardar_checkpoint(checkpoint, poblacion, fitness, generacion,
+                           estado=estadoCorrida(), cache=cache_adaptacion)
+    if archivo is not None:
+        archivo.actualizar(poblacion, fitness)
+        archivo.guardar()
 
     # Mejor solución
-    mejor = max(poblacion, key=lambda ind: calcularAdaptacion(ind))
-    print("Mejor cromosoma:", mejor)
-    print("Fitness:", calcularAdaptacion(mejor))
+    mejor = max(poblacion, key=calcularAdaptacion)
+    if verbose:
+        print("Mejor cromosoma:", mejor)
+        print("Fitness:", calcularAdaptacion(mejor))
     return mejor, generacion
 
 # Para compatibilidad con el código existente, mantener ParIndividual pero adaptado
 class ParIndividual:
     """Adaptación para compatibilidad con UI."""
 
+    __slots__ = ("cromosoma", "genes", "fitness")
+
     def __init__(self, cromosoma):
         self.cromosoma = cromosoma  # lista [V, B, S, F]
         self.genes = {'V': cromosoma[0], 'B': cromosoma[1], 'S': cromosoma[2], 'F': cromosoma[3]}
         self.fitness = 0.0
 
     def copy(self):
-        return ParIndividual(deepcopy(self.cromosoma))
+        return ParIndividual(self.cromosoma[:])
+
+class PopulationState:
+    """
+    Población actual con sus ParIndividual y fitness ya calculados.
+    Sólo se re-evalúa cuando la población cambia (Setup o nueva generación);
+    los render leen los valores guardados.
+    """
+
+    def __init__(self):
+        self.poblacion = []
+        self._ui_population = []
+        self._dirty = False
+
+    def set_poblacion(self, poblacion):
+        self.poblacion = poblacion
+        self._dirty = True
+
+    def set_fitness(self, i, fitness):
+        """Registra un fitness ya medido (p. ej. en la corrida visual) sin re-evaluar."""
+        self.ui_population[i].fitness = fitness
+
+    @property
+    def ui_population(self):
+        if self._dirty:
+            fitnesses = calcularAdaptacionPoblacion(self.poblacion)
+            self._ui_population = [ParIndividual(ind) for ind in self.poblacion]
+            for ind, fitness in zip(self._ui_population, fitnesses):
+                ind.fitness = fitness
+            self._dirty = False
+        return self._ui_population
+
+    def clear(self):
+        self.set_poblacion([])
 
 class GeneticAlgorithm:
     """Wrapper para compatibilidad."""
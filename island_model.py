@@ -0,0 +1,131 @@
+"""
+island_model.py
+Modelo de islas: K subpoblaciones evolucionan en procesos separados con los
+operadores de genetic_algorithm y cada M generaciones migran sus élites.
+
+Ejecutar: python island_model.py --islas 4 --migracion 10 --topologia anillo
+"""
+import os
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import genetic_algorithm as ga
+
+TOPOLOGIAS = ("anillo", "aleatoria")
+
+
+def _evolucionar_isla(poblacion, fitness, generaciones, semilla, umbral):
+    """Corre hasta 'generaciones' generaciones de una isla (se ejecuta en el worker)."""
+    ga.evaluador_paralelo = None  # cada isla ya ocupa su propio proceso
+    # La caché del worker arranca vacía en cada tarea: qué isla le toca a qué proceso depende del
+    # planificador, y heredar fitness promediados de otra isla haría la corrida irreproducible.
+    # El padre ya evaluó la población (y trae el fitness de los migrantes), así que se siembra
+    # con esos valores en vez de volver a simularla
+    ga.cache_adaptacion.clear()
+    for cromosoma, valor in zip(poblacion, fitness):
+        ga.cache_adaptacion.store(cromosoma, valor)
+    random.seed(semilla)
+    corridas = 0
+    for _ in range(generaciones):
+        poblacion = ga.siguienteGeneracion(poblacion)
+        corridas += 1
+        if max(ga.calcularAdaptacionPoblacion(poblacion)) > umbral:
+            break
+    return poblacion, ga.calcularAdaptacionPoblacion(poblacion), corridas
+
+
+def _destinos(k, topologia, rnd):
+    """Isla destino de los migrantes de cada isla."""
+    if topologia == "anillo":
+        return [(i + 1) % k for i in range(k)]
+    # Aleatoria: permutación sin puntos fijos para que nadie migre a sí mismo
+    destinos = list(range(k))
+    while k > 1 and any(i == d for i, d in enumerate(destinos)):
+        rnd.shuffle(destinos)
+    return destinos
+
+
+def migrar(poblaciones, fitnesses, migrantes, topologia="anillo", rnd=random):
+    """Copia las 'migrantes' mejores de cada isla sobre las peores de su isla destino."""
+    k = len(poblaciones)
+    if k < 2 or migrantes < 1:
+        return
+    elites = []
+    for pob, fit in zip(poblaciones, fitnesses):
+        orden = sorted(range(len(pob)), key=lambda j: fit[j], reverse=True)
+        elites.append([(pob[j][:], fit[j]) for j in orden[:migrantes]])
+    for origen, destino in enumerate(_destinos(k, topologia, rnd)):
+        pob, fit = poblaciones[destino], fitnesses[destino]
+        peores = sorted(range(len(pob)), key=lambda j: fit[j])[:migrantes]
+        for j, (cromosoma, valor) in zip(peores, elites[origen]):
+            pob[j] = cromosoma[:]
+            fit[j] = valor
+
+
+def ejecutar_islas(islas=4, tamano_isla=None, intervalo_migracion=10, migrantes=2,
+                   topologia="anillo", generaciones=None, workers=None, semilla=None, umbral=0.95):
+    """
+    Evoluciona 'islas' subpoblaciones en paralelo con migración periódica.
+    Retorna dict con el mejor de cada isla, el mejor global y las generaciones corridas.
+    """
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"topología desconocida: {topologia!r} (usar {', '.join(TOPOLOGIAS)})")
+    tamano_isla = tamano_isla or ga.tamanoPoblacion
+    generaciones = generaciones or ga.iteraciones
+    if semilla is not None:
+        random.seed(semilla)
+    rnd = random.Random(semilla)
+    semillas = np.random.SeedSequence(semilla)
+
+    poblaciones = [ga.getPoblacion(tamano_isla) for _ in range(islas)]
+    fitnesses = [ga.calcularAdaptacionPoblacion(p) for p in poblaciones]
+    generacion = 0
+    solucion = False
+
+    with ProcessPoolExecutor(max_workers=workers or min(islas, os.cpu_count() or 1)) as pool:
+        while generacion < generaciones and not solucion:
+            bloque = min(intervalo_migracion, generaciones - generacion)
+            hijos = semillas.spawn(islas)
+            futuros = [
+                pool.submit(_evolucionar_isla, pob, fit, bloque, int(s.generate_state(1)[0]), umbral)
+                for pob, fit, s in zip(poblaciones, fitnesses, hijos)
+            ]
+            resultados = [f.result() for f in futuros]
+            poblaciones = [r[0] for r in resultados]
+            fitnesses = [list(r[1]) for r in resultados]
+            generacion += max(r[2] for r in resultados)
+
+            solucion = any(max(fit) > umbral for fit in fitnesses)
+            if not solucion:
+                migrar(poblaciones, fitnesses, migrantes, topologia, rnd)
+
+            mejores = ", ".join(f"{max(fit):.3f}" for fit in fitnesses)
+            print(f"Generación {generacion}: mejor por isla [{mejores}]")
+
+    por_isla = []
+    for pob, fit in zip(poblaciones, fitnesses):
+        j = max(range(len(pob)), key=lambda i: fit[i])
+        por_isla.append({"cromosoma": pob[j], "fitness": fit[j]})
+    mejor = max(por_isla, key=lambda r: r["fitness"])
+    return {"islas": por_isla, "mejor": mejor, "generaciones": generacion, "solucion": solucion}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Algoritmo genético con modelo de islas")
+    parser.add_argument("--islas", type=int, default=4)
+    parser.add_argument("--tamano", type=int, default=None, help="individuos por isla")
+    parser.add_argument("--migracion", type=int, default=10, help="generaciones entre migraciones")
+    parser.add_argument("--migrantes", type=int, default=2)
+    parser.add_argument("--topologia", choices=TOPOLOGIAS, default="anillo")
+    parser.add_argument("--generaciones", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--semilla", type=int, default=None)
+    args = parser.parse_args()
+
+    resultado = ejecutar_islas(args.islas, args.tamano, args.migracion, args.migrantes,
+                               args.topologia, args.generaciones, args.workers, args.semilla)
+    for i, isla in enumerate(resultado["islas"]):
+        print(f"Isla {i}: fitness={isla['fitness']:.3f} cromosoma={isla['cromosoma']}")
+    print("Mejor global:", resultado["mejor"]["cromosoma"])
+    print("Fitness:", resultado["mejor"]["fitness"])
@@ -3,88 +3,61 @@ main.py
 Punto de entrada principal con menú de selección.
 Permite elegir entre simulación del paracaidista y planificador de ahorro.
 Ejecutar: python main.py
+
+Al inicio sólo se carga lo necesario para el menú; la simulación (y con ella el
+algoritmo genético) y el planificador se importan la primera vez que se abren.
+El presupuesto de arranque se verifica con: python startup_time.py
+Perfilar una corrida: python main.py --profile [cprofile|tracemalloc|hooks]
 """
 import sys
 import pygame
-import random
-import subprocess
-import os
-from ui import UI
-from menu import show_main_menu
-from genetic_algorithm import getPoblacion, seleccion, cruce, mutacion, calcularAdaptacion, tamanoPoblacion, iteraciones
-from parachutist import Parachutist
+from menu import create_menu_scene
+from scenes import SceneManager
 
 FPS = 60
 SCREEN_SIZE = (900, 600)
 GROUND_Y = 520  # y en píxeles del "suelo"
 
 
-def run_parachutist_simulation():
-    """Ejecuta la simulación del paracaidista en una nueva ventana."""
-    try:
-        script_path = os.path.join(os.path.dirname(__file__), "parachutist_main.py")
-        subprocess.run([sys.executable, script_path], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error al ejecutar la simulación del paracaidista: {e}")
-    except FileNotFoundError:
-        print("No se encontró el archivo parachutist_main.py")
-
-    return "menu"
-
+def create_parachutist_scene(screen):
+    """Simulación del paracaidista dentro de la ventana principal, con botón de volver."""
+    from parachutist_main import ParachutistScene
+    return ParachutistScene(screen, show_back_button=True)
 
-def run_savings_planner():
-    """Ejecuta el planificador de ahorro genético."""
-    try:
-        # Ejecutar el script de ahorro genético
-        script_path = os.path.join(os.path.dirname(__file__), "ahorro_genetico.py")
-        subprocess.run([sys.executable, script_path], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error al ejecutar el planificador de ahorro: {e}")
-    except FileNotFoundError:
-        print("No se encontró el archivo ahorro_genetico.py")
 
-    return "menu"  # Volver al menú después de cerrar la ventana de Tkinter
+def create_savings_scene(screen):
+    """Planificador de ahorro dentro de la ventana principal."""
+    from savings_scene import SavingsScene
+    return SavingsScene(screen)
 
 
-def main():
-    """Función principal que maneja el flujo de la aplicación."""
+def main(max_frames=None):
+    """
+    Función principal que maneja el flujo de la aplicación.
+    Las tres pantallas son escenas del mismo proceso: cambiar entre ellas no
+    relanza el intérprete y las cachés ya calientes se conservan.
+    'max_frames' corta el bucle tras esa cantidad de frames (medición de arranque).
+    """
     pygame.init()
     screen = pygame.display.set_mode(SCREEN_SIZE)
-    pygame.display.set_caption("Algoritmos Genéticos - Menú Principal")
-    clock = pygame.time.Clock()
-
-    current_state = "menu"
-
-    while current_state != "exit":
-        if current_state == "menu":
-            # Mostrar menú principal
-            selection = show_main_menu(screen)
-            if selection == "parachutist":
-                current_state = "parachutist"
-            elif selection == "savings":
-                current_state = "savings"
-            elif selection == "exit":
-                current_state = "exit"
-
-        elif current_state == "parachutist":
-            # Ejecutar simulación del paracaidista
-            result = run_parachutist_simulation()
-            if result == "menu":
-                current_state = "menu"
-            else:
-                current_state = "exit"
 
-        elif current_state == "savings":
-            # Ejecutar planificador de ahorro
-            result = run_savings_planner()
-            if result == "menu":
-                current_state = "menu"
-            else:
-                current_state = "exit"
+    manager = SceneManager(screen, fps=FPS)
+    manager.register("menu", create_menu_scene)
+    manager.register("parachutist", create_parachutist_scene)
+    manager.register("savings", create_savings_scene)
+    manager.run("menu", max_frames=max_frames)
 
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    import profiling
+    parser = argparse.ArgumentParser(description="Algoritmos genéticos: paracaidista y planificador de ahorro")
+    profiling.agregar_argumentos(parser)
+    args = parser.parse_args()
+    if args.profile:
+        profiling.perfilar(main, args.profile, args.profile_out)
+    else:
+        main()
@@ -7,6 +7,12 @@ import pygame
 import sys
 import math
 import os
+from scenes import Scene, EXIT
+from ui import get_font
+from profiling import instrumentar
+
+PATTERN_KEY = (255, 0, 255)  # color transparente de la capa de patrón
+GRADIENT_KEYFRAMES = 256     # fotogramas clave por ciclo del gradiente animado
 
 class MenuButton:
     """Botón moderno con efectos hover y animaciones."""
@@ -21,6 +27,7 @@ class MenuButton:
         self.is_hovered = False
         self.animation_progress = 0.0
         self.pulse_timer = 0.0
+        self._text_cache = {}  # color -> superficie del texto
         self.image = None
         if image_path:
             try:
@@ -72,15 +79,23 @@ class MenuButton:
         text_color = (255, 255, 255) if self._is_dark(current_color) else (20, 20, 20)
 
         # Sombra del texto
-        shadow_txt = self.font.render(self.text, True, (0, 0, 0))
+        shadow_txt = self._render_text((0, 0, 0))
         shadow_rect = shadow_txt.get_rect(center=(self.rect.centerx + image_offset + 1, self.rect.centery + 1))
         screen.blit(shadow_txt, shadow_rect)
 
         # Texto principal
-        txt = self.font.render(self.text, True, text_color)
+        txt = self._render_text(text_color)
         txt_rect = txt.get_rect(center=(self.rect.centerx + image_offset, self.rect.centery))
         screen.blit(txt, txt_rect)
 
+    def _render_text(self, color):
+        """Texto del botón renderizado una sola vez por color."""
+        txt = self._text_cache.get(color)
+        if txt is None:
+            txt = self.font.render(self.text, True, color)
+            self._text_cache[color] = txt
+        return txt
+
     def handle_event(self, event):
         """Maneja eventos del mouse."""
         if event.type == pygame.MOUSEMOTION:
@@ -113,10 +128,13 @@ class MenuButton:
         """Determina si un color es oscuro."""
         return (color[0] + color[1] + color[2]) / 3 < 128
 
-class MainMenu:
+class MainMenu(Scene):
     """Pantalla principal de selección con diseño moderno."""
 
+    caption = "Algoritmos Genéticos - Menú Principal"
+
     def __init__(self, screen_size=(900, 600)):
+        super().__init__()
         self.screen_size = screen_size
         self.screen = None
         self.clock = None
@@ -141,6 +159,14 @@ class MainMenu:
         # Botones
         self.buttons = []
         self.animation_timer = 0.0
+        self._dt = 0.0
+
+        # Capas pre-renderizadas del fondo
+        self._pattern = None
+        self._gradient = None
+        self._gradient_keyframes = []
+        self._title = None
+        self._subtitle = None
 
     def init_pygame(self, screen):
         """Inicializa elementos de Pygame."""
@@ -148,12 +174,13 @@ class MainMenu:
         self.clock = pygame.time.Clock()
 
         # Fuentes
-        self.title_font = pygame.font.SysFont("Segoe UI", 48, bold=True)
-        self.button_font = pygame.font.SysFont("Segoe UI", 24, bold=True)
-        self.subtitle_font = pygame.font.SysFont("Segoe UI", 18)
+        self.title_font = get_font("Segoe UI", 48, bold=True)
+        self.button_font = get_font("Segoe UI", 24, bold=True)
+        self.subtitle_font = get_font("Segoe UI", 18)
 
         # Crear botones
         self._create_buttons()
+        self._build_background_layers()
 
     def _create_buttons(self):
         """Crea los botones del menú."""
@@ -207,54 +234,80 @@ class MainMenu:
 
     def _exit_app(self):
         """Sale de la aplicación."""
-        self.selected_option = "exit"
+        self.selected_option = EXIT
         self.running = False
 
-    def _draw_background(self):
-        """Dibuja el fondo con gradiente animado y elementos decorativos."""
-        # Gradiente animado base
-        time_factor = self.animation_timer * 0.5
-        for i, color in enumerate(self.colors['background']):
-            alpha = 0.3 + 0.2 * math.sin(time_factor + i * math.pi / 3)
-            alpha = max(0.1, min(1.0, alpha))
-
-            # Crear superficie con alpha
-            surface = pygame.Surface(self.screen_size)
-            surface.set_alpha(int(alpha * 255))
-            surface.fill(color)
-            self.screen.blit(surface, (0, 0))
-
-        # Patrón de puntos sutil con variación
+    def _build_background_layers(self):
+        """
+        Pre-renderiza una sola vez lo que no cambia entre frames.
+        Puntos y líneas son estáticos: int() deja el radio de los puntos siempre en 1 y
+        pygame.draw ignora el alfa sobre la pantalla, así que se dibujan en una capa con
+        colorkey. Las tres capas del gradiente se combinan en un color y un alfa
+        equivalentes, precalculados en GRADIENT_KEYFRAMES fotogramas clave, y se pintan
+        sobre una única superficie reutilizada.
+        """
+        self._pattern = pygame.Surface(self.screen_size).convert()
+        self._pattern.fill(PATTERN_KEY)
+        self._pattern.set_colorkey(PATTERN_KEY, pygame.RLEACCEL)
+
+        # Patrón de puntos sutil
         for x in range(0, self.screen_size[0], 50):
             for y in range(0, self.screen_size[1], 50):
-                # Variar el tamaño y color de los puntos
-                size = 1 + int(math.sin(time_factor + x * 0.01 + y * 0.01) * 0.5)
-                alpha = 20 + int(math.sin(time_factor * 2 + x * 0.02) * 10)
-                dot_color = (*self.colors['primary'][:3], alpha)
-                pygame.draw.circle(self.screen, dot_color, (x, y), size)
+                pygame.draw.circle(self._pattern, self.colors['primary'], (x, y), 1)
 
         # Elementos decorativos: líneas diagonales sutiles
         for i in range(0, self.screen_size[0] + self.screen_size[1], 100):
             start_pos = (i, 0) if i < self.screen_size[0] else (self.screen_size[0], i - self.screen_size[0])
             end_pos = (i - self.screen_size[1], self.screen_size[1]) if i > self.screen_size[1] else (0, i)
+            pygame.draw.line(self._pattern, self.colors['accent'], start_pos, end_pos, 1)
+
+        self._gradient = pygame.Surface(self.screen_size).convert()
+        self._gradient_keyframes = [
+            self._blend_gradient(2 * math.pi * k / GRADIENT_KEYFRAMES) for k in range(GRADIENT_KEYFRAMES)
+        ]
+
+        # Título y subtítulo no cambian
+        self._title = self.title_font.render("Algoritmos Genéticos", True, self.colors['text'])
+        self._subtitle = self.subtitle_font.render("Selecciona una simulación", True, self.colors['accent'])
+
+    def _blend_gradient(self, time_factor):
+        """
+        Color y alfa de una sola capa equivalente a superponer las capas del gradiente.
+        Cada capa i deja resultado = destino * (1 - a_i) + color_i * a_i.
+        """
+        premultiplied = [0.0, 0.0, 0.0]
+        transparency = 1.0
+        for i, color in enumerate(self.colors['background']):
+            alpha = 0.3 + 0.2 * math.sin(time_factor + i * math.pi / 3)
+            alpha = int(max(0.1, min(1.0, alpha)) * 255) / 255
+            premultiplied = [p * (1 - alpha) + c * alpha for p, c in zip(premultiplied, color)]
+            transparency *= 1 - alpha
+        opacity = 1 - transparency
+        return tuple(int(round(p / opacity)) for p in premultiplied), int(round(opacity * 255))
 
-            line_color = (*self.colors['accent'][:3], 15)
-            pygame.draw.line(self.screen, line_color, start_pos, end_pos, 1)
+    @instrumentar
+    def _draw_background(self):
+        """Dibuja el fondo con gradiente animado y elementos decorativos."""
+        # Gradiente animado base (período 2π en time_factor)
+        time_factor = self.animation_timer * 0.5
+        k = int(time_factor / (2 * math.pi) * GRADIENT_KEYFRAMES) % GRADIENT_KEYFRAMES
+        color, alpha = self._gradient_keyframes[k]
+        self._gradient.fill(color)
+        self._gradient.set_alpha(alpha)
+        self.screen.blit(self._gradient, (0, 0))
+
+        # Puntos y líneas pre-renderizados
+        self.screen.blit(self._pattern, (0, 0))
 
     def _draw_title(self):
         """Dibuja el título principal."""
-        title_text = "Algoritmos Genéticos"
-        subtitle_text = "Selecciona una simulación"
-
         # Título principal
-        title = self.title_font.render(title_text, True, self.colors['text'])
-        title_rect = title.get_rect(center=(self.screen_size[0] // 2, 120))
-        self.screen.blit(title, title_rect)
+        title_rect = self._title.get_rect(center=(self.screen_size[0] // 2, 120))
+        self.screen.blit(self._title, title_rect)
 
         # Subtítulo
-        subtitle = self.subtitle_font.render(subtitle_text, True, self.colors['accent'])
-        subtitle_rect = subtitle.get_rect(center=(self.screen_size[0] // 2, 170))
-        self.screen.blit(subtitle, subtitle_rect)
+        subtitle_rect = self._subtitle.get_rect(center=(self.screen_size[0] // 2, 170))
+        self.screen.blit(self._subtitle, subtitle_rect)
 
     def _draw_buttons(self, dt):
         """Dibuja todos los botones."""
@@ -262,31 +315,60 @@ class MainMenu:
             button.update(dt)
             button.draw(self.screen)
 
+    # --- Escena ---
+
+    def enter(self):
+        """Reinicia la selección y tapa lo que haya dejado la escena anterior."""
+        self.running = True
+        self.selected_option = None
+        for button in self.buttons:
+            # El hover del clic que nos sacó del menú ya no vale
+            button.is_hovered = False
+            button.animation_progress = 0.0
+        self.screen.fill(self.colors['background'][0])
+
+    def handle_event(self, event):
+        for button in self.buttons:
+            button.handle_event(event)
+        if not self.running:
+            self.next_scene = self.selected_option
+
+    def update(self, elapsed_ms):
+        self._dt = elapsed_ms / 1000.0
+        self.animation_timer += self._dt
+
+    def draw(self):
+        self._draw_background()
+        self._draw_title()
+        self._draw_buttons(self._dt)
+        pygame.display.flip()
+
     def run(self, screen):
-        """Ejecuta el menú principal."""
+        """Ejecuta el menú principal con su propio bucle; retorna la opción elegida."""
         self.init_pygame(screen)
+        self.enter()
 
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
-            self.animation_timer += dt
+            elapsed_ms = self.clock.tick(60)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    self.selected_option = "exit"
+                    self.selected_option = EXIT
                     self.running = False
                 else:
-                    for button in self.buttons:
-                        button.handle_event(event)
+                    self.handle_event(event)
 
-            # Dibujar
-            self._draw_background()
-            self._draw_title()
-            self._draw_buttons(dt)
-
-            pygame.display.flip()
+            self.update(elapsed_ms)
+            self.draw()
 
         return self.selected_option
 
+def create_menu_scene(screen):
+    """Fábrica para SceneManager: menú listo para dibujar sobre 'screen'."""
+    menu = MainMenu(screen.get_size())
+    menu.init_pygame(screen)
+    return menu
+
 def show_main_menu(screen):
     """Función de conveniencia para mostrar el menú."""
     menu = MainMenu(screen.get_size())
@@ -0,0 +1,283 @@
+"""
+parachute_physics.py
+Núcleo de física y fitness del paracaidista, sin dependencia de pygame.
+ParachutistModel simula un individuo; simular_poblacion/muestrear_poblacion
+evalúan toda una población a la vez con NumPy y muestrear_poblacion_crn lo hace
+con números aleatorios comunes a todos los individuos. El render vive en parachutist.py.
+Ejecutar 'python parachute_physics.py' compara estadísticamente ambos caminos.
+"""
+import math
+import random
+import numpy as np
+from profiling import instrumentar
+
+GROUND_Y = 520  # y en píxeles del "suelo"
+START_Y = -40   # altura inicial del paracaidista
+MAX_STEPS = 1000
+ELEMENTOS_POR_BLOQUE = 2 ** 21  # sorteos por bloque del muestreo cerrado (16 MiB de float64)
+
+
+class ParachutistModel:
+    """
+    Estado físico de un paracaidista que cae.
+    Genes: V (velocidad de caída), B (balanceo lateral), S (estabilidad), F
+    """
+
+    def __init__(self, genes: dict, x: int, y: int = START_Y):
+        self.genes = genes
+        self.x = float(x)
+        self.y = float(y)
+        self.vy = 0.0
+        self.vx = 0.0
+        self.angle = 0.0
+        self.landed = False
+
+    @classmethod
+    def from_genes(cls, genes: dict, start_x: int):
+        """Crear instancia a partir de genes y posición inicial X."""
+        return cls(genes=genes.copy(), x=start_x, y=START_Y)
+
+    @instrumentar
+    def step_physics(self, dt=1.0):
+        """Actualiza la física sencilla del paracaidista."""
+        g_base = self.genes["V"]
+        self.vy += g_base * 0.6 * dt
+        drift = self.genes["B"] * (0.6 + 0.4 * random.random())
+        self.vx += drift * dt
+        ang_speed = (1.2 - self.genes["S"]) * (random.random() - 0.5)
+        self.angle += ang_speed * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+    @instrumentar
+    def simulate(self, ground_y=GROUND_Y, max_steps=MAX_STEPS, target_x=400):
+        """
+        Simula la caída hasta tocar suelo por el camino rápido (_simulate_fast),
+        equivalente en distribución al bucle de step_physics.
+        Retorna dict con fitness (mayor es mejor) y solution_found: bool.
+        """
+        self._simulate_fast(ground_y, max_steps, target_x)
+        return self._evaluate()
+
+    def iter_steps(self, ground_y=GROUND_Y, max_steps=MAX_STEPS, target_x=400):
+        """
+        Generador paso a paso: cada next() avanza un paso fijo de física.
+        Al tocar suelo marca 'landed' y retorna el resultado (StopIteration.value).
+        """
+        steps = 0
+        while self.y < ground_y and steps < max_steps:
+            self.step_physics(dt=1.0)
+            self.x = target_x   # Mantener X fijo en el centro
+            steps += 1
+            yield steps
+        self.landed = True
+        return self._evaluate()
+
+    def _simulate_fast(self, ground_y, max_steps, target_x):
+        """
+        Avanza hasta el aterrizaje sin recorrer los pasos: la cantidad de pasos sale
+        de forma analítica y el ángulo final se sortea de su distribución.
+        vx no se actualiza porque no interviene en el resultado (x queda fija al centro).
+        """
+        n = pasos_hasta_suelo(self.genes["V"], self.y, self.vy, ground_y, max_steps)
+        if n == 0:
+            return
+        a = self.genes["V"] * 0.6
+        self.y += n * self.vy + a * n * (n + 1) / 2
+        self.vy += a * n
+        self.angle += muestrear_angulo(n, self.genes["S"])
+        self.x = target_x
+
+    def _evaluate(self):
+        """Evaluación al aterrizar (solo se mide ángulo)."""
+        angle_penalty = abs(self.angle)
+
+        fitness = max(0.0, (0.6 - angle_penalty))
+        fitness += 0.5 * self.genes.get("S", 0.0)
+        fitness += 0.3 * self.genes.get("F", 0.0)
+
+        return {"fitness": fitness, "x": self.x, "angle": self.angle, "solution_found": fitness > 0.95}
+
+
+def fitness_desde_angulo(angle, S, F):
+    """Fitness vectorizado a partir del ángulo final y de los genes S y F."""
+    fitness = np.maximum(0.0, 0.6 - np.abs(angle))
+    fitness += 0.5 * S
+    fitness += 0.3 * F
+    return fitness
+
+
+def simular_poblacion(genes, ground_y=GROUND_Y, y0=START_Y, max_steps=MAX_STEPS, rng=None):
+    """
+    Simula la caída de todos los individuos juntos.
+    'genes' es un arreglo (N, 4) con columnas V, B, S, F.
+    Cada paso avanza vy/vx/angle de los individuos que siguen en el aire;
+    los que ya aterrizaron quedan enmascarados.
+    Retorna el vector de fitness (N,).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    genes = np.asarray(genes, dtype=np.float64).reshape(-1, 4)
+    n = genes.shape[0]
+    V, B, S, F = genes[:, 0], genes[:, 1], genes[:, 2], genes[:, 3]
+
+    y = np.full(n, float(y0))
+    vy = np.zeros(n)
+    vx = np.zeros(n)
+    angle = np.zeros(n)
+
+    activos = np.flatnonzero(y < ground_y)
+    steps = 0
+    while activos.size and steps < max_steps:
+        vy[activos] += V[activos] * 0.6
+        vx[activos] += B[activos] * (0.6 + 0.4 * rng.random(activos.size))
+        angle[activos] += (1.2 - S[activos]) * (rng.random(activos.size) - 0.5)
+        y[activos] += vy[activos]
+        # Solo siguen los que aún no tocan el suelo
+        activos = activos[y[activos] < ground_y]
+        steps += 1
+
+    return fitness_desde_angulo(angle, S, F)
+
+
+# --- Muestreo cerrado ---
+# En step_physics vy crece exactamente V*0.6 por paso, así que la cantidad de pasos
+# hasta el suelo sólo depende de V y de la posición inicial. El ángulo final es la
+# suma de esa cantidad de sorteos (1.2 - S) * (U - 0.5) con U ~ Uniforme(0, 1).
+# Con a = V*0.6 <= 0 el paracaidista nunca baja: el tiempo de aterrizaje es
+# max_steps y su ángulo suma max_steps sorteos, por eso los bloques se dimensionan
+# por cantidad de sorteos (ELEMENTOS_POR_BLOQUE) y no por filas fijas.
+
+def pasos_hasta_suelo(V, y0=START_Y, vy0=0.0, ground_y=GROUND_Y, max_steps=MAX_STEPS):
+    """
+    Número de pasos que ejecuta el bucle de simulate() antes de tocar el suelo.
+    Tras n pasos: y_n = y0 + n*vy0 + a*n*(n+1)/2, con a = V*0.6.
+    """
+    if y0 >= ground_y:
+        return 0
+    a = V * 0.6
+    b = vy0 + a / 2
+    c = y0 - ground_y
+    if a > 0:
+        n = math.ceil((-b + math.sqrt(b * b - 2 * a * c)) / a)
+    elif b > 0:
+        n = math.ceil(-c / b)
+    else:
+        return max_steps
+    # Corrección por redondeo: n es el primer paso con y_n >= ground_y
+    n = max(n, 1)
+    if n > 1 and y0 + (n - 1) * b + a * (n - 1) ** 2 / 2 >= ground_y:
+        n -= 1
+    elif y0 + n * b + a * n * n / 2 < ground_y:
+        n += 1
+    return min(n, max_steps)
+
+
+def muestrear_angulo(n, S, rnd=random):
+    """Ángulo final tras n pasos: suma de n sorteos (1.2 - S) * (U - 0.5)."""
+    rand = rnd.random
+    return (1.2 - S) * (sum(rand() for _ in range(n)) - 0.5 * n)
+
+
+def pasos_hasta_suelo_poblacion(V, y0=START_Y, ground_y=GROUND_Y, max_steps=MAX_STEPS):
+    """Versión vectorizada de pasos_hasta_suelo para individuos que parten en reposo."""
+    V = np.asarray(V, dtype=np.float64)
+    if y0 >= ground_y:
+        return np.zeros(V.shape, dtype=np.int64)
+    a = V * 0.6
+    c = y0 - ground_y
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = np.ceil((-a / 2 + np.sqrt(a * a / 4 - 2 * a * c)) / a)
+    n = np.where(a > 0, n, max_steps)
+    n = np.maximum(n, 1)
+    # Misma corrección por redondeo que la versión escalar
+    antes = y0 + a * (n - 1) * n / 2
+    n = np.where((n > 1) & (antes >= ground_y), n - 1, n)
+    despues = y0 + a * n * (n + 1) / 2
+    n = np.where(despues < ground_y, n + 1, n)
+    return np.minimum(n, max_steps).astype(np.int64)
+
+
+@instrumentar
+def muestrear_poblacion(genes, ground_y=GROUND_Y, y0=START_Y, max_steps=MAX_STEPS, rng=None):
+    """
+    Equivalente en distribución a simular_poblacion, pero sin recorrer los pasos:
+    calcula los pasos de aterrizaje de forma analítica y sortea el ángulo final.
+    Retorna el vector de fitness (N,).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    genes = np.asarray(genes, dtype=np.float64).reshape(-1, 4)
+    pasos = pasos_hasta_suelo_poblacion(genes[:, 0], y0, ground_y, max_steps)
+    angle = np.zeros(genes.shape[0])
+    filas = max(1, ELEMENTOS_POR_BLOQUE // max(1, int(pasos.max(initial=0))))
+    for inicio in range(0, genes.shape[0], filas):
+        fin = min(inicio + filas, genes.shape[0])
+        n = pasos[inicio:fin]
+        columnas = int(n.max()) if n.size else 0
+        u = rng.random((fin - inicio, columnas))
+        # Sólo cuentan los primeros n[i] sorteos de cada fila
+        u[np.arange(columnas) >= n[:, None]] = 0.5
+        angle[inicio:fin] = (1.2 - genes[inicio:fin, 2]) * (u.sum(axis=1) - 0.5 * columnas)
+    return fitness_desde_angulo(angle, genes[:, 2], genes[:, 3])
+
+
+def muestrear_poblacion_crn(genes, muestras=1, ground_y=GROUND_Y, y0=START_Y, max_steps=MAX_STEPS, rng=None):
+    """
+    Muestreo con números aleatorios comunes: la muestra r de todos los individuos usa
+    la misma secuencia de sorteos U_1, U_2, ..., así las diferencias de fitness dentro
+    de la generación no dependen de quién tuvo más suerte. Cada individuo por separado
+    tiene la misma distribución que en muestrear_poblacion.
+    Retorna la matriz de fitness (muestras, N).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    genes = np.asarray(genes, dtype=np.float64).reshape(-1, 4)
+    pasos = pasos_hasta_suelo_poblacion(genes[:, 0], y0, ground_y, max_steps)
+    columnas = int(pasos.max()) if pasos.size else 0
+    # acumulado[r, k] = suma de los primeros k sorteos (U - 0.5) de la muestra r
+    acumulado = np.zeros((muestras, columnas + 1))
+    np.cumsum(rng.random((muestras, columnas)) - 0.5, axis=1, out=acumulado[:, 1:])
+    angle = (1.2 - genes[:, 2]) * acumulado[:, pasos]
+    return fitness_desde_angulo(angle, genes[:, 2], genes[:, 3])
+
+
+def _estadistico_ks(a, b):
+    """Estadístico de Kolmogorov-Smirnov de dos muestras."""
+    a = np.sort(a)
+    b = np.sort(b)
+    valores = np.concatenate([a, b])
+    cdf_a = np.searchsorted(a, valores, side="right") / a.size
+    cdf_b = np.searchsorted(b, valores, side="right") / b.size
+    return float(np.max(np.abs(cdf_a - cdf_b)))
+
+
+def verificar_equivalencia(muestras=4000, semilla=0):
+    """
+    Compara el muestreo cerrado contra el bucle paso a paso para varios cromosomas.
+    Retorna True si ninguna prueba KS rechaza la igualdad de distribuciones (alfa=0.001).
+    """
+    rng = np.random.default_rng(semilla)
+    cromosomas = [[1.5, 0.0, 0.0, 0.0], [3.0, 1.0, 0.5, 0.5], [6.0, -1.5, 1.0, 1.0], [2.2, 0.3, 0.9, 0.1]]
+    critico = 1.95 * math.sqrt(2.0 / muestras)
+    correcto = True
+    for cromosoma in cromosomas:
+        genes = np.tile(cromosoma, (muestras, 1))
+        # Los pasos analíticos deben coincidir con el bucle
+        y, vy, pasos = float(START_Y), 0.0, 0
+        while y < GROUND_Y and pasos < MAX_STEPS:
+            vy += cromosoma[0] * 0.6
+            y += vy
+            pasos += 1
+        referencia = simular_poblacion(genes, rng=rng)
+        d = _estadistico_ks(referencia, muestrear_poblacion(genes, rng=rng))
+        # Con números comunes cada individuo debe conservar su distribución
+        d_crn = _estadistico_ks(referencia, muestrear_poblacion_crn([cromosoma], muestras, rng=rng)[:, 0])
+        ok = pasos == pasos_hasta_suelo(cromosoma[0]) and d < critico and d_crn < critico
+        print(f"{cromosoma}: pasos={pasos} KS={d:.4f} KS_crn={d_crn:.4f} (crítico {critico:.4f}) {'OK' if ok else 'FALLA'}")
+        correcto = correcto and ok
+    return correcto
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if verificar_equivalencia() else 1)
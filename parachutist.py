@@ -1,16 +1,62 @@
 """
 parachutist.py
 Clase Parachutist con genes y simulación visual usando sprites.
+La física y el fitness están en parachute_physics.py; aquí sólo se agrega el render.
 """
 import math
 import pygame
-import random
 import os
+from collections import OrderedDict
+from parachute_physics import ParachutistModel, MAX_STEPS
+from profiling import instrumentar
 
 
-class Parachutist:
+class RotationCache:
     """
-    Parachutist representa un individuo físico que cae.
+    Frames pre-rotados de una imagen en ángulos cuantizados (step_deg grados).
+    Se llenan a demanda y se descartan por LRU al superar max_bytes, así la
+    memoria queda acotada aunque el paso sea fino (p. ej. 1°).
+    """
+
+    def __init__(self, image, step_deg=1.0, max_bytes=8 * 1024 * 1024):
+        self.image = image
+        self.step_deg = step_deg
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._frames = OrderedDict()  # índice -> (superficie, (mitad_ancho, mitad_alto))
+
+    def __len__(self):
+        return len(self._frames)
+
+    def get(self, angle_rad):
+        """Frame más cercano al ángulo y el desplazamiento de su centro."""
+        indice = round(math.degrees(angle_rad) / self.step_deg) % round(360 / self.step_deg)
+        frame = self._frames.get(indice)
+        if frame is not None:
+            self._frames.move_to_end(indice)
+            return frame
+        rotated = pygame.transform.rotate(self.image, indice * self.step_deg)
+        frame = (rotated, (rotated.get_width() // 2, rotated.get_height() // 2))
+        self._frames[indice] = frame
+        self.bytes += self._size(rotated)
+        while self.bytes > self.max_bytes and len(self._frames) > 1:
+            _, (viejo, _) = self._frames.popitem(last=False)
+            self.bytes -= self._size(viejo)
+        return frame
+
+    def blit(self, screen, angle_rad, center):
+        """Dibuja el frame cacheado centrado en 'center'; retorna el rect ocupado."""
+        rotated, (ox, oy) = self.get(angle_rad)
+        return screen.blit(rotated, (center[0] - ox, center[1] - oy))
+
+    @staticmethod
+    def _size(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class Parachutist(ParachutistModel):
+    """
+    Parachutist representa un individuo físico que cae, con su representación en pantalla.
     Genes: V (velocidad de caída), B (balanceo lateral), S (estabilidad)
     """
 
@@ -18,52 +64,36 @@ class Parachutist:
     HEIGHT = 48 * 2
     parachute_img = None
     dust_img = None
-
-    def __init__(self, genes: dict, x: int, y: int = -40):
-        self.genes = genes
-        self.x = float(x)
-        self.y = float(y)
-        self.vy = 0.0
-        self.vx = 0.0
-        self.angle = 0.0
-        self.landed = False
-
-        # Cargar imágenes solo una vez
-        if Parachutist.parachute_img is None:
-            assets_path = os.path.join("assets", "parachute.png")
-            if os.path.exists(assets_path):
-                img = pygame.image.load(assets_path).convert_alpha()
-                Parachutist.parachute_img = pygame.transform.scale(img, (self.WIDTH, self.HEIGHT))
-            else:
-                Parachutist.parachute_img = None
-
-        if Parachutist.dust_img is None:
-            dust_path = os.path.join("assets", "dust.png")
-            if os.path.exists(dust_path):
-                img = pygame.image.load(dust_path).convert_alpha()
-                Parachutist.dust_img = pygame.transform.scale(img, (100, 80))
-            else:
-                Parachutist.dust_img = None
+    rotation_cache = None
+    use_rotation_cache = True  # False: rotar en cada frame (sólo para comparar en benchmarks)
+    _images_loaded = False
 
     @classmethod
-    def from_genes(cls, genes: dict, start_x: int):
-        """Crear instancia a partir de genes y posición inicial X."""
-        return cls(genes=genes.copy(), x=start_x, y=-40)
-
-    def step_physics(self, dt=1.0):
-        """Actualiza la física sencilla del paracaidista."""
-        g_base = self.genes["V"]
-        self.vy += g_base * 0.6 * dt
-        drift = self.genes["B"] * (0.6 + 0.4 * random.random())
-        self.vx += drift * dt
-        ang_speed = (1.2 - self.genes["S"]) * (random.random() - 0.5)
-        self.angle += ang_speed * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-
+    def load_images(cls):
+        """Carga los sprites una sola vez (requiere un display inicializado)."""
+        if cls._images_loaded:
+            return
+
+        assets_path = os.path.join("assets", "parachute.png")
+        if os.path.exists(assets_path):
+            img = pygame.image.load(assets_path).convert_alpha()
+            Parachutist.parachute_img = pygame.transform.scale(img, (cls.WIDTH, cls.HEIGHT))
+            Parachutist.rotation_cache = RotationCache(Parachutist.parachute_img)
+
+        dust_path = os.path.join("assets", "dust.png")
+        if os.path.exists(dust_path):
+            img = pygame.image.load(dust_path).convert_alpha()
+            Parachutist.dust_img = pygame.transform.scale(img, (100, 80))
+        # Recién ahora: si una carga falla (p. ej. sin display) se reintenta en el próximo render
+        cls._images_loaded = True
+
+    @instrumentar
     def render(self, screen):
         """Dibuja el paracaidista en pantalla."""
-        if Parachutist.parachute_img:
+        self.load_images()
+        if Parachutist.rotation_cache is not None and Parachutist.use_rotation_cache:
+            Parachutist.rotation_cache.blit(screen, self.angle, (int(self.x), int(self.y)))
+        elif Parachutist.parachute_img:
             rotated = pygame.transform.rotate(Parachutist.parachute_img, math.degrees(self.angle))
             rect = rotated.get_rect(center=(int(self.x), int(self.y)))
             screen.blit(rotated, rect.topleft)
@@ -73,59 +103,117 @@ class Parachutist:
             rect.center = (int(self.x), int(self.y))
             pygame.draw.rect(screen, (30, 144, 255), rect)
 
+    @instrumentar
     def render_dust(self, screen):
         """Renderiza la nube de polvo al fallar."""
+        self.load_images()
         if Parachutist.dust_img:
             rect = Parachutist.dust_img.get_rect(center=(int(self.x), int(self.y)))
             screen.blit(Parachutist.dust_img, rect.topleft)
         else:
             pygame.draw.circle(screen, (150, 150, 150), (int(self.x), int(self.y)), 20)
 
+    @instrumentar
     def simulate(self, screen=None, ground_y=520, render=False, ui=None):
         """
         Simula la caída hasta tocar suelo.
         Si 'render' es True y se pasa 'screen', dibuja la caída en pantalla.
         Retorna dict con fitness (mayor es mejor) y survived: bool.
+        Sin render se usa el camino rápido del modelo, equivalente en distribución.
         """
-        clock = pygame.time.Clock()
-        max_steps = 1000
-        steps = 0
         target_x = screen.get_width() // 2 if screen else 400
 
-        while self.y < ground_y and steps < max_steps:
-            # 🔥 Actualizar solo la física vertical
-            self.step_physics(dt=1.0)
-            self.x = target_x   # 🔥 Mantener X fijo en el centro
-            steps += 1
-
-            if render and screen:
-                if ui:
-                    ui.render_background()
-                    ui.render_panel()
-                else:
-                    screen.fill((200, 220, 255))
-                    pygame.draw.rect(screen, (50, 160, 70),
-                                    (0, ground_y, screen.get_width(), screen.get_height() - ground_y))
-                self.render(screen)
-                pygame.display.flip()
-                for ev in pygame.event.get():
-                    if ev.type == pygame.QUIT:
-                        pygame.quit()
-                        raise SystemExit
-                clock.tick(60)
-
-        # Evaluación al aterrizar (solo se mide ángulo)
-        dist_x = 0   # 🔥 Como ya no hay movimiento lateral, siempre centrado
-        angle_penalty = abs(self.angle)
-
-        fitness = max(0.0, (0.6 - angle_penalty))
-        fitness += 0.5 * self.genes.get("S", 0.0)
-        fitness += 0.3 * self.genes.get("F", 0.0)
-
-        if render and screen:
-            if fitness <= 0.95:  # No aterrizaje correcto
-                self.render_dust(screen)
+        if not (render and screen):
+            return super().simulate(ground_y=ground_y, max_steps=MAX_STEPS, target_x=target_x)
+
+        # Versión bloqueante; el bucle principal usa SimulationScheduler para no congelar la ventana
+        clock = pygame.time.Clock()
+        steps = self.iter_steps(ground_y, MAX_STEPS, target_x)
+
+        while True:
+            try:
+                next(steps)
+            except StopIteration as fin:
+                result = fin.value
+                break
+
+            if ui:
+                ui.render_background()
+                ui.render_panel()
+            else:
+                screen.fill((200, 220, 255))
+                pygame.draw.rect(screen, (50, 160, 70),
+                                (0, ground_y, screen.get_width(), screen.get_height() - ground_y))
+            self.render(screen)
             pygame.display.flip()
-            pygame.time.delay(700)
+            for ev in pygame.event.get():
+                if ev.type == pygame.QUIT:
+                    pygame.quit()
+                    raise SystemExit
+            clock.tick(60)
+
+        if result["fitness"] <= 0.95:  # No aterrizaje correcto
+            self.render_dust(screen)
+        pygame.display.flip()
+        pygame.time.delay(700)
+
+        return result
+
 
-        return {"fitness": fitness, "x": self.x, "angle": self.angle, "solution_found": fitness > 0.95}
+class ParachutistSprite(pygame.sprite.Sprite):
+    """
+    Sprite de un Parachutist para dibujar muchos a la vez con pygame.sprite.Group.
+    La imagen sale de la caché de rotaciones y sólo se vuelve a buscar si cambia el ángulo.
+    """
+
+    _fallback_img = None
+
+    def __init__(self, parachutist, *groups):
+        super().__init__(*groups)
+        self.parachutist = parachutist
+        self._angle = None
+        self.update()
+
+    @classmethod
+    def _base_image(cls):
+        Parachutist.load_images()
+        if Parachutist.parachute_img:
+            return Parachutist.parachute_img
+        if cls._fallback_img is None:
+            # fallback: rectángulo azul
+            cls._fallback_img = pygame.Surface((Parachutist.WIDTH, Parachutist.HEIGHT))
+            cls._fallback_img.fill((30, 144, 255))
+        return cls._fallback_img
+
+    @instrumentar
+    def update(self):
+        """Sincroniza imagen y posición con el modelo."""
+        p = self.parachutist
+        if p.angle != self._angle:
+            self._angle = p.angle
+            base = self._base_image()
+            if Parachutist.rotation_cache is not None and Parachutist.use_rotation_cache:
+                self.image, self._offset = Parachutist.rotation_cache.get(p.angle)
+            else:
+                self.image = pygame.transform.rotate(base, math.degrees(p.angle))
+                self._offset = (self.image.get_width() // 2, self.image.get_height() // 2)
+        ox, oy = self._offset
+        self.rect = pygame.Rect(int(p.x) - ox, int(p.y) - oy, self.image.get_width(), self.image.get_height())
+
+
+class DustSprite(pygame.sprite.Sprite):
+    """Nube de polvo sobre un paracaidista que falló el aterrizaje."""
+
+    _fallback_img = None
+
+    def __init__(self, parachutist, *groups):
+        super().__init__(*groups)
+        Parachutist.load_images()
+        if Parachutist.dust_img:
+            self.image = Parachutist.dust_img
+        else:
+            if DustSprite._fallback_img is None:
+                DustSprite._fallback_img = pygame.Surface((40, 40), pygame.SRCALPHA)
+                pygame.draw.circle(DustSprite._fallback_img, (150, 150, 150), (20, 20), 20)
+            self.image = DustSprite._fallback_img
+        self.rect = self.image.get_rect(center=(int(parachutist.x), int(parachutist.y)))
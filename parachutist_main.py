@@ -1,153 +1,218 @@
 """
 parachutist_main.py
-Script independiente para ejecutar la simulación del paracaidista en una nueva ventana.
+Simulación del paracaidista como escena (ParachutistScene). Se puede ejecutar
+sola en su propia ventana o dentro del SceneManager de main.py.
 """
 import sys
+import time
+import argparse
 import pygame
-import random
-from ui import UI
-from genetic_algorithm import getPoblacion, seleccion, cruce, mutacion, calcularAdaptacion, tamanoPoblacion, iteraciones
-from parachutist import Parachutist
+from ui import UI, get_font
+from genetic_algorithm import (getPoblacion, siguienteGeneracion, tamanoPoblacion,
+                               cache_adaptacion, PopulationState, bounds)
+from parachutist import Parachutist, ParachutistSprite, DustSprite
+from simulation_scheduler import SimulationScheduler
+from scenes import Scene, SceneManager
+from telemetry import Telemetry, TelemetrySink
+import profiling
 
 FPS = 60
 SCREEN_SIZE = (900, 600)
 GROUND_Y = 520  # y en píxeles del "suelo"
 
 
-def main():
-    """Función principal para la simulación del paracaidista."""
-    pygame.init()
-    screen = pygame.display.set_mode(SCREEN_SIZE)
-    pygame.display.set_caption("Paracaidista - Algoritmo Genético")
-    clock = pygame.time.Clock()
-
-    # UI y GA
-    ui = UI(screen, ground_y=GROUND_Y, show_back_button=False)  # No back button en ventana separada
-    poblacion = []
-    generacion = 0
-    solution_found = False
-    running_simulation = False
-    max_generations = 100  # Límite máximo de generaciones para evitar bucles infinitos
-    last_parachute = None  # Para mantener la simulación en pantalla
-
-    running = True
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            ui.handle_event(event)
+def lane_x(i, n, sky_width):
+    """Posición x del carril i de n cuando toda la generación cae a la vez."""
+    return int((i + 0.5) * sky_width / n)
+
+
+class ParachutistScene(Scene):
+    """
+    Escena de la simulación del paracaidista.
+    Población, fitness y sprites viven en la escena y se conservan al volver al menú.
+    """
+
+    caption = "Paracaidista - Algoritmo Genético"
+
+    def __init__(self, screen, show_back_button=False, telemetry_sink=None):
+        super().__init__()
+        self.screen = screen
+        # UI y GA
+        self.ui = UI(screen, ground_y=GROUND_Y, show_back_button=show_back_button,
+                     back_callback=self._on_back)
+        self.estado = PopulationState()  # población y fitness cacheados para el render
+        self.scheduler = SimulationScheduler(ground_y=GROUND_Y)
+        # Sprites del lote en pantalla: se dibujan en una sola pasada por grupo y
+        # ui.compose sólo publica los rectángulos que cambiaron
+        self.sprites = pygame.sprite.RenderUpdates()
+        self.dust = pygame.sprite.RenderUpdates()
+        self.overlay = pygame.sprite.RenderUpdates()  # último paracaidista y mensaje de éxito
+        self.shown = None
+        self.generacion = 0
+        self.solution_found = False
+        self.running_simulation = False
+        self.max_generations = 100  # Límite máximo de generaciones para evitar bucles infinitos
+        self.success_font = get_font("Arial", 28, bold=True)
+        # Últimas generaciones para el panel; con sink, además se guardan todas en disco
+        self.telemetria = Telemetry(capacidad=256, sink=telemetry_sink, rangos=[b - a for a, b in bounds])
+        self.ui.telemetry = self.telemetria
+        self._inicio_generacion = time.perf_counter()
+        self.generacion_ga = 0  # generaciones evolucionadas (self.generacion cuenta también cada aterrizaje)
+
+    def _on_back(self):
+        self.next_scene = "menu"
+
+    def enter(self):
+        # La pantalla la dejó otra escena: el próximo frame se publica completo
+        self.ui.invalidate()
+
+    def handle_event(self, event):
+        self.ui.handle_event(event)
+
+    def update(self, elapsed_ms):
+        ui, estado, scheduler = self.ui, self.estado, self.scheduler
 
         # Botones
+        if ui.clicked_speed:
+            ui.clicked_speed = False
+            scheduler.cycle_speed()
+            ui.set_speed_label(scheduler.speed_label)
+
+        if ui.clicked_mode:
+            ui.clicked_mode = False
+            scheduler.toggle_mode()
+            ui.set_mode_label(scheduler.mode_label)
+
         if ui.clicked_setup:
             # Genera población inicial
-            poblacion = getPoblacion(tamanoPoblacion)
-            # Convertir a ParIndividual para UI
-            from genetic_algorithm import ParIndividual
-            ui_population = [ParIndividual(ind) for ind in poblacion]
-            for ind in ui_population:
-                ind.fitness = calcularAdaptacion(ind.cromosoma)
-            ui.set_population(ui_population)
-            generacion = 0
-            ui.generation = generacion
-            solution_found = False
-            last_parachute = None
+            scheduler.stop()
+            self.running_simulation = False
+            estado.set_poblacion(getPoblacion(tamanoPoblacion))
+            ui.set_population(estado.ui_population)
+            self.generacion = 0
+            self.generacion_ga = 0
+            ui.generation = self.generacion
+            self.solution_found = False
+            self.overlay.empty()
             ui.clicked_setup = False
 
         if ui.clicked_run:
             ui.clicked_run = False
-            if solution_found:
+            if self.solution_found:
                 print("Solución ya encontrada. Presiona Setup para reiniciar.")
-                continue
-            if not poblacion:
+            elif not estado.poblacion:
                 print("Primero presiona Setup para generar la población inicial.")
-                continue
-            # Iniciar simulación automática
-            running_simulation = True
-            generacion = 0  # Iniciar con generación 0  
-            ui.generation = generacion
-            solution_found = False
-
-        if running_simulation and not solution_found and generacion < max_generations:
-            # Convertir a ParIndividual para UI
-            ui_population = [ParIndividual(ind) for ind in poblacion]
-            # Simular y evaluar cada individuo (con render)
-            fitnesses = []
-            for i, ind in enumerate(poblacion):
-                # Ejecutar una generación
-                generacion += 1
-                ui.generation = generacion
-                # Crear instancia visual de Parachutist con genes
-                genes_dict = {'V': ind[0], 'B': ind[1], 'S': ind[2], 'F': ind[3]}
-                parachute = Parachutist.from_genes(genes_dict, start_x=SCREEN_SIZE[0] // 2)
-                # Simula con render callback para ver caída
-                result = parachute.simulate(
-                    screen=screen,
-                    ground_y=GROUND_Y,
-                    render=True,
-                    ui=ui
+            elif not self.running_simulation:
+                # Iniciar simulación automática
+                self.running_simulation = True
+                self.generacion = 0  # Iniciar con generación 0
+                ui.generation = self.generacion
+
+        if self.running_simulation and not scheduler.busy:
+            if self.generacion >= self.max_generations:
+                self.running_simulation = False
+                print(f"No se encontró solución en {self.max_generations} generaciones. Presiona Setup para reiniciar.")
+            else:
+                # Encolar la generación actual: de a uno al centro, o todos en carriles
+                ui.set_population(estado.ui_population)
+                self._inicio_generacion = time.perf_counter()
+                n = len(estado.poblacion)
+                scheduler.start(
+                    (i, Parachutist.from_genes({'V': ind[0], 'B': ind[1], 'S': ind[2], 'F': ind[3]},
+                                               start_x=lane_x(i, n, ui.panel_rect.x) if scheduler.simultaneous
+                                               else self.screen.get_width() // 2))
+                    for i, ind in enumerate(estado.poblacion)
                 )
-                fitness = result["fitness"]
-                fitnesses.append(fitness)
-                ui_population[i].fitness = fitness
-                # Actualizar panel en tiempo real
-                ui.set_population(ui_population)
-                ui.render_panel()
-                pygame.display.flip()
-                # Mostrar valores en cada generación
-                print(f"Generación {generacion}: V={genes_dict['V']:.2f}, B={genes_dict['B']:.2f}, S={genes_dict['S']:.2f}, F={genes_dict['F']:.2f}, Fitness={fitness:.2f}")
-                if result.get("solution_found", False):
-                    last_parachute = parachute
-                    solution_found = True
-                    running_simulation = False
-                    print(f"¡Solución encontrada en generación {generacion}!")
-                    break  # Detener simulación de la generación actual
 
+        # Física con paso fijo según el tiempo real y la velocidad elegida
+        for i, parachute, result in scheduler.update(elapsed_ms):
+            self.generacion += 1
+            ui.generation = self.generacion
+            # Lo que se muestra (panel, polvo, mensaje de éxito) es esta corrida visual;
+            # además se suma como una muestra más al fitness promedio que usa la selección
+            fitness = result["fitness"]
+            cache_adaptacion.add_sample(estado.poblacion[i], fitness)
+            estado.set_fitness(i, fitness)
+            genes_dict = parachute.genes
+            if fitness <= 0.95:  # No aterrizaje correcto
+                DustSprite(parachute, self.dust)
+            # Mostrar valores en cada generación
+            print(f"Generación {self.generacion}: V={genes_dict['V']:.2f}, B={genes_dict['B']:.2f}, S={genes_dict['S']:.2f}, F={genes_dict['F']:.2f}, Fitness={fitness:.2f}")
+            if result["solution_found"]:
+                # Mantener el paracaidista ganador en pantalla con el mensaje
+                ParachutistSprite(parachute, self.overlay)
+                banner = pygame.sprite.Sprite(self.overlay)
+                banner.image = self.success_font.render("¡Buen trabajo!", True, (0, 120, 0))
+                banner.rect = banner.image.get_rect(topleft=(self.screen.get_width() // 2 - 80, GROUND_Y - 60))
+                self.solution_found = True
+                self.running_simulation = False
+                scheduler.stop()
+                print(f"¡Solución encontrada en generación {self.generacion}!")
+                break  # Detener simulación de la generación actual
+
+        if self.running_simulation and not scheduler.busy:
             # Después de procesar toda la población, mostrar valores del mejor individuo
-            if ui_population:
-                best = max(ui_population, key=lambda p: p.fitness)
-                print(f"Generación {generacion + 1}: V={best.genes['V']:.2f}, B={best.genes['B']:.2f}, S={best.genes['S']:.2f}, F={best.genes['F']:.2f}, Fitness={best.fitness:.2f}")
-
-            if not solution_found:
-                # Evolución
-                seleccionados = seleccion(poblacion)
-                nuevaPoblacion = []
-                while len(nuevaPoblacion) < tamanoPoblacion:
-                    padres = random.sample(seleccionados, 2)
-                    hijos = cruce(padres[0], padres[1])
-                    hijos = [mutacion(h) for h in hijos]
-                    nuevaPoblacion.extend(hijos)
-                poblacion = nuevaPoblacion[:tamanoPoblacion]
-                # Incrementar generación después de evolución
-                generacion += 1
-                ui.generation = generacion
-            elif generacion >= max_generations:
-                running_simulation = False
-                print(f"No se encontró solución en {max_generations} generaciones. Presiona Setup para reiniciar.")
-
-        # Render UI base cuando no estamos en la corrida
-        ui.render_background()
-        if last_parachute:
-            last_parachute.render(screen)
-        if solution_found:
-            font = pygame.font.SysFont("Arial", 28, bold=True)
-            txt = font.render("¡Buen trabajo!", True, (0, 120, 0))
-            screen.blit(txt, (SCREEN_SIZE[0] // 2 - 80, GROUND_Y - 60))
-        if poblacion:
-            ui_population = [ParIndividual(ind) for ind in poblacion]
-            for ind in ui_population:
-                ind.fitness = calcularAdaptacion(ind.cromosoma)
-            ui.render_population_preview(ui_population)
-        else:
-            ui.render_population_preview([])
-        ui.render_panel()
-
-        pygame.display.flip()
-        clock.tick(FPS)
+            best = max(estado.ui_population, key=lambda p: p.fitness)
+            print(f"Generación {self.generacion + 1}: V={best.genes['V']:.2f}, B={best.genes['B']:.2f}, S={best.genes['S']:.2f}, F={best.genes['F']:.2f}, Fitness={best.fitness:.2f}")
+            # Evolución
+            inicio_operadores = time.perf_counter()
+            nueva = siguienteGeneracion(estado.poblacion, tamanoPoblacion)
+            # La evaluación de esta generación fue la caída visual de cada individuo
+            self.generacion_ga += 1
+            self.telemetria.record(self.generacion_ga, [p.fitness for p in estado.ui_population], estado.poblacion,
+                                   evaluaciones=len(estado.poblacion),
+                                   t_evaluacion=inicio_operadores - self._inicio_generacion,
+                                   t_operadores=time.perf_counter() - inicio_operadores)
+            estado.set_poblacion(nueva)
+            ui.set_population(estado.ui_population)
+            # Incrementar generación después de evolución
+            self.generacion += 1
+            ui.generation = self.generacion
+
+        if self.shown is not scheduler.shown:
+            # Cambió el lote en pantalla: rehacer los grupos de sprites
+            self.shown = scheduler.shown
+            self.sprites.empty()
+            self.dust.empty()
+            for _, parachute in self.shown:
+                ParachutistSprite(parachute, self.sprites)
+
+    def leave(self):
+        if self.telemetria.sink is not None:
+            self.telemetria.sink.flush()
+
+    def draw(self):
+        if self.scheduler.should_render():
+            self.sprites.update()
+            # El panel lee valores cacheados: no se simula nada en los frames ociosos
+            self.ui.compose(self.overlay, self.sprites, self.dust)
+
+
+def main(argv=None):
+    """Función principal para la simulación del paracaidista en su propia ventana."""
+    parser = argparse.ArgumentParser(description="Simulación del paracaidista")
+    parser.add_argument("--telemetria", metavar="RUTA", help="guardar la telemetría por generación (.jsonl o .csv)")
+    profiling.agregar_argumentos(parser)
+    args = parser.parse_args(argv)
+    sink = TelemetrySink(args.telemetria) if args.telemetria else None
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    manager = SceneManager(screen, fps=FPS)
+    # No back button en ventana separada
+    manager.register("parachutist", lambda s: ParachutistScene(s, show_back_button=False, telemetry_sink=sink))
+    if args.profile:
+        # En modo hooks el reporte agrega el costo por generación evolucionada
+        profiling.perfilar(lambda: manager.run("parachutist"), args.profile, args.profile_out,
+                           generaciones=lambda: manager.get("parachutist").generacion_ga)
+    else:
+        manager.run("parachutist")
+    if sink is not None:
+        sink.close()
 
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
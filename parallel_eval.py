@@ -0,0 +1,180 @@
+"""
+parallel_eval.py
+Evaluación de fitness repartida en un pool de procesos.
+
+La población se copia a un buffer de memoria compartida (multiprocessing.shared_memory)
+y cada worker lee sus genes y escribe sus fitness directamente ahí, sin serializar
+listas de listas en cada generación. Cada bloque recibe su propio flujo aleatorio
+derivado de una SeedSequence, así el resultado depende de la semilla y del tamaño
+de bloque, pero no de la cantidad de workers.
+
+Ejecutar 'python parallel_eval.py' compara el camino serial contra el paralelo.
+"""
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from parachute_physics import muestrear_poblacion
+
+GENES = 4
+TAMANO_BLOQUE = 4096  # individuos por tarea (fijo para que no dependa de los workers)
+
+# Segmentos compartidos abiertos en cada worker (se reutilizan entre generaciones)
+_adjuntos = {}
+
+
+def _adjuntar(*nombres):
+    """Abre los segmentos pedidos y cierra los de buffers ya reemplazados."""
+    for nombre in list(_adjuntos):
+        if nombre not in nombres:
+            _adjuntos.pop(nombre).close()
+    for nombre in nombres:
+        if nombre not in _adjuntos:
+            _adjuntos[nombre] = shared_memory.SharedMemory(name=nombre)
+    return [_adjuntos[nombre] for nombre in nombres]
+
+
+def _evaluar_bloque(nombre_genes, nombre_fitness, capacidad, inicio, fin, semilla):
+    """Evalúa las filas [inicio, fin) del buffer compartido (se ejecuta en el worker)."""
+    shm_genes, shm_fitness = _adjuntar(nombre_genes, nombre_fitness)
+    genes = np.ndarray((capacidad, GENES), dtype=np.float64, buffer=shm_genes.buf)
+    fitness = np.ndarray((capacidad,), dtype=np.float64, buffer=shm_fitness.buf)
+    rng = np.random.default_rng(semilla)
+    fitness[inicio:fin] = muestrear_poblacion(genes[inicio:fin], rng=rng)
+    return fin - inicio
+
+
+class ParallelEvaluator:
+    """Backend de evaluación con ProcessPoolExecutor y buffers compartidos."""
+
+    def __init__(self, workers=None, chunk_size=None, seed=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._semillas = np.random.SeedSequence(seed)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._capacidad = 0
+        self._shm_genes = None
+        self._shm_fitness = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _reservar(self, n):
+        """Crea (o agranda) los buffers compartidos para n individuos."""
+        if n <= self._capacidad:
+            return
+        self._liberar_buffers()
+        capacidad = max(n, 2 * self._capacidad)
+        self._shm_genes = shared_memory.SharedMemory(create=True, size=capacidad * GENES * 8)
+        self._shm_fitness = shared_memory.SharedMemory(create=True, size=capacidad * 8)
+        self._capacidad = capacidad
+
+    def _liberar_buffers(self):
+        for shm in (self._shm_genes, self._shm_fitness):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        self._shm_genes = self._shm_fitness = None
+        self._capacidad = 0
+
+    def _bloques(self, n):
+        tam = self.chunk_size or TAMANO_BLOQUE
+        return [(inicio, min(inicio + tam, n)) for inicio in range(0, n, tam)]
+
+    def evaluate(self, poblacion):
+        """Retorna el vector de fitness (N,) de la población."""
+        genes = np.asarray(poblacion, dtype=np.float64).reshape(-1, GENES)
+        n = genes.shape[0]
+        if n == 0:
+            return np.zeros(0)
+        self._reservar(n)
+        buf_genes = np.ndarray((self._capacidad, GENES), dtype=np.float64, buffer=self._shm_genes.buf)
+        buf_fitness = np.ndarray((self._capacidad,), dtype=np.float64, buffer=self._shm_fitness.buf)
+        buf_genes[:n] = genes
+
+        bloques = self._bloques(n)
+        semillas = self._semillas.spawn(len(bloques))
+        futuros = [
+            self._pool.submit(_evaluar_bloque, self._shm_genes.name, self._shm_fitness.name,
+                              self._capacidad, inicio, fin, semilla)
+            for (inicio, fin), semilla in zip(bloques, semillas)
+        ]
+        for futuro in futuros:
+            futuro.result()
+        return buf_fitness[:n].copy()
+
+    def getstate(self):
+        """Estado de la secuencia de semillas (entropía y bloques ya sembrados), guardable en JSON."""
+        return {"entropia": str(self._semillas.entropy), "sembrados": self._semillas.n_children_spawned}
+
+    def setstate(self, estado):
+        self._semillas = np.random.SeedSequence(int(estado["entropia"]),
+                                                n_children_spawned=estado["sembrados"])
+
+    def close(self):
+        self._pool.shutdown()
+        self._liberar_buffers()
+
+
+def benchmark(tamanos=(30, 300, 3000, 30000, 100000), workers=None, repeticiones=3):
+    """Compara evaluaciones/seg del camino serial contra el pool de procesos."""
+    resultados = []
+    with ParallelEvaluator(workers=workers, seed=0) as evaluador:
+        evaluador.evaluate(np.full((1, GENES), 3.0))  # calentar el pool
+        for n in tamanos:
+            rng = np.random.default_rng(n)
+            genes = rng.uniform([1.5, -1.5, 0.0, 0.0], [6.0, 1.5, 1.0, 1.0], size=(n, GENES))
+
+            t0 = time.perf_counter()
+            for _ in range(repeticiones):
+                muestrear_poblacion(genes, rng=rng)
+            serial = (time.perf_counter() - t0) / repeticiones
+
+            t0 = time.perf_counter()
+            for _ in range(repeticiones):
+                evaluador.evaluate(genes)
+            paralelo = (time.perf_counter() - t0) / repeticiones
+
+            resultados.append({"n": n, "serial_s": serial, "parallel_s": paralelo,
+                               "speedup": serial / paralelo if paralelo else 0.0})
+            print(f"N={n:>7}: serial {serial * 1000:8.2f} ms | "
+                  f"{evaluador.workers} workers {paralelo * 1000:8.2f} ms | x{serial / paralelo:.2f}")
+    return resultados
+
+
+def punto_de_equilibrio(evaluador, tamanos=(4096, 16384, 65536, 262144), repeticiones=3):
+    """
+    Menor tamaño de 'tamanos' desde el cual el pool es más rápido que el camino serial
+    en todos los tamaños siguientes; None si en esta máquina nunca lo supera.
+    """
+    evaluador.evaluate(np.full((1, GENES), 3.0))  # calentar el pool
+    gana = []
+    for n in tamanos:
+        rng = np.random.default_rng(n)
+        genes = rng.uniform([1.5, -1.5, 0.0, 0.0], [6.0, 1.5, 1.0, 1.0], size=(n, GENES))
+        serial = min(_cronometrar(lambda: muestrear_poblacion(genes, rng=rng)) for _ in range(repeticiones))
+        paralelo = min(_cronometrar(lambda: evaluador.evaluate(genes)) for _ in range(repeticiones))
+        gana.append(paralelo < serial)
+    for i, n in enumerate(tamanos):
+        if all(gana[i:]):
+            return n
+    return None
+
+
+def _cronometrar(fn):
+    inicio = time.perf_counter()
+    fn()
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de evaluación serial vs paralela")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(workers=args.workers, repeticiones=args.repeticiones)
@@ -0,0 +1,149 @@
+"""
+population.py
+Población compacta respaldada por arreglos NumPy y operadores genéticos por lotes.
+
+Los genes viven en un arreglo contiguo float64 (N, 4) con columnas V, B, S, F y el
+fitness en un vector (N,): 40 bytes por individuo. Selección, cruce y mutación se
+aplican a toda la generación de una vez, sin crear listas por individuo.
+"""
+import numpy as np
+import genetic_algorithm as ga
+from parachute_physics import muestrear_poblacion
+
+GENES = ("V", "B", "S", "F")
+
+
+class IndividualView:
+    """Vista liviana de un individuo de una Population (no copia los genes)."""
+
+    __slots__ = ("_population", "_index")
+
+    def __init__(self, population, index):
+        self._population = population
+        self._index = index
+
+    @property
+    def cromosoma(self):
+        return self._population.genes[self._index].tolist()
+
+    @property
+    def genes(self):
+        return dict(zip(GENES, self.cromosoma))
+
+    @property
+    def fitness(self):
+        return float(self._population.fitness[self._index])
+
+    @fitness.setter
+    def fitness(self, value):
+        self._population.fitness[self._index] = value
+
+
+class Population:
+    """Población (N, 4) con vector de fitness; NaN indica individuo sin evaluar."""
+
+    __slots__ = ("genes", "fitness")
+
+    def __init__(self, genes, fitness=None):
+        self.genes = np.ascontiguousarray(genes, dtype=np.float64).reshape(-1, len(GENES))
+        if fitness is None:
+            fitness = np.full(self.genes.shape[0], np.nan)
+        self.fitness = np.asarray(fitness, dtype=np.float64)
+
+    @classmethod
+    def random(cls, n, rng):
+        bajos, altos = np.array(ga.bounds).T
+        return cls(rng.uniform(bajos, altos, size=(n, len(GENES))))
+
+    @classmethod
+    def from_list(cls, poblacion):
+        return cls(np.array(poblacion, dtype=np.float64))
+
+    def to_list(self):
+        return self.genes.tolist()
+
+    def __len__(self):
+        return self.genes.shape[0]
+
+    def __getitem__(self, index):
+        return IndividualView(self, index)
+
+    def __iter__(self):
+        return (IndividualView(self, i) for i in range(len(self)))
+
+    def evaluate(self, rng, evaluar=None):
+        """Evalúa sólo los individuos sin fitness (NaN) con un evaluador por lotes."""
+        # Se busca al llamar (no como valor por defecto) para que el profiling pueda envolverla
+        evaluar = evaluar or muestrear_poblacion
+        pendientes = np.flatnonzero(np.isnan(self.fitness))
+        if pendientes.size:
+            self.fitness[pendientes] = evaluar(self.genes[pendientes], rng=rng)
+        return self.fitness
+
+    def best(self):
+        return self[int(np.argmax(self.fitness))]
+
+    def next_generation(self, rng, n=None):
+        """Selección, cruce y mutación por lotes; retorna una Population nueva."""
+        if len(self) < 2:
+            # El cruce necesita dos padres distintos (truncamiento sortea parejas sin repetir)
+            raise ValueError(f"Se necesitan al menos 2 individuos para cruzar, hay {len(self)}")
+        n = n or len(self)
+        parejas = -(-n // 2)
+        # Mismo modo y estrategia que genetic_algorithm.seleccion; todos los padres en un solo sorteo
+        padres_a, padres_b = ga.seleccionIndices(self.genes, parejas, rng, fitness=self.fitness)
+
+        hijos, cruzados = cruce_lote(self.genes[padres_a], self.genes[padres_b], rng)
+        mutados = mutacion_lote(hijos, rng)
+
+        # Un hijo idéntico a su padre hereda su fitness (misma política que FitnessCache)
+        padres = np.concatenate([padres_a, padres_b])
+        fitness = np.where(cruzados | mutados, np.nan, self.fitness[padres])
+        return Population(hijos[:n], fitness[:n])
+
+
+def cruce_lote(padres_a, padres_b, rng, prob_cruce=None):
+    """
+    Cruce de un punto para todas las parejas a la vez.
+    Retorna (hijos, cruzados): hijos (2P, 4) con los primeros de cada pareja
+    arriba y los segundos abajo, y la máscara de hijos que sí se cruzaron.
+    """
+    prob_cruce = ga.probCruce if prob_cruce is None else prob_cruce
+    parejas, genes = padres_a.shape
+    cruzan = rng.random(parejas) < prob_cruce
+    punto = rng.integers(1, genes, size=parejas)
+    del_b = (np.arange(genes) >= punto[:, None]) & cruzan[:, None]
+    hijos = np.empty((2 * parejas, genes))
+    hijos[:parejas] = np.where(del_b, padres_b, padres_a)
+    hijos[parejas:] = np.where(del_b, padres_a, padres_b)
+    return hijos, np.concatenate([cruzan, cruzan])
+
+
+def mutacion_lote(genes, rng, prob_mutacion=None, escala_sigma=None):
+    """
+    Mutación gaussiana limitada por bounds, en el lugar, para toda la generación.
+    Retorna la máscara de filas que mutaron al menos un gen.
+    """
+    prob_mutacion = ga.probMutacion if prob_mutacion is None else prob_mutacion
+    escala_sigma = ga.escalaSigma if escala_sigma is None else escala_sigma
+    bajos, altos = np.array(ga.bounds).T
+    sigma = (altos - bajos) * escala_sigma
+    mascara = rng.random(genes.shape) < prob_mutacion
+    genes += np.where(mascara, rng.normal(0.0, 1.0, genes.shape) * sigma, 0.0)
+    np.clip(genes, bajos, altos, out=genes)
+    return mascara.any(axis=1)
+
+
+def evolucionar(tamano=None, generaciones=None, rng=None, umbral=0.95):
+    """Versión por lotes de ejecutar_algoritmo_genetico; retorna (mejor, generación)."""
+    rng = rng or np.random.default_rng()
+    poblacion = Population.random(tamano or ga.tamanoPoblacion, rng)
+    poblacion.evaluate(rng)
+    generacion = 0
+    while generacion < (generaciones or ga.iteraciones):
+        generacion += 1
+        poblacion = poblacion.next_generation(rng)
+        poblacion.evaluate(rng)
+        if poblacion.fitness.max() > umbral:
+            break
+    return poblacion.best(), generacion
@@ -0,0 +1,185 @@
+"""
+profiling.py
+Instrumentación de los caminos calientes (fitness, operadores, física y render).
+
+@instrumentar marca una función o método. Mientras el profiling está apagado la
+función queda intacta (costo cero); activar() reemplaza el atributo del módulo o
+de la clase por una versión que cuenta llamadas y acumula tiempo con
+time.perf_counter_ns, y desactivar() restaura el original. Las referencias
+importadas con 'from modulo import funcion' en otros módulos ya cargados
+también se reemplazan (y se restauran), así que se miden igual.
+
+perfilar() envuelve una corrida completa en cProfile, tracemalloc o estos
+contadores e imprime un reporte ordenado; agregar_argumentos() suma la opción
+--profile a los puntos de entrada.
+"""
+import sys
+import time
+import functools
+
+MODOS = ("cprofile", "tracemalloc", "hooks")
+
+contadores = {}   # etiqueta -> [llamadas, nanosegundos]
+_puntos = []      # (dueño, nombre, original, etiqueta)
+_medidas = {}     # id(versión medida) -> (versión medida, original) mientras está activo
+_activo = False
+
+
+def _envolver(fn, etiqueta):
+    registro = contadores.setdefault(etiqueta, [0, 0])
+    reloj = time.perf_counter_ns
+
+    @functools.wraps(fn)
+    def medido(*args, **kwargs):
+        inicio = reloj()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            registro[0] += 1
+            registro[1] += reloj() - inicio
+    medido.__wrapped__ = fn
+    return medido
+
+
+class _Metodo:
+    """Marca temporal de un método: al crearse la clase se registra y deja la función original."""
+
+    def __init__(self, fn, etiqueta):
+        self.fn = fn
+        self.etiqueta = etiqueta
+
+    def __set_name__(self, owner, name):
+        etiqueta = self.etiqueta or f"{owner.__name__}.{name}"
+        _puntos.append((owner, name, self.fn, etiqueta))
+        setattr(owner, name, _envolver(self.fn, etiqueta) if _activo else self.fn)
+
+
+def instrumentar(fn=None, etiqueta=None):
+    """Decorador (@instrumentar o @instrumentar(etiqueta="...")) para funciones de módulo y métodos."""
+    if fn is None:
+        return functools.partial(instrumentar, etiqueta=etiqueta)
+    if "." in fn.__qualname__:
+        # Definida dentro de una clase: el dueño se conoce recién en __set_name__
+        return _Metodo(fn, etiqueta)
+    etiqueta = etiqueta or fn.__qualname__
+    _puntos.append((sys.modules[fn.__module__], fn.__name__, fn, etiqueta))
+    return _envolver(fn, etiqueta) if _activo else fn
+
+
+def activo():
+    return _activo
+
+
+def _reemplazar(cambios):
+    """En todos los módulos cargados, cambia cada referencia a una función de 'cambios' (por id)."""
+    for modulo in list(sys.modules.values()):
+        espacio = getattr(modulo, "__dict__", None)
+        if not isinstance(espacio, dict):
+            continue
+        for nombre, valor in list(espacio.items()):
+            par = cambios.get(id(valor))
+            if par is not None and par[0] is valor:
+                espacio[nombre] = par[1]
+
+
+def activar():
+    """
+    Reemplaza cada punto instrumentado (y sus copias importadas) por su versión medida.
+    Los contadores vuelven a cero: cada activación mide sólo su propia corrida.
+    """
+    global _activo
+    if _activo:
+        desactivar()
+    reiniciar()
+    _activo = True
+    cambios = {}
+    for dueno, nombre, original, etiqueta in _puntos:
+        medida = _envolver(original, etiqueta)
+        setattr(dueno, nombre, medida)
+        cambios[id(original)] = (original, medida)
+        _medidas[id(medida)] = (medida, original)
+    _reemplazar(cambios)
+
+
+def desactivar():
+    """Restaura las funciones originales (los contadores se conservan hasta el próximo activar)."""
+    global _activo
+    _activo = False
+    for dueno, nombre, original, _ in _puntos:
+        setattr(dueno, nombre, original)
+    _reemplazar(_medidas)
+    _medidas.clear()
+
+
+def reiniciar():
+    for registro in contadores.values():
+        registro[0] = registro[1] = 0
+
+
+def instantanea():
+    """Copia de los contadores: {etiqueta: (llamadas, segundos)}."""
+    return {k: (llamadas, ns / 1e9) for k, (llamadas, ns) in contadores.items()}
+
+
+def reporte(generaciones=None, archivo=None):
+    """Imprime los contadores ordenados por tiempo total (tiempos inclusivos)."""
+    archivo = archivo or sys.stdout
+    columna_gen = f" {'ms/gen':>10}" if generaciones else ""
+    print(f"{'punto':<40} {'llamadas':>10} {'total ms':>10} {'µs/llamada':>11}{columna_gen}", file=archivo)
+    for etiqueta, (llamadas, ns) in sorted(contadores.items(), key=lambda kv: -kv[1][1]):
+        if not llamadas:
+            continue
+        fila = f"{etiqueta:<40} {llamadas:>10} {ns / 1e6:>10.2f} {ns / 1e3 / llamadas:>11.2f}"
+        if generaciones:
+            fila += f" {ns / 1e6 / generaciones:>10.3f}"
+        print(fila, file=archivo)
+
+
+def perfilar(fn, modo="cprofile", salida=None, top=25, generaciones=None):
+    """
+    Corre fn() bajo el perfilador 'modo' e imprime el reporte al terminar (aunque fn llame sys.exit).
+    cprofile: funciones por tiempo acumulado; 'salida' guarda las estadísticas (.prof).
+    tracemalloc: líneas que más memoria asignaron y el pico; 'salida' guarda el snapshot.
+    hooks: contadores de los puntos @instrumentar; 'generaciones()' agrega la columna por generación.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo de profiling desconocido: {modo} (use {', '.join(MODOS)})")
+    if modo == "cprofile":
+        import cProfile
+        import pstats
+        perfil = cProfile.Profile()
+        try:
+            return perfil.runcall(fn)
+        finally:
+            if salida:
+                perfil.dump_stats(salida)
+            pstats.Stats(perfil, stream=sys.stderr).sort_stats("cumulative").print_stats(top)
+    elif modo == "tracemalloc":
+        import tracemalloc
+        tracemalloc.start(10)
+        try:
+            return fn()
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            if salida:
+                snapshot.dump(salida)
+            print(f"Pico de memoria trazada: {pico / 2**20:.1f} MiB", file=sys.stderr)
+            for estadistica in snapshot.statistics("lineno")[:top]:
+                print(estadistica, file=sys.stderr)
+    else:
+        activar()
+        try:
+            return fn()
+        finally:
+            desactivar()
+            reporte(generaciones() if generaciones else None, archivo=sys.stderr)
+
+
+def agregar_argumentos(parser):
+    """Agrega --profile [modo] y --profile-out a un argparse.ArgumentParser."""
+    parser.add_argument("--profile", nargs="?", const="cprofile", choices=MODOS,
+                        help="perfilar la corrida (cprofile por defecto, tracemalloc o hooks)")
+    parser.add_argument("--profile-out", metavar="RUTA",
+                        help="guardar las estadísticas de cProfile o el snapshot de tracemalloc")
@@ -0,0 +1,49 @@
+"""
+racing.py
+Selección por truncamiento con fitness ruidoso mediante carreras estadísticas.
+
+En vez de ordenar con una sola muestra por individuo, todos reciben unas pocas
+muestras (con números aleatorios comunes dentro de cada ronda) y después sólo
+se vuelve a simular a los individuos cuyo intervalo de confianza todavía cruza
+el corte entre seleccionados y descartados. Los que están claramente arriba o
+abajo del corte no gastan más simulaciones.
+"""
+import numpy as np
+
+
+def seleccion_por_carrera(genes, num_seleccionados, evaluar, rng, muestras_iniciales=2,
+                          muestras_maximas=16, z=1.96):
+    """
+    Elige los 'num_seleccionados' individuos de mayor fitness medio de 'genes' (N, G).
+    'evaluar(genes, muestras, rng)' retorna una matriz de fitness (muestras, n), p. ej.
+    parachute_physics.muestrear_poblacion_crn. Cada ronda agrega 'muestras_iniciales'
+    muestras a los individuos inciertos (|media - corte| <= z * error estándar) hasta
+    que ninguno lo sea o lleguen a 'muestras_maximas'.
+    Retorna (indices, medias, simulaciones): los índices elegidos (mejores primero),
+    el fitness medio de cada individuo y el total de muestras simuladas.
+    """
+    genes = np.asarray(genes, dtype=np.float64)
+    n = genes.shape[0]
+    suma = np.zeros(n)
+    suma_cuadrados = np.zeros(n)
+    cuenta = np.zeros(n, dtype=np.int64)
+    pendientes = np.arange(n)
+    while pendientes.size:
+        fitness = evaluar(genes[pendientes], muestras_iniciales, rng)
+        suma[pendientes] += fitness.sum(axis=0)
+        suma_cuadrados[pendientes] += (fitness * fitness).sum(axis=0)
+        cuenta[pendientes] += muestras_iniciales
+        medias = suma / cuenta
+        if not 0 < num_seleccionados < n:
+            break
+        orden = np.argsort(-medias, kind="stable")
+        corte = 0.5 * (medias[orden[num_seleccionados - 1]] + medias[orden[num_seleccionados]])
+        # Error estándar de la media; con una sola muestra el individuo sigue incierto
+        with np.errstate(divide="ignore", invalid="ignore"):
+            varianza = np.maximum(suma_cuadrados / cuenta - medias * medias, 0.0) * cuenta / (cuenta - 1)
+            error = np.where(cuenta > 1, z * np.sqrt(varianza / cuenta), np.inf)
+        inciertos = np.abs(medias - corte) <= error
+        pendientes = np.flatnonzero(inciertos & (cuenta + muestras_iniciales <= muestras_maximas))
+    medias = suma / cuenta
+    indices = np.argsort(-medias, kind="stable")[:num_seleccionados]
+    return indices, medias, int(cuenta.sum())
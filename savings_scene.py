@@ -0,0 +1,181 @@
+"""
+savings_scene.py
+Planificador de ahorro como escena de pygame: el mismo formulario que la ventana
+Tk de ahorro_genetico.py, pero dentro de la ventana de la aplicación.
+Igual que allí, el cálculo corre en un SolverWorker y la escena sólo lee sus mensajes.
+"""
+import pygame
+from ui import Button, TextCache, get_font
+from scenes import Scene
+from ahorro_genetico import algoritmo_genetico
+from solver_worker import SolverWorker
+
+COLOR_FONDO = (240, 244, 248)
+COLOR_TARJETA = (255, 255, 255)
+COLOR_PRIMARIO = (25, 118, 210)
+COLOR_TEXTO = (34, 34, 34)
+COLOR_BORDE = (180, 180, 180)
+COLOR_ESTADO = (85, 85, 85)
+
+
+class TextField:
+    """Campo de texto numérico de una línea."""
+
+    PERMITIDOS = "0123456789.,"
+
+    def __init__(self, rect, label, font, text_cache):
+        self.rect = pygame.Rect(rect)
+        self.label = label
+        self.font = font
+        self.text_cache = text_cache
+        self.text = ""
+        self.active = False
+
+    def handle_event(self, event):
+        """Retorna True si el evento cambió el campo."""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            active = self.rect.collidepoint(event.pos)
+            changed, self.active = active != self.active, active
+            return changed
+        if self.active and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_BACKSPACE:
+                self.text = self.text[:-1]
+                return True
+            if event.unicode and event.unicode in self.PERMITIDOS and len(self.text) < 15:
+                self.text += event.unicode
+                return True
+        return False
+
+    def draw(self, screen):
+        screen.blit(self.text_cache.render(self.label, COLOR_TEXTO), (self.rect.x, self.rect.y - 24))
+        pygame.draw.rect(screen, COLOR_TARJETA, self.rect)
+        pygame.draw.rect(screen, COLOR_PRIMARIO if self.active else COLOR_BORDE, self.rect, 2)
+        texto = self.text + ("|" if self.active else "")
+        txt = self.font.render(texto, True, COLOR_TEXTO)
+        screen.blit(txt, txt.get_rect(midleft=(self.rect.x + 8, self.rect.centery)))
+
+
+class SavingsScene(Scene):
+    """Formulario de ingreso, meta y plazo; 'Calcular' corre el algoritmo genético de ahorro."""
+
+    caption = "Planificador de Ahorro - Algoritmo Genético"
+
+    def __init__(self, screen):
+        super().__init__()
+        self.screen = screen
+        width, _ = screen.get_size()
+        self.font = get_font("Segoe UI", 18)
+        self.title_font = get_font("Segoe UI", 26, bold=True)
+        self.result_font = get_font("Consolas", 18, bold=True)
+        self.text_cache = TextCache(self.font)
+        self.fields = [
+            TextField((60, 170, 320, 36), "Ingreso mensual:", self.font, self.text_cache),
+            TextField((60, 250, 320, 36), "Meta de ahorro total:", self.font, self.text_cache),
+            TextField((60, 330, 320, 36), "Plazo en meses:", self.font, self.text_cache),
+        ]
+        self.fields[0].active = True
+        self.btn_calcular = Button((60, 400, 320, 44), "Calcular", self.font,
+                                   callback=self.calcular, text_cache=self.text_cache)
+        self.btn_back = Button((width - 140, 20, 120, 36), "← Menú", self.font,
+                               callback=self._on_back, text_cache=self.text_cache)
+        self.resultado = []
+        self.estado = ""
+        self.worker = SolverWorker(algoritmo_genetico)
+        self._dirty = True
+
+    def _on_back(self):
+        self.next_scene = "menu"
+
+    def enter(self):
+        self._dirty = True
+
+    def leave(self):
+        # Fuera de la escena nadie leería el resultado
+        self.worker.cancel()
+
+    def calcular(self):
+        """Lee el formulario y pide el cálculo al hilo de fondo (se calcula sólo el último pedido)."""
+        try:
+            ingreso, meta = (float(f.text.replace(",", ".")) for f in self.fields[:2])
+            plazo = int(self.fields[2].text)
+        except ValueError:
+            self.resultado = ["Error en los datos ingresados."]
+        else:
+            self.worker.submit(ingreso, meta, plazo)
+            self.estado = "Calculando..."
+        self._dirty = True
+
+    def update(self, elapsed_ms):
+        for tipo, (_, meta, _), datos in self.worker.poll():
+            if tipo == "progreso":
+                generacion, total, mejor = datos
+                self.estado = f"Generación {generacion}/{total} - mejor: {mejor*100:.2f}%"
+            elif tipo == "resultado":
+                porcentaje, mensual, total = datos
+                self.estado = ""
+                self.resultado = [
+                    f"Ahorro mensual: {porcentaje*100:.2f}%",
+                    f"Ahorro mensual: ${mensual:,.2f}",
+                    f"Ahorro total: ${total:,.2f}",
+                    f"Meta: ${meta:,.2f}",
+                ]
+            elif tipo == "cancelado":
+                self.estado = "Cálculo cancelado."
+            else:
+                self.estado = ""
+                self.resultado = ["Error en los datos ingresados."]
+            self._dirty = True
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+            # Tab pasa al siguiente campo
+            actual = next((i for i, f in enumerate(self.fields) if f.active), -1)
+            for i, field in enumerate(self.fields):
+                field.active = i == (actual + 1) % len(self.fields)
+            self._dirty = True
+            return
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self.calcular()
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            # Esc cancela el cálculo en curso; sin cálculo, vuelve al menú
+            if self.worker.busy:
+                self.worker.cancel()
+            else:
+                self._on_back()
+            return
+        for field in self.fields:
+            if field.handle_event(event):
+                self._dirty = True
+        self.btn_calcular.handle_event(event)
+        self.btn_back.handle_event(event)
+
+    def draw(self):
+        # Formulario estático: sólo se repinta cuando algo cambió
+        if not self._dirty:
+            return
+        self._dirty = False
+        screen = self.screen
+        width, height = screen.get_size()
+        screen.fill(COLOR_FONDO)
+
+        izquierda = pygame.Rect(30, 80, 380, 400)
+        derecha = pygame.Rect(440, 80, width - 470, 400)
+        for tarjeta in (izquierda, derecha):
+            pygame.draw.rect(screen, COLOR_TARJETA, tarjeta)
+            pygame.draw.rect(screen, COLOR_BORDE, tarjeta, 2)
+
+        screen.blit(self.title_font.render("Planificador de Ahorro", True, COLOR_PRIMARIO), (60, 100))
+        for field in self.fields:
+            field.draw(screen)
+        self.btn_calcular.draw(screen)
+        self.btn_back.draw(screen)
+
+        screen.blit(self.title_font.render("Resultados", True, COLOR_PRIMARIO), (derecha.x + 30, 100))
+        y = 170
+        for linea in self.resultado:
+            screen.blit(self.result_font.render(linea, True, COLOR_TEXTO), (derecha.x + 30, y))
+            y += 34
+        if self.estado:
+            screen.blit(self.font.render(self.estado, True, COLOR_ESTADO), (derecha.x + 30, derecha.bottom - 40))
+        pygame.display.flip()
@@ -0,0 +1,107 @@
+"""
+scenes.py
+Gestor de escenas: el menú, la simulación del paracaidista y el planificador de
+ahorro corren dentro del mismo proceso y la misma ventana de pygame.
+
+Cada escena se crea la primera vez que se visita y después se reutiliza, así
+las cachés ya calientes (sprites rotados, fuentes, fitness, población) se
+conservan al ir y volver del menú.
+"""
+import time
+import pygame
+
+EXIT = "exit"  # nombre reservado: terminar la aplicación
+
+
+class Scene:
+    """
+    Pantalla de la aplicación. El SceneManager llama, en cada frame,
+    handle_event -> update -> draw; para cambiar de escena se asigna next_scene.
+    """
+
+    caption = "Algoritmos Genéticos"
+
+    def __init__(self):
+        self.next_scene = None
+
+    def enter(self):
+        """Se llama cada vez que la escena pasa a ser la activa."""
+
+    def leave(self):
+        """Se llama cuando la escena deja de ser la activa."""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, elapsed_ms):
+        pass
+
+    def draw(self):
+        """Dibuja y publica el frame (flip o update de rectángulos)."""
+
+
+class SceneManager:
+    """Registro de escenas y bucle principal compartido."""
+
+    def __init__(self, screen, fps=60):
+        self.screen = screen
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self._factories = {}
+        self._scenes = {}  # escenas ya creadas
+        self.current = None
+        self.current_name = None
+
+    def register(self, name, factory):
+        """'factory(screen)' construye la escena; se llama una sola vez, al primer uso."""
+        self._factories[name] = factory
+
+    def get(self, name):
+        scene = self._scenes.get(name)
+        if scene is None:
+            scene = self._factories[name](self.screen)
+            self._scenes[name] = scene
+        return scene
+
+    def switch(self, name):
+        """Activa la escena 'name'; retorna los milisegundos que tomó el cambio."""
+        inicio = time.perf_counter()
+        if self.current is not None:
+            self.current.leave()
+        self.current = self.get(name)
+        self.current_name = name
+        self.current.next_scene = None
+        pygame.display.set_caption(self.current.caption)
+        self.current.enter()
+        self.clock.tick()  # el tiempo fuera de la escena no cuenta para su simulación
+        return (time.perf_counter() - inicio) * 1000
+
+    def run(self, start, max_frames=None):
+        """
+        Bucle principal hasta que una escena pida EXIT o se cierre la ventana.
+        Con 'max_frames' termina tras dibujar esa cantidad de frames.
+        """
+        self.switch(start)
+        elapsed_ms = 0
+        frames = 0
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.current.leave()
+                    return
+                self.current.handle_event(event)
+
+            self.current.update(elapsed_ms)
+            self.current.draw()
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                self.current.leave()
+                return
+
+            destino = self.current.next_scene
+            if destino == EXIT:
+                self.current.leave()
+                return
+            if destino:
+                self.switch(destino)
+            elapsed_ms = self.clock.tick(self.fps)
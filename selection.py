@@ -0,0 +1,90 @@
+"""
+selection.py
+Estrategias de selección de padres por lotes para poblaciones grandes.
+
+Cada estrategia recibe el vector de fitness (N,) y sortea de una sola vez los
+índices de los dos padres de todas las parejas de la generación:
+    - truncamiento: la fracción prob_seleccion con mejor fitness (np.argpartition,
+      O(N) en vez de ordenar toda la población) y dos padres distintos por pareja;
+    - torneo: cada padre es el mejor de 'tamano_torneo' individuos al azar;
+    - sus: muestreo universal estocástico, proporcional al fitness con un solo
+      sorteo y punteros equiespaciados.
+"""
+import numpy as np
+from profiling import instrumentar
+
+
+def truncar(fitness, num):
+    """Índices (sin orden) de los 'num' individuos con mayor fitness."""
+    fitness = np.asarray(fitness, dtype=np.float64)
+    if num >= fitness.size:
+        return np.arange(fitness.size)
+    return np.argpartition(-fitness, num - 1)[:num]
+
+
+def parejas_distintas(n, parejas, rng):
+    """Dos índices distintos en [0, n) por pareja, igual que random.sample(range(n), 2)."""
+    i = rng.integers(n, size=parejas)
+    j = rng.integers(n - 1, size=parejas)
+    j += j >= i
+    return i, j
+
+
+def _truncamiento(fitness, parejas, rng, prob_seleccion, tamano_torneo):
+    seleccionados = truncar(fitness, max(2, int(fitness.size * prob_seleccion)))
+    i, j = parejas_distintas(seleccionados.size, parejas, rng)
+    return seleccionados[i], seleccionados[j]
+
+
+def _torneo(fitness, parejas, rng, prob_seleccion, tamano_torneo):
+    if tamano_torneo < 1:
+        raise ValueError(f"tamano_torneo debe ser >= 1: {tamano_torneo}")
+    candidatos = rng.integers(fitness.size, size=(tamano_torneo, 2 * parejas))
+    # Una pasada por participante: más rápido que argmax por filas de largo 2..4
+    ganadores = candidatos[0]
+    mejor = fitness[ganadores]
+    for retador in candidatos[1:]:
+        valor = fitness[retador]
+        gana = valor > mejor
+        ganadores = np.where(gana, retador, ganadores)
+        mejor = np.where(gana, valor, mejor)
+    return ganadores[:parejas], ganadores[parejas:]
+
+
+def _sus(fitness, parejas, rng, prob_seleccion, tamano_torneo):
+    punteros = 2 * parejas
+    acumulado = np.cumsum(np.maximum(np.nan_to_num(fitness, nan=0.0), 0.0))
+    total = acumulado[-1]
+    if total <= 0:
+        # Sin fitness positivo no hay proporción: todos con la misma chance
+        elegidos = rng.integers(fitness.size, size=punteros)
+    else:
+        # Punteros equiespaciados (u + k) * paso: el individuo i recibe los punteros que caen
+        # en [acumulado[i-1], acumulado[i]), sin buscar cada puntero por separado
+        paso = total / punteros
+        hasta = np.clip(np.ceil(acumulado / paso - rng.random()), 0, punteros).astype(np.int64)
+        hasta[-1] = punteros
+        elegidos = np.repeat(np.arange(fitness.size), np.diff(hasta, prepend=0))
+        # Los punteros salen en orden de población: se mezclan antes de formar las parejas
+        rng.shuffle(elegidos)
+    return elegidos[:parejas], elegidos[parejas:]
+
+
+ESTRATEGIAS = {"truncamiento": _truncamiento, "torneo": _torneo, "sus": _sus}
+
+
+@instrumentar
+def seleccionar_padres(fitness, parejas, rng, estrategia="truncamiento", prob_seleccion=0.5, tamano_torneo=2):
+    """
+    Sortea los padres de 'parejas' cruces con la estrategia indicada.
+    Retorna (padres_a, padres_b): dos arreglos de índices (parejas,) sobre la población.
+    """
+    try:
+        seleccionar = ESTRATEGIAS[estrategia]
+    except KeyError:
+        raise ValueError(f"Estrategia de selección desconocida: {estrategia} "
+                         f"(use {', '.join(ESTRATEGIAS)})") from None
+    fitness = np.asarray(fitness, dtype=np.float64)
+    if fitness.size < 2:
+        raise ValueError(f"Se necesitan al menos 2 individuos para formar parejas, hay {fitness.size}")
+    return seleccionar(fitness, parejas, rng, prob_seleccion, tamano_torneo)
@@ -0,0 +1,133 @@
+"""
+simulation_scheduler.py
+Planificador no bloqueante de la simulación visual.
+
+El bucle principal llama update(ms) una vez por frame; el planificador avanza la
+física con paso fijo (un paso = 1/60 s a velocidad 1x) según el tiempo transcurrido
+y el multiplicador de velocidad, así la ventana sigue atendiendo eventos.
+A velocidad ilimitada corre tantos pasos como quepan en un presupuesto de tiempo
+por frame y sólo pide dibujar uno de cada RENDER_SKIP frames.
+
+En modo simultáneo toda la generación cae a la vez (un solo lote) en lugar de
+un individuo detrás de otro.
+"""
+import time
+
+STEP_MS = 1000.0 / 60  # duración de un paso de física a 1x
+HOLD_MS = 700          # pausa tras cada aterrizaje (o lote) a 1x
+SPEEDS = (1, 10, None)  # None = ilimitada
+BUDGET_MS = 12.0       # tiempo de física por frame a velocidad ilimitada
+RENDER_SKIP = 6        # a velocidad ilimitada se dibuja 1 de cada N frames
+
+
+class SimulationScheduler:
+    """Avanza una cola de paracaidistas paso a paso, de a uno o todos juntos."""
+
+    def __init__(self, ground_y=520, speed=1, simultaneous=False):
+        self.ground_y = ground_y
+        self.speed = speed
+        self.simultaneous = simultaneous
+        self._queue = []
+        self._active = []   # [(índice, paracaidista, generador)] aún en el aire
+        self.shown = []     # [(índice, paracaidista)] del lote en pantalla
+        self.results = {}   # índice -> resultado de los que ya aterrizaron en el lote
+        self._accum_ms = 0.0
+        self._hold_ms = 0.0
+        self._frame = 0
+
+    @property
+    def speed_label(self):
+        return "Máx" if self.speed is None else f"{self.speed}x"
+
+    @property
+    def mode_label(self):
+        return "Todos" if self.simultaneous else "Uno"
+
+    def cycle_speed(self):
+        """Pasa a la siguiente velocidad de SPEEDS."""
+        self.speed = SPEEDS[(SPEEDS.index(self.speed) + 1) % len(SPEEDS)]
+        return self.speed
+
+    def toggle_mode(self):
+        """Alterna entre simular de a uno o toda la generación a la vez (desde el próximo lote)."""
+        self.simultaneous = not self.simultaneous
+        return self.simultaneous
+
+    @property
+    def busy(self):
+        return bool(self.shown) or bool(self._queue)
+
+    @property
+    def holding(self):
+        """True durante la pausa posterior al aterrizaje del lote."""
+        return bool(self.shown) and not self._active
+
+    def start(self, items):
+        """
+        Encola una generación: iterable de (índice, paracaidista).
+        Cada paracaidista cae manteniendo su x inicial.
+        """
+        self._queue = list(items)
+        self._accum_ms = 0.0
+        self._next()
+
+    def stop(self):
+        self._queue = []
+        self._active = []
+        self.shown = []
+        self.results = {}
+
+    def _next(self):
+        self.results = {}
+        self._hold_ms = 0.0
+        cantidad = len(self._queue) if self.simultaneous else 1
+        lote, self._queue = self._queue[:cantidad], self._queue[cantidad:]
+        self.shown = lote
+        self._active = [(i, p, p.iter_steps(self.ground_y, target_x=p.x)) for i, p in lote]
+
+    def should_render(self):
+        """Salto de frames: a velocidad ilimitada sólo se dibuja 1 de cada RENDER_SKIP."""
+        self._frame += 1
+        return self.speed is not None or not self.busy or self._frame % RENDER_SKIP == 0
+
+    def update(self, elapsed_ms):
+        """
+        Avanza la simulación según el tiempo real transcurrido.
+        Retorna la lista de aterrizajes ocurridos: [(índice, paracaidista, resultado)].
+        """
+        landed = []
+        if self.speed is None:
+            deadline = time.perf_counter() + BUDGET_MS / 1000.0
+            while self.shown and time.perf_counter() < deadline:
+                self._advance(landed)
+                if not self._active:
+                    self._next()  # sin pausa a velocidad ilimitada
+            return landed
+
+        self._accum_ms += elapsed_ms * self.speed
+        while self.shown and self._accum_ms >= STEP_MS:
+            if not self._active:
+                # Pausa tras el aterrizaje, escalada por la velocidad
+                pausa = min(self._accum_ms, HOLD_MS - self._hold_ms)
+                self._hold_ms += pausa
+                self._accum_ms -= pausa
+                if self._hold_ms >= HOLD_MS:
+                    self._next()
+                continue
+            self._accum_ms -= STEP_MS
+            self._advance(landed)
+        if not self.shown:
+            self._accum_ms = 0.0
+        return landed
+
+    def _advance(self, landed):
+        """Un paso de física para todos los individuos en el aire."""
+        en_el_aire = []
+        for i, parachute, steps in self._active:
+            try:
+                next(steps)
+                en_el_aire.append((i, parachute, steps))
+            except StopIteration as fin:
+                self.results[i] = fin.value
+                landed.append((i, parachute, fin.value))
+        self._active = en_el_aire
@@ -0,0 +1,116 @@
+"""
+solver_worker.py
+Hilo de fondo para cálculos que no deben congelar la interfaz (Tk o pygame).
+
+La interfaz llama submit() y, desde su propio bucle (root.after en Tk, update()
+en una escena de pygame), poll() para recibir progreso y resultados por una
+cola thread-safe. Los pedidos se fusionan: si llegan varios mientras se calcula,
+el cálculo en curso se cancela y sólo se calcula el más reciente.
+"""
+import time
+import queue
+import threading
+
+INTERVALO_PROGRESO = 1 / 30  # segundos mínimos entre mensajes de progreso
+
+
+class SolverWorker:
+    """
+    Corre funcion(*args, progreso=callable, cancelar=threading.Event) en un hilo propio.
+    La función llama progreso(...) cuando quiera informar avance, revisa
+    cancelar.is_set() y retorna None si abandonó el cálculo.
+    """
+
+    def __init__(self, funcion):
+        self.funcion = funcion
+        self._mensajes = queue.Queue()
+        self._lock = threading.Lock()
+        self._hay_trabajo = threading.Event()
+        self._pendiente = None   # (id, args) esperando al hilo
+        self._cancelar = None    # Event del cálculo en curso
+        self._ultimo_id = 0
+        self._hilo = None
+        self._cerrado = False
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self._pendiente is not None or self._cancelar is not None
+
+    def submit(self, *args):
+        """Pide calcular con 'args'; reemplaza cualquier pedido anterior. Retorna su id."""
+        with self._lock:
+            self._ultimo_id += 1
+            self._pendiente = (self._ultimo_id, args)
+            if self._cancelar is not None:
+                self._cancelar.set()  # el cálculo en curso quedó viejo
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._bucle, name="SolverWorker", daemon=True)
+                self._hilo.start()
+            self._hay_trabajo.set()
+            return self._ultimo_id
+
+    def cancel(self):
+        """Descarta el pedido pendiente y cancela el que está en curso."""
+        with self._lock:
+            self._pendiente = None
+            if self._cancelar is not None:
+                self._cancelar.set()
+
+    def poll(self):
+        """
+        Mensajes recibidos desde la última llamada, sin bloquear: lista de
+        (tipo, args, datos) con tipo 'progreso', 'resultado', 'cancelado' o 'error'.
+        Los de pedidos reemplazados por uno más nuevo se descartan.
+        """
+        mensajes = []
+        while True:
+            try:
+                id_pedido, tipo, args, datos = self._mensajes.get_nowait()
+            except queue.Empty:
+                return mensajes
+            if id_pedido == self._ultimo_id:
+                mensajes.append((tipo, args, datos))
+
+    def close(self, timeout=1.0):
+        """Cancela lo que haya en curso y termina el hilo."""
+        with self._lock:
+            self._cerrado = True
+        self.cancel()
+        self._hay_trabajo.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+
+    def _bucle(self):
+        while True:
+            self._hay_trabajo.wait()
+            with self._lock:
+                if self._cerrado:
+                    return
+                pedido, self._pendiente = self._pendiente, None
+                self._hay_trabajo.clear()
+                if pedido is None:
+                    continue
+                cancelar = self._cancelar = threading.Event()
+
+            id_pedido, args = pedido
+            ultimo = [0.0]
+
+            def progreso(*datos):
+                # Acotado a INTERVALO_PROGRESO para no inundar la cola con miles de generaciones
+                ahora = time.perf_counter()
+                if ahora - ultimo[0] >= INTERVALO_PROGRESO:
+                    ultimo[0] = ahora
+                    self._mensajes.put((id_pedido, "progreso", args, datos))
+
+            try:
+                resultado = self.funcion(*args, progreso=progreso, cancelar=cancelar)
+                if resultado is None:
+                    self._mensajes.put((id_pedido, "cancelado", args, None))
+                else:
+                    self._mensajes.put((id_pedido, "resultado", args, resultado))
+            except Exception as e:
+                self._mensajes.put((id_pedido, "error", args, e))
+            finally:
+                with self._lock:
+                    self._cancelar = None
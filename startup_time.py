@@ -0,0 +1,95 @@
+"""
+startup_time.py
+Reporte del costo de arranque de main.py y verificación de su presupuesto.
+
+- Importaciones: corre 'python -X importtime -c "import main"' en un proceso nuevo
+  y lista los módulos con mayor tiempo acumulado. Falla si al inicio se carga
+  alguno de MODULOS_DIFERIDOS, que deben importarse recién al abrir su escena.
+- Primer frame: mide el tiempo de pared desde que se lanza el intérprete hasta
+  que main.main(max_frames=1) dibujó el menú y terminó.
+
+Ejecutar:
+    python startup_time.py                  # reporte + verificación (código 1 si se excede)
+    python startup_time.py --budget-ms 600 --top 15
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+PRESUPUESTO_MS = 1000  # tiempo hasta el primer frame del menú
+# Se importan al entrar a su escena, nunca al arrancar el menú
+MODULOS_DIFERIDOS = ("genetic_algorithm", "parachutist", "parachutist_main", "savings_scene",
+                     "ahorro_genetico", "tkinter")
+
+_DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+
+def _entorno():
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    return env
+
+
+def importtime(modulo="main"):
+    """
+    Importa 'modulo' en un intérprete nuevo con -X importtime.
+    Retorna [(nombre, propio_us, acumulado_us)] en el orden que reporta Python.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                          cwd=_DIRECTORIO, env=_entorno(), capture_output=True, text=True, check=True)
+    filas = []
+    for linea in proc.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, nombre = linea[len("import time:"):].split("|")
+        filas.append((nombre.strip(), int(propio), int(acumulado)))
+    return filas
+
+
+def tiempo_primer_frame(repeticiones=3):
+    """Mejor tiempo (ms) de lanzar 'python main.py' hasta su primer frame del menú."""
+    codigo = "import main\ntry:\n    main.main(max_frames=1)\nexcept SystemExit:\n    pass\n"
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=_DIRECTORIO, env=_entorno(),
+                       capture_output=True, check=True)
+        mejor = min(mejor, (time.perf_counter() - inicio) * 1000)
+    return mejor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Costo de arranque de main.py")
+    parser.add_argument("--budget-ms", type=float, default=PRESUPUESTO_MS,
+                        help="presupuesto de tiempo hasta el primer frame")
+    parser.add_argument("--top", type=int, default=10, help="módulos a listar por tiempo acumulado")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    filas = importtime("main")
+    print(f"{'módulo':<40} {'propio ms':>10} {'acumulado ms':>13}")
+    for nombre, propio, acumulado in sorted(filas, key=lambda f: -f[2])[:args.top]:
+        print(f"{nombre:<40} {propio / 1000:>10.1f} {acumulado / 1000:>13.1f}")
+
+    errores = []
+    cargados = {nombre for nombre, _, _ in filas}
+    antes_de_tiempo = [m for m in MODULOS_DIFERIDOS if m in cargados]
+    if antes_de_tiempo:
+        errores.append(f"módulos diferidos importados al arrancar: {', '.join(antes_de_tiempo)}")
+
+    ms = tiempo_primer_frame(args.repeticiones)
+    print(f"\nTiempo hasta el primer frame: {ms:.0f} ms (presupuesto {args.budget_ms:.0f} ms)")
+    if ms > args.budget_ms:
+        errores.append(f"primer frame en {ms:.0f} ms supera el presupuesto de {args.budget_ms:.0f} ms")
+
+    for error in errores:
+        print(f"ERROR: {error}")
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
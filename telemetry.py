@@ -0,0 +1,114 @@
+"""
+telemetry.py
+Telemetría por generación del algoritmo genético.
+
+Cada generación produce un registro (dict) con fitness mejor/medio/desviación,
+diversidad de genes, evaluaciones hechas y el tiempo de pared en evaluación y en
+operadores. Los últimos 'capacidad' registros quedan en un buffer circular (para
+el panel de la UI) y, si hay un sink, todos se escriben a JSONL o CSV en bloques,
+así corridas de millones de generaciones usan memoria acotada y no dependen de print.
+"""
+import os
+import csv
+import json
+import time
+from collections import deque
+import numpy as np
+
+CAMPOS = ("generacion", "mejor", "media", "desviacion", "diversidad", "evaluaciones",
+          "t_evaluacion", "t_operadores", "t_total")
+
+
+class TelemetrySink:
+    """Escribe registros a un archivo .jsonl o .csv acumulándolos en bloques de 'filas_por_escritura'."""
+
+    def __init__(self, ruta, filas_por_escritura=1000):
+        extension = os.path.splitext(ruta)[1].lower()
+        if extension not in (".jsonl", ".csv"):
+            raise ValueError(f"Formato de telemetría no soportado: {ruta} (use .jsonl o .csv)")
+        self.formato = extension[1:]
+        self.filas_por_escritura = filas_por_escritura
+        self._pendientes = []
+        self._archivo = open(ruta, "w", newline="", encoding="utf-8")
+        if self.formato == "csv":
+            self._csv = csv.writer(self._archivo)
+            self._csv.writerow(CAMPOS)
+
+    def write(self, registro):
+        self._pendientes.append(registro)
+        if len(self._pendientes) >= self.filas_por_escritura:
+            self.flush()
+
+    def flush(self):
+        if self._pendientes:
+            if self.formato == "csv":
+                self._csv.writerows([r[c] for c in CAMPOS] for r in self._pendientes)
+            else:
+                self._archivo.write("".join(json.dumps(r) + "\n" for r in self._pendientes))
+            self._pendientes = []
+        self._archivo.flush()
+
+    def close(self):
+        if not self._archivo.closed:
+            self.flush()
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Telemetry:
+    """Buffer circular de registros por generación, con un sink opcional."""
+
+    def __init__(self, capacidad=1000, sink=None, rangos=None):
+        """'rangos' (ancho de cada gen) normaliza la diversidad; sin él se usa la desviación cruda."""
+        self.registros = deque(maxlen=capacidad)
+        self.sink = sink
+        self.rangos = None if rangos is None else np.asarray(rangos, dtype=np.float64)
+        self.generaciones = 0
+        self._inicio = time.perf_counter()
+
+    @property
+    def ultimo(self):
+        return self.registros[-1] if self.registros else None
+
+    def record(self, generacion, fitness, genes, evaluaciones=0, t_evaluacion=0.0, t_operadores=0.0):
+        """
+        Registra una generación a partir de sus fitness (N,) y genes (N, G).
+        Retorna el registro guardado.
+        """
+        fitness = np.asarray(fitness, dtype=np.float64)
+        genes = np.asarray(genes, dtype=np.float64)
+        # Diversidad: desviación estándar media de cada gen (relativa a su rango si se conoce)
+        dispersion = genes.std(axis=0) if genes.size else np.zeros(1)
+        if self.rangos is not None:
+            dispersion = dispersion / self.rangos
+        registro = {
+            "generacion": int(generacion),
+            "mejor": float(fitness.max()) if fitness.size else float("nan"),
+            "media": float(fitness.mean()) if fitness.size else float("nan"),
+            "desviacion": float(fitness.std()) if fitness.size else float("nan"),
+            "diversidad": float(dispersion.mean()),
+            "evaluaciones": int(evaluaciones),
+            "t_evaluacion": float(t_evaluacion),
+            "t_operadores": float(t_operadores),
+            "t_total": time.perf_counter() - self._inicio,
+        }
+        self.registros.append(registro)
+        self.generaciones += 1
+        if self.sink is not None:
+            self.sink.write(registro)
+        return registro
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
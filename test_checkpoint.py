@@ -0,0 +1,99 @@
+"""
+test_checkpoint.py
+Reanudar desde un checkpoint debe dar la misma corrida que no interrumpirla, y
+el estado de los generadores aleatorios debe sobrevivir al ida y vuelta.
+Ejecutar: python -m pytest test_checkpoint.py
+"""
+import os
+import random
+import numpy as np
+import pytest
+import genetic_algorithm as ga
+from checkpoint import guardar_checkpoint, cargar_checkpoint
+
+
+@pytest.fixture(autouse=True)
+def estado_limpio():
+    """Cada prueba parte con la caché vacía y deja 'random' como lo encontró."""
+    estado = random.getstate()
+    ga.cache_adaptacion.clear()
+    yield
+    ga.cache_adaptacion.clear()
+    random.setstate(estado)
+
+
+def _evolucionar(poblacion, generaciones):
+    for _ in range(generaciones):
+        poblacion = ga.siguienteGeneracion(poblacion)
+    return poblacion, ga.calcularAdaptacionPoblacion(poblacion)
+
+
+def test_reanudar_equivale_a_no_interrumpir(tmp_path):
+    ruta = tmp_path / "corrida.npz"
+    random.seed(11)
+    poblacion, fitness = _evolucionar(ga.getPoblacion(30), 8)
+    guardar_checkpoint(ruta, poblacion, fitness, 8, cache=ga.cache_adaptacion)
+    esperado, fitness_esperado = _evolucionar(poblacion, 8)
+
+    # Otro proceso: caché vacía y 'random' en otro estado hasta cargar el checkpoint
+    ga.cache_adaptacion.clear()
+    random.seed(999)
+    guardado = cargar_checkpoint(ruta, cache=ga.cache_adaptacion)
+    assert guardado["generacion"] == 8 and guardado["cache"]
+    reanudado, fitness_reanudado = _evolucionar(guardado["poblacion"].tolist(), 8)
+
+    assert reanudado == esperado
+    assert fitness_reanudado == fitness_esperado
+
+
+def test_reanudar_corrida_completa_con_estado_adaptativo(tmp_path):
+    opciones = dict(tamano=30, umbral=2.0, verbose=False, adaptativo=True, paciencia=4, reinicios=3,
+                    intervalo_checkpoint=5)
+    random.seed(7)
+    ga.ejecutar_algoritmo_genetico(generaciones=20, checkpoint=tmp_path / "a.npz", **opciones)
+
+    ga.cache_adaptacion.clear()
+    random.seed(7)
+    ga.ejecutar_algoritmo_genetico(generaciones=10, checkpoint=tmp_path / "b.npz", **opciones)
+    ga.cache_adaptacion.clear()
+    random.seed(999)
+    ga.ejecutar_algoritmo_genetico(generaciones=20, checkpoint=tmp_path / "b.npz", continuar=True, **opciones)
+
+    a = cargar_checkpoint(tmp_path / "a.npz", random.Random())
+    b = cargar_checkpoint(tmp_path / "b.npz", random.Random())
+    assert a["generacion"] == b["generacion"] == 20
+    np.testing.assert_array_equal(a["poblacion"], b["poblacion"])
+    np.testing.assert_array_equal(a["fitness"], b["fitness"])
+    assert a["estado"] == b["estado"]
+
+
+def test_corrida_terminada_no_se_continua_sin_pedirlo(tmp_path):
+    ruta = tmp_path / "c.npz"
+    random.seed(3)
+    ga.ejecutar_algoritmo_genetico(30, generaciones=5, umbral=2.0, verbose=False, checkpoint=ruta)
+    antes = os.stat(ruta).st_mtime_ns
+    _, generacion = ga.ejecutar_algoritmo_genetico(30, generaciones=9, umbral=2.0, verbose=False,
+                                                   checkpoint=ruta)
+    assert generacion == 5
+    assert os.stat(ruta).st_mtime_ns == antes
+
+
+def test_estado_de_generadores(tmp_path):
+    rng = np.random.default_rng(5)
+    rng.random(3)
+    guardar_checkpoint(tmp_path / "n.npz", [[1.0, 2.0, 3.0, 4.0]], [0.5], 3, rng=rng)
+    esperado = rng.random(4)
+    otro = np.random.default_rng(0)
+    cargar_checkpoint(tmp_path / "n.npz", rng=otro)
+    np.testing.assert_array_equal(otro.random(4), esperado)
+
+    rnd = random.Random(3)
+    rnd.gauss(0, 1)   # deja un valor gaussiano pendiente, que también se guarda
+    guardar_checkpoint(tmp_path / "r.npz", [[1.0, 2.0, 3.0, 4.0]], [0.5], 3, rng=rnd)
+    esperado = rnd.gauss(0, 1)
+    otro = random.Random()
+    cargar_checkpoint(tmp_path / "r.npz", rng=otro)
+    assert otro.gauss(0, 1) == esperado
+
+    with pytest.raises(ValueError):
+        cargar_checkpoint(tmp_path / "n.npz", rng=random.Random())
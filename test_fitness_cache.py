@@ -0,0 +1,101 @@
+"""
+test_fitness_cache.py
+Política de FitnessCache: desalojo LRU, promedio de muestras (al evaluar y con
+add_sample) y el ida y vuelta getstate/setstate del que dependen los checkpoints.
+Ejecutar: python -m pytest test_fitness_cache.py
+"""
+import pytest
+from fitness_cache import FitnessCache
+
+
+class Contador:
+    """Evaluador que retorna valores prefijados en orden y cuenta las llamadas."""
+
+    def __init__(self, *valores):
+        self.valores = list(valores)
+        self.llamadas = 0
+
+    def __call__(self, cromosoma):
+        self.llamadas += 1
+        return self.valores.pop(0)
+
+    def lote(self, poblacion):
+        return [self(c) for c in poblacion]
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        FitnessCache(max_size=0)
+    with pytest.raises(ValueError):
+        FitnessCache(samples=0)
+
+
+def test_evaluate_promedia_muestras_y_no_resimula():
+    cache = FitnessCache(samples=3)
+    evaluar = Contador(0.2, 0.4, 0.9)
+    assert cache.evaluate([1.0, 2.0], evaluar) == pytest.approx(0.5)
+    assert cache.evaluate([1.0, 2.0], evaluar) == pytest.approx(0.5)
+    assert evaluar.llamadas == 3
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_la_clave_no_distingue_int_de_float():
+    cache = FitnessCache()
+    cache.store([1, 2], 0.7)
+    assert [1.0, 2.0] in cache
+    assert cache.lookup((1.0, 2.0)) == 0.7
+
+
+def test_desalojo_lru():
+    cache = FitnessCache(max_size=2)
+    cache.store([1], 0.1)
+    cache.store([2], 0.2)
+    cache.lookup([1])          # [1] pasa a ser el más reciente
+    cache.store([3], 0.3)      # desaloja [2], el menos usado
+    assert [1] in cache and [3] in cache
+    assert [2] not in cache
+    assert len(cache) == 2
+
+
+def test_add_sample_mantiene_el_promedio():
+    cache = FitnessCache(samples=4)
+    cache.store([1.0], 0.5)    # media de 4 muestras
+    assert cache.add_sample([1.0], 1.0) == pytest.approx((0.5 * 4 + 1.0) / 5)
+    assert cache.add_sample([2.0], 0.3) == 0.3    # cromosoma nuevo: una sola muestra
+    assert cache.add_sample([2.0], 0.7) == pytest.approx(0.5)
+    assert cache.lookup([2.0]) == pytest.approx(0.5)
+
+
+def test_evaluate_many_simula_solo_los_fallos_sin_duplicados():
+    cache = FitnessCache(samples=2)
+    cache.store([0.0], 0.9)
+    evaluar = Contador(0.1, 0.3, 0.5, 0.7)
+    fitness = cache.evaluate_many([[0.0], [1.0], [2.0], [1.0]], evaluar.lote)
+    assert fitness == pytest.approx([0.9, 0.2, 0.6, 0.2])
+    assert evaluar.llamadas == 4   # dos cromosomas nuevos x dos muestras
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_getstate_setstate_ida_y_vuelta():
+    cache = FitnessCache(max_size=3, samples=2)
+    for i in range(4):
+        cache.store([float(i), 1.0], i / 10)
+    cache.add_sample([2.0, 1.0], 0.8)
+    cache.lookup([1.0, 1.0])
+    cache.lookup([9.0, 9.0])
+
+    copia = FitnessCache(max_size=3, samples=2)
+    copia.setstate(cache.getstate())
+    assert copia.stats() == cache.stats()
+    assert list(copia._data.items()) == list(cache._data.items())
+    # El orden LRU también se conserva: el próximo desalojo es el mismo
+    cache.store([5.0, 5.0], 0.5)
+    copia.store([5.0, 5.0], 0.5)
+    assert list(copia._data) == list(cache._data)
+
+
+def test_setstate_de_una_cache_vacia():
+    copia = FitnessCache()
+    copia.store([1.0], 0.1)
+    copia.setstate(FitnessCache().getstate())
+    assert len(copia) == 0 and copia.stats()["hits"] == 0
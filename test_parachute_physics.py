@@ -0,0 +1,66 @@
+"""
+test_parachute_physics.py
+El muestreo cerrado (muestrear_poblacion y muestrear_poblacion_crn) debe tener la
+misma distribución de fitness que el bucle paso a paso (simular_poblacion).
+Ejecutar: python -m pytest test_parachute_physics.py
+"""
+import math
+import numpy as np
+import pytest
+from parachute_physics import (simular_poblacion, muestrear_poblacion, muestrear_poblacion_crn,
+                               pasos_hasta_suelo, pasos_hasta_suelo_poblacion, _estadistico_ks,
+                               START_Y, GROUND_Y, MAX_STEPS)
+
+MUESTRAS = 3000
+# Valor crítico KS de dos muestras para alfa = 0.001
+CRITICO = 1.95 * math.sqrt(2.0 / MUESTRAS)
+
+# Regímenes de genes: V en sus límites y fuera de ellos (a = V * 0.6 <= 0 nunca
+# aterriza), S en sus límites (ruido máximo y mínimo) y F en 0 y 1
+REGIMENES = {
+    "V mínima, S=0": [1.5, 0.0, 0.0, 0.0],
+    "V máxima, S=1": [6.0, -1.5, 1.0, 1.0],
+    "intermedio": [3.0, 1.0, 0.5, 0.5],
+    "S cerca de 1": [2.2, 0.3, 0.99, 0.1],
+    "a = 0": [0.0, 0.0, 0.5, 0.5],
+    "a < 0": [-1.0, 0.5, 0.2, 0.7],
+}
+
+
+def _pasos_bucle(V, max_steps=MAX_STEPS):
+    y, vy, pasos = float(START_Y), 0.0, 0
+    while y < GROUND_Y and pasos < max_steps:
+        vy += V * 0.6
+        y += vy
+        pasos += 1
+    return pasos
+
+
+@pytest.mark.parametrize("cromosoma", REGIMENES.values(), ids=REGIMENES.keys())
+def test_pasos_analiticos_coinciden_con_el_bucle(cromosoma):
+    esperado = _pasos_bucle(cromosoma[0])
+    assert pasos_hasta_suelo(cromosoma[0]) == esperado
+    assert pasos_hasta_suelo_poblacion(np.array([cromosoma[0]]))[0] == esperado
+
+
+@pytest.mark.parametrize("cromosoma", REGIMENES.values(), ids=REGIMENES.keys())
+def test_muestreo_cerrado_equivalente(cromosoma):
+    rng = np.random.default_rng(0)
+    genes = np.tile(cromosoma, (MUESTRAS, 1))
+    referencia = simular_poblacion(genes, rng=rng)
+    assert _estadistico_ks(referencia, muestrear_poblacion(genes, rng=rng)) < CRITICO
+
+
+@pytest.mark.parametrize("cromosoma", REGIMENES.values(), ids=REGIMENES.keys())
+def test_muestreo_crn_conserva_la_distribucion(cromosoma):
+    rng = np.random.default_rng(1)
+    referencia = simular_poblacion(np.tile(cromosoma, (MUESTRAS, 1)), rng=rng)
+    crn = muestrear_poblacion_crn([cromosoma], MUESTRAS, rng=rng)[:, 0]
+    assert _estadistico_ks(referencia, crn) < CRITICO
+
+
+def test_crn_comparte_el_ruido_entre_individuos():
+    # Mismo V y S: con números comunes el ángulo es idéntico, sólo difiere el aporte de F
+    genes = np.array([[3.0, 0.0, 0.5, 0.0], [3.0, 0.0, 0.5, 1.0]])
+    fitness = muestrear_poblacion_crn(genes, 200, rng=np.random.default_rng(2))
+    np.testing.assert_allclose(fitness[:, 1] - fitness[:, 0], 0.3)
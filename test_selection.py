@@ -0,0 +1,89 @@
+"""
+test_selection.py
+Estrategias de selección por lotes: índices válidos, padres esperados con un
+generador fijo y los errores de parámetros.
+Ejecutar: python -m pytest test_selection.py
+"""
+import numpy as np
+import pytest
+from selection import truncar, parejas_distintas, seleccionar_padres, ESTRATEGIAS
+
+FITNESS = np.array([0.3, 0.9, 0.1, 0.7, 0.5, 0.2, 0.8, 0.4])
+PAREJAS = 500
+
+
+@pytest.mark.parametrize("estrategia", ESTRATEGIAS)
+def test_parejas_validas(estrategia):
+    padres_a, padres_b = seleccionar_padres(FITNESS, PAREJAS, np.random.default_rng(0), estrategia,
+                                            tamano_torneo=3)
+    for padres in (padres_a, padres_b):
+        assert padres.shape == (PAREJAS,)
+        assert np.issubdtype(padres.dtype, np.integer)
+        assert padres.min() >= 0 and padres.max() < FITNESS.size
+
+
+def test_truncar_elige_los_mejores():
+    assert sorted(truncar(FITNESS, 3).tolist()) == [1, 3, 6]
+    assert sorted(truncar(FITNESS, 20).tolist()) == list(range(FITNESS.size))
+
+
+def test_parejas_distintas_nunca_repite_padre():
+    i, j = parejas_distintas(3, 2000, np.random.default_rng(1))
+    assert np.all(i != j)
+    assert set(i.tolist()) == set(j.tolist()) == {0, 1, 2}
+
+
+def test_truncamiento_solo_cruza_sobrevivientes():
+    padres_a, padres_b = seleccionar_padres(FITNESS, PAREJAS, np.random.default_rng(2), "truncamiento",
+                                            prob_seleccion=0.5)
+    assert set(padres_a.tolist()) | set(padres_b.tolist()) == {1, 3, 4, 6}
+    assert np.all(padres_a != padres_b)
+
+
+def test_torneo_gana_el_mejor_de_cada_grupo():
+    tamano = 3
+    padres_a, padres_b = seleccionar_padres(FITNESS, PAREJAS, np.random.default_rng(3), "torneo",
+                                            tamano_torneo=tamano)
+    # Mismo sorteo que _torneo: una fila por participante, una columna por padre
+    candidatos = np.random.default_rng(3).integers(FITNESS.size, size=(tamano, 2 * PAREJAS))
+    esperado = candidatos[np.argmax(FITNESS[candidatos], axis=0), np.arange(2 * PAREJAS)]
+    np.testing.assert_array_equal(np.concatenate([padres_a, padres_b]), esperado)
+
+
+def test_torneo_de_uno_es_uniforme():
+    padres_a, padres_b = seleccionar_padres(FITNESS, PAREJAS, np.random.default_rng(4), "torneo",
+                                            tamano_torneo=1)
+    esperado = np.random.default_rng(4).integers(FITNESS.size, size=(1, 2 * PAREJAS))[0]
+    np.testing.assert_array_equal(np.concatenate([padres_a, padres_b]), esperado)
+
+
+def test_sus_reparte_punteros_en_proporcion_exacta():
+    # Total 4 y 8 punteros: el individuo 2 recibe exactamente 2 y el 3 exactamente 6
+    fitness = np.array([0.0, 0.0, 1.0, 3.0])
+    padres_a, padres_b = seleccionar_padres(fitness, 4, np.random.default_rng(5), "sus")
+    conteo = np.bincount(np.concatenate([padres_a, padres_b]), minlength=fitness.size)
+    assert conteo.tolist() == [0, 0, 2, 6]
+
+
+def test_sus_sin_fitness_positivo_es_uniforme():
+    fitness = np.array([-1.0, 0.0, np.nan, -3.0])
+    padres_a, padres_b = seleccionar_padres(fitness, PAREJAS, np.random.default_rng(6), "sus")
+    assert set(padres_a.tolist()) | set(padres_b.tolist()) == {0, 1, 2, 3}
+
+
+def test_estrategia_desconocida():
+    with pytest.raises(ValueError, match="desconocida"):
+        seleccionar_padres(FITNESS, 1, np.random.default_rng(0), "ruleta")
+
+
+@pytest.mark.parametrize("tamano_torneo", [0, -2])
+def test_tamano_torneo_invalido(tamano_torneo):
+    with pytest.raises(ValueError, match="tamano_torneo"):
+        seleccionar_padres(FITNESS, 1, np.random.default_rng(0), "torneo", tamano_torneo=tamano_torneo)
+
+
+@pytest.mark.parametrize("estrategia", ESTRATEGIAS)
+@pytest.mark.parametrize("fitness", [[], [0.5]])
+def test_menos_de_dos_individuos(estrategia, fitness):
+    with pytest.raises(ValueError, match="al menos 2"):
+        seleccionar_padres(fitness, 1, np.random.default_rng(0), estrategia)
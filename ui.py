@@ -2,24 +2,62 @@
 ui.py
 Contiene clases UI simples: Button, Panel y lógica de render básico.
 Se implementa patrón de eventos para botones y panel lateral con V, B, S, F.
+
+El render es por capas: el fondo (cielo, suelo y botones) se pinta una vez en una
+superficie cacheada, el panel sólo se vuelve a dibujar cuando cambian sus valores y
+compose() publica con pygame.display.update únicamente los rectángulos que cambiaron.
 """
+from collections import OrderedDict
+from functools import lru_cache
 import pygame
+from profiling import instrumentar
+
+
+@lru_cache(maxsize=None)
+def get_font(name, size, bold=False):
+    """SysFont compartido: se busca una sola vez por proceso y sobrevive a los cambios de escena."""
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+class TextCache:
+    """Superficies de texto ya renderizadas, por (texto, color); LRU acotado."""
+
+    def __init__(self, font, max_items=512):
+        self.font = font
+        self.max_items = max_items
+        self._surfaces = OrderedDict()
+
+    def render(self, text, color):
+        key = (text, color)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            self._surfaces[key] = surface
+            if len(self._surfaces) > self.max_items:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(key)
+        return surface
 
 
 class Button:
     """Botón simple con callback (patrón de eventos)."""
 
-    def __init__(self, rect, text, font, callback=None):
+    def __init__(self, rect, text, font, callback=None, text_cache=None):
         self.rect = pygame.Rect(rect)
         self.text = text
         self.font = font
         self.callback = callback
         self.is_pressed = False
+        self.text_cache = text_cache
 
     def draw(self, screen):
         pygame.draw.rect(screen, (230, 230, 230), self.rect)
         pygame.draw.rect(screen, (80, 80, 80), self.rect, 2)
-        txt = self.font.render(self.text, True, (20, 20, 20))
+        if self.text_cache:
+            txt = self.text_cache.render(self.text, (20, 20, 20))
+        else:
+            txt = self.font.render(self.text, True, (20, 20, 20))
         txt_rect = txt.get_rect(center=self.rect.center)
         screen.blit(txt, txt_rect)
 
@@ -43,28 +81,44 @@ class UI:
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.ground_y = ground_y
-        self.font = pygame.font.SysFont("Arial", 16)
+        self.font = get_font("Arial", 16)
+        self.text_cache = TextCache(self.font)
         # Botones
         self.clicked_setup = False
         self.clicked_run = False
         self.clicked_back = False
+        self.clicked_speed = False
+        self.clicked_mode = False
         btn_w, btn_h = 100, 36
         self.btn_setup = Button((20, 20, btn_w, btn_h), "Setup", self.font,
-                                callback=self._on_setup)
+                                callback=self._on_setup, text_cache=self.text_cache)
         self.btn_run = Button((140, 20, btn_w, btn_h), "Ejecutar", self.font,
-                              callback=self._on_run)
+                              callback=self._on_run, text_cache=self.text_cache)
+        self.btn_speed = Button((260, 20, btn_w, btn_h), "Vel: 1x", self.font,
+                                callback=self._on_speed, text_cache=self.text_cache)
+        self.btn_mode = Button((380, 20, btn_w, btn_h), "Modo: Uno", self.font,
+                               callback=self._on_mode, text_cache=self.text_cache)
 
         # Botón de volver al menú (opcional)
         self.show_back_button = show_back_button
         if show_back_button:
-            self.btn_back = Button((self.width - 120, 20, btn_w, btn_h), "← Menú", self.font,
-                                   callback=self._on_back)
+            # A la izquierda del panel lateral, que se dibuja encima del fondo
+            self.btn_back = Button((self.width - 220 - btn_w - 20, 20, btn_w, btn_h), "← Menú", self.font,
+                                   callback=self._on_back, text_cache=self.text_cache)
             self.back_callback = back_callback
 
         # Panel data
         self.panel_rect = pygame.Rect(self.width - 220, 0, 220, self.height)
         self.population = []
         self.generation = 0
+        self.telemetry = None  # telemetry.Telemetry opcional: agrega media y diversidad al panel
+
+        # Capas cacheadas
+        self._background = None
+        self._background_key = None
+        self._panel = None
+        self._panel_key = None
+        self._full_redraw = True
 
     def _on_setup(self):
         self.clicked_setup = True
@@ -72,57 +126,140 @@ class UI:
     def _on_run(self):
         self.clicked_run = True
 
+    def _on_speed(self):
+        self.clicked_speed = True
+
+    def set_speed_label(self, label):
+        self.btn_speed.text = f"Vel: {label}"
+
+    def _on_mode(self):
+        self.clicked_mode = True
+
+    def set_mode_label(self, label):
+        self.btn_mode.text = f"Modo: {label}"
+
     def _on_back(self):
         self.clicked_back = True
         if self.back_callback:
             self.back_callback()
 
     def handle_event(self, event):
-        self.btn_setup.handle_event(event)
-        self.btn_run.handle_event(event)
-        if self.show_back_button:
-            self.btn_back.handle_event(event)
+        for button in self._buttons():
+            button.handle_event(event)
 
-    def render_background(self):
-        # cielo y suelo
-        self.screen.fill((200, 220, 255))
-        pygame.draw.rect(self.screen, (60, 170, 65),
-                         (0, self.ground_y, self.width, self.height - self.ground_y))
-        # dibujar botones
-        self.btn_setup.draw(self.screen)
-        self.btn_run.draw(self.screen)
+    def _buttons(self):
+        buttons = [self.btn_setup, self.btn_run, self.btn_speed, self.btn_mode]
         if self.show_back_button:
-            self.btn_back.draw(self.screen)
+            buttons.append(self.btn_back)
+        return buttons
 
-    def render_panel(self):
-        pygame.draw.rect(self.screen, (245, 245, 245), self.panel_rect)
-        pygame.draw.rect(self.screen, (100, 100, 100), self.panel_rect, 2)
-        x = self.panel_rect.x + 12
-        y = 18
-        title = self.font.render("Panel", True, (10, 10, 10))
-        self.screen.blit(title, (x, y))
-        y += 30
-        gen_txt = self.font.render(f"Generación: {self.generation}", True, (10, 10, 10))
-        self.screen.blit(gen_txt, (x, y))
-        y += 24
+    @property
+    def background(self):
+        """Capa estática (cielo, suelo y botones); se regenera sólo si cambia un botón."""
+        key = tuple(b.text for b in self._buttons())
+        if key != self._background_key:
+            self._background_key = key
+            if self._background is None:
+                self._background = pygame.Surface((self.width, self.height)).convert()
+            # cielo y suelo
+            self._background.fill((200, 220, 255))
+            pygame.draw.rect(self._background, (60, 170, 65),
+                             (0, self.ground_y, self.width, self.height - self.ground_y))
+            # dibujar botones
+            for button in self._buttons():
+                button.draw(self._background)
+            self._full_redraw = True
+        return self._background
+
+    def invalidate(self):
+        """Fuerza que el próximo compose() repinte y publique la pantalla completa."""
+        self._full_redraw = True
+
+    @instrumentar
+    def render_background(self):
+        self.screen.blit(self.background, (0, 0))
+        self._full_redraw = True
 
+    def _panel_stats(self):
         # Mostrar promedio o del mejor
         if self.population:
             best = max(self.population, key=lambda p: p.fitness)
-            stats = [
+            return [
                 f"V: {best.genes['V']:.2f}",
                 f"B: {best.genes['B']:.2f}",
                 f"S: {best.genes['S']:.2f}",
                 f"F: {best.genes['F']:.2f}",
                 f"Fitness: {best.fitness:.2f}"
-            ]
-        else:
-            stats = ["V: -", "B: -", "S: -", "F: -", "Fitness: -"]
+            ] + self._telemetry_stats()
+        return ["V: -", "B: -", "S: -", "F: -", "Fitness: -"]
+
+    def _telemetry_stats(self):
+        registro = self.telemetry.ultimo if self.telemetry is not None else None
+        if registro is None:
+            return []
+        return [
+            f"Media: {registro['media']:.2f} ± {registro['desviacion']:.2f}",
+            f"Diversidad: {registro['diversidad']:.3f}",
+        ]
+
+    @instrumentar
+    def _panel_surface(self):
+        """Superficie del panel; sólo se vuelve a dibujar si cambió algún texto. Retorna (superficie, cambió)."""
+        lines = [f"Generación: {self.generation}"] + self._panel_stats()
+        if lines == self._panel_key:
+            return self._panel, False
+        self._panel_key = lines
+        if self._panel is None:
+            self._panel = pygame.Surface(self.panel_rect.size).convert()
+        panel = self._panel
+        panel.fill((245, 245, 245))
+        pygame.draw.rect(panel, (100, 100, 100), panel.get_rect(), 2)
+        x = 12
+        y = 18
+        panel.blit(self.text_cache.render("Panel", (10, 10, 10)), (x, y))
+        y += 30
+        panel.blit(self.text_cache.render(lines[0], (10, 10, 10)), (x, y))
+        y += 24
 
-        for s in stats:
-            txt = self.font.render(s, True, (10, 10, 10))
-            self.screen.blit(txt, (x, y))
+        for s in lines[1:]:
+            panel.blit(self.text_cache.render(s, (10, 10, 10)), (x, y))
             y += 22
+        return panel, True
+
+    def render_panel(self):
+        panel, _ = self._panel_surface()
+        self.screen.blit(panel, self.panel_rect)
+
+    @instrumentar
+    def compose(self, *groups):
+        """
+        Dibuja un frame por capas y lo publica.
+        'groups' son pygame.sprite.RenderUpdates: se borran con el fondo cacheado,
+        se redibujan y sólo sus rectángulos (más el panel si cambió) van a
+        pygame.display.update. Si cambió el fondo se repinta y publica todo.
+        """
+        background = self.background
+        panel, panel_changed = self._panel_surface()
+        if self._full_redraw:
+            self.screen.blit(background, (0, 0))
+            for group in groups:
+                group.draw(self.screen)
+            self.screen.blit(panel, self.panel_rect)
+            pygame.display.flip()
+            self._full_redraw = False
+            return
+
+        for group in groups:
+            group.clear(self.screen, background)
+        dirty = []
+        for group in groups:
+            dirty.extend(group.draw(self.screen))
+        # El panel va encima de todo: se repone si cambió o si un sprite lo pisó
+        if panel_changed or self.panel_rect.collidelist(dirty) != -1:
+            self.screen.blit(panel, self.panel_rect)
+            dirty.append(self.panel_rect)
+        if dirty:
+            pygame.display.update(dirty)
 
     def set_population(self, population):
         """Recibe lista de ParIndividual para mostrar en panel y preview."""